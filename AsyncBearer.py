@@ -0,0 +1,57 @@
+from typing import TYPE_CHECKING
+
+from AsyncMMInterface import AsyncMMInterface, AsyncProperty
+from Bearer import Barer, BearerSnapshot
+
+if TYPE_CHECKING:
+    from AsyncModemManager import AsyncModemManager
+
+
+class AsyncBarer(AsyncMMInterface):
+    """
+    asyncio counterpart of Barer. Methods are coroutines and properties are awaitable.
+    """
+    INTERFACE = Barer.INTERFACE
+    __slots__ = ()
+
+    def __init__(self, manager: 'AsyncModemManager', path: str):
+        super().__init__(manager, path)
+
+    async def snapshot(self, timeout: float = None) -> BearerSnapshot:
+        """
+        See Barer.snapshot.
+        """
+        return BearerSnapshot(self._path, await self._get_all(timeout))
+
+    async def Connect(self, timeout: float = None):
+        """
+        Requests activation of a packet data connection with the network using this bearer's properties.
+
+        Since: 1.0
+        """
+        await self.call('Connect', timeout=timeout)
+
+    async def Disconnect(self, timeout: float = None):
+        """
+        Disconnect and deactivate this packet data connection.
+
+        Since: 1.0
+        """
+        await self.call('Disconnect', timeout=timeout)
+
+    """
+    Properties
+    """
+
+    Interface = AsyncProperty()
+    Connected = AsyncProperty()
+    ConnectionError = AsyncProperty()
+    Suspended = AsyncProperty()
+    Multiplexed = AsyncProperty()
+    Ip4Config = AsyncProperty()
+    Ip6Config = AsyncProperty()
+    Stats = AsyncProperty()
+    IpTimeout = AsyncProperty()
+    BearerType = AsyncProperty()
+    ProfileId = AsyncProperty()
+    Properties = AsyncProperty()
@@ -0,0 +1,75 @@
+from typing import TYPE_CHECKING
+
+from AsyncMMInterface import AsyncMMInterface, AsyncProperty
+from Call import Call, CallSnapshot
+from MMEnums import MMCallState, MMCallStateReason, MMCallDirection
+
+if TYPE_CHECKING:
+    from AsyncModemManager import AsyncModemManager
+
+
+class AsyncCall(AsyncMMInterface):
+    """
+    asyncio counterpart of Call. Methods are coroutines and properties are awaitable.
+    """
+    INTERFACE = Call.INTERFACE
+    __slots__ = ()
+
+    def __init__(self, manager: 'AsyncModemManager', path: str):
+        super().__init__(manager, path)
+
+    async def snapshot(self, timeout: float = None) -> CallSnapshot:
+        """
+        See Call.snapshot.
+        """
+        return CallSnapshot(self._path, await self._get_all(timeout))
+
+    async def Start(self, timeout: float = None):
+        """
+        See Call.Start.
+        """
+        await self.call('Start', timeout=timeout)
+
+    async def Accept(self, timeout: float = None):
+        """
+        See Call.Accept.
+        """
+        await self.call('Accept', timeout=timeout)
+
+    async def Deflect(self, number: str, timeout: float = None):
+        """
+        See Call.Deflect.
+        """
+        await self.call('Deflect', number, timeout=timeout)
+
+    async def JoinMultiparty(self, timeout: float = None):
+        """
+        See Call.JoinMultiparty.
+        """
+        await self.call('JoinMultiparty', timeout=timeout)
+
+    async def LeaveMultiparty(self, timeout: float = None):
+        """
+        See Call.LeaveMultiparty.
+        """
+        await self.call('LeaveMultiparty', timeout=timeout)
+
+    async def Hangup(self, timeout: float = None):
+        """
+        See Call.Hangup.
+        """
+        await self.call('Hangup', timeout=timeout)
+
+    async def SendDtmf(self, dtmf: str, timeout: float = None):
+        """
+        See Call.SendDtmf.
+        """
+        await self.call('SendDtmf', dtmf, timeout=timeout)
+
+    State = AsyncProperty(MMCallState)
+    StateReason = AsyncProperty(MMCallStateReason)
+    Direction = AsyncProperty(MMCallDirection)
+    Number = AsyncProperty()
+    Multiparty = AsyncProperty()
+    AudioPort = AsyncProperty()
+    AudioFormat = AsyncProperty()
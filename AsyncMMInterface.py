@@ -0,0 +1,217 @@
+import asyncio
+from functools import lru_cache
+from typing import Dict, List, Optional, Callable
+
+from dbus_next import Message, MessageType
+from dbus_next.errors import DBusError
+from dbus_next.signature import SignatureTree, SignatureType
+
+from MMErrors import MMTimeoutError, MMWaitTimeoutError
+from MMInterface import observed, target_values
+
+
+@lru_cache(maxsize=None)
+def converter(signature: str) -> Optional[Callable]:
+    """
+    Converter turning a dbus-next value of one complete type into the plain Python value pydbus would return
+    for the same signature: variants are unwrapped, structs become tuples and byte arrays become bytes.
+
+    Converters are compiled once per signature and convert a value in one pass.
+    :return: The converter, or None if values of the signature are already plain.
+    """
+    token = signature[0]
+    if token == 'v':
+        def convert(variant):
+            inner = converter(variant.signature)
+            return variant.value if inner is None else inner(variant.value)
+        return convert
+    if token == '(':
+        members = tuple(converter(type_.signature) for type_ in SignatureTree(signature[1:-1]).types)
+        return lambda value: tuple(v if member is None else member(v) for member, v in zip(members, value))
+    if token != 'a':
+        return None
+    element = signature[1:]
+    if element == 'y':
+        return bytes
+    if element[0] == '{':
+        key_type, value_type = (converter(type_.signature) for type_ in SignatureTree(element[1:-1]).types)
+        if value_type is None:
+            return None if key_type is None else lambda value: {key_type(k): v for k, v in value.items()}
+        if key_type is None:
+            return lambda value: {k: value_type(v) for k, v in value.items()}
+        return lambda value: {key_type(k): value_type(v) for k, v in value.items()}
+    element_type = converter(element)
+    if element_type is None:
+        return None
+    return lambda value: [element_type(v) for v in value]
+
+
+def unpack(value, type_: SignatureType):
+    """
+    Turn a dbus-next value into the plain Python value pydbus would return for the same signature.
+    """
+    convert = converter(type_.signature)
+    return value if convert is None else convert(value)
+
+
+@lru_cache(maxsize=None)
+def _body_converters(signature: str):
+    return tuple(converter(type_.signature) for type_ in SignatureTree(signature).types)
+
+
+def unpack_body(body: list, signature: str):
+    return [value if convert is None else convert(value) for value, convert in zip(body, _body_converters(signature))]
+
+
+class AsyncProperty(object):
+    """
+    Property that reads its value with an asynchronous Properties.Get: `state = await modem.State`.
+    """
+
+    def __init__(self, decoder: Callable = None):
+        self.name = None
+        self.decoder = decoder
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return obj._get_property(self.name, self.decoder)
+
+
+class AsyncMMInterface(object):
+    """
+    Base of the asyncio wrappers. Method calls and property reads are sent as plain D-Bus messages on a
+    dbus-next MessageBus, which runs on the asyncio event loop and needs no GLib main loop.
+
+    Input signatures come from the interface descriptions bundled for the daemon's version,
+    or from introspecting the object once per interface if the version is not bundled.
+    Arguments of signature "v" (e.g. values of a{sv} dictionaries) must be given as dbus_next.Variant.
+    Methods take a timeout= in seconds and raise MMTimeoutError when it expires; cancel a call by cancelling its task.
+    """
+    BUS_NAME = 'org.freedesktop.ModemManager1'
+    INTERFACE = 'org.freedesktop.ModemManager1'
+    PROPERTIES_INTERFACE = 'org.freedesktop.DBus.Properties'
+
+    __slots__ = ('_manager', '_path', '__weakref__')
+
+    def __init__(self, manager, path: str):
+        self._manager = manager
+        self._path = path
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    async def call(self, method: str, *args, interface: str = None, timeout: float = None):
+        """
+        Call a D-Bus method on this object.
+
+        :param method: Method name, e.g. "Enable".
+        :param args: Method arguments.
+        :param interface: Interface of the method, defaults to the wrapper's interface.
+        :param timeout: Seconds to wait for the reply, or None to wait as long as the bus allows.
+        :return: None, the single output argument, or a tuple of output arguments.
+        :raises MMTimeoutError: No reply arrived within the timeout.
+        """
+        return await self._call(method, args, interface, timeout)
+
+    async def _call(self, method: str, args: tuple, interface: str = None, timeout: float = None,
+                    metric: str = None):
+        interface = interface or self.INTERFACE
+        if metric is None:
+            metric = (f'{type(self).__name__}.{method}' if interface == self.INTERFACE
+                      else f'{interface.rsplit(".", 1)[-1]}.{method}')
+        with observed(self._manager, metric, self._path, args):
+            signature = await self._manager._method_signature(self._path, interface, method)
+            request = self._manager._bus.call(Message(destination=self.BUS_NAME, path=self._path,
+                                                      interface=interface, member=method, signature=signature,
+                                                      body=list(args)))
+            try:
+                reply = await asyncio.wait_for(request, timeout)
+            except asyncio.TimeoutError:
+                raise MMTimeoutError(self._path, interface, method, timeout) from None
+            if reply.message_type == MessageType.ERROR:
+                raise DBusError._from_message(reply)
+            body = unpack_body(reply.body, reply.signature)
+            if not body:
+                return None
+            if len(body) == 1:
+                return body[0]
+            return tuple(body)
+
+    async def get_all(self, interface: str = None, timeout: float = None) -> Dict[str, object]:
+        """
+        Read every property of an interface with a single Properties.GetAll call.
+
+        :param interface: Interface name, defaults to the wrapper's interface.
+        :param timeout: Seconds to wait for the reply.
+        """
+        return await self.call('GetAll', interface or self.INTERFACE, interface=self.PROPERTIES_INTERFACE,
+                               timeout=timeout)
+
+    async def _get_all(self, timeout: float = None) -> Dict[str, object]:
+        # recorded as "AsyncModem.snapshot" rather than "Properties.GetAll", to tell the wrapper types apart
+        return await self._call('GetAll', (self.INTERFACE,), self.PROPERTIES_INTERFACE, timeout,
+                                metric=f'{type(self).__name__}.snapshot')
+
+    async def _get_property(self, name: str, decoder: Optional[Callable] = None):
+        # concurrent reads of the same property share one Get call
+        value = await self._manager._reads.do((self._path, self.INTERFACE, name),
+                                              lambda: self._call('Get', (self.INTERFACE, name),
+                                                                 self.PROPERTIES_INTERFACE,
+                                                                 metric=f'{type(self).__name__}.{name}'))
+        if decoder is not None:
+            return decoder(value)
+        return value
+
+    async def connect_signal(self, member: str, callback: Callable, interface: str = None):
+        """
+        Connect a handler to a signal of this object through the manager's namespace-wide subscription,
+        added with a single match rule on first use; see MMInterface.connect_signal.
+
+        :return: Handle with a disconnect() method.
+        """
+        await self._manager._subscribe_signals()
+        return self._manager.signals.connect(self._path, interface or self.INTERFACE, member, callback)
+
+    async def _wait_for(self, name: str, targets, timeout: float = None, signal: str = None):
+        """
+        Wait until a property of this interface takes one of the target values, see MMInterface._wait_for.
+        """
+        wanted = target_values(targets)
+        future = asyncio.get_running_loop().create_future()
+        changes = []
+
+        if signal is not None:
+            def on_signal(*args):
+                changes.append(args[1])
+                if args[1] in wanted and not future.done():
+                    future.set_result(args[1])
+
+            handle = await self.connect_signal(signal, on_signal)
+        else:
+            def on_signal(interface: str, changed: Dict[str, object], invalidated: List[str]):
+                if interface != self.INTERFACE or name not in changed:
+                    return
+                changes.append(changed[name])
+                if changed[name] in wanted and not future.done():
+                    future.set_result(changed[name])
+
+            handle = await self.connect_signal('PropertiesChanged', on_signal, self.PROPERTIES_INTERFACE)
+        try:
+            # its own Get call, not one of _get_property() sent before the handler was connected
+            value = await self._call('Get', (self.INTERFACE, name), self.PROPERTIES_INTERFACE,
+                                     metric=f'{type(self).__name__}.{name}')
+            if value in wanted:
+                return value
+            read = len(changes)
+            try:
+                return await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError:
+                last = changes[-1] if len(changes) > read else value
+                raise MMWaitTimeoutError(self._path, self.INTERFACE, name, last, timeout) from None
+        finally:
+            handle.disconnect()
@@ -0,0 +1,163 @@
+from typing import Dict, Tuple, List, TYPE_CHECKING, Iterable, Union
+
+from AsyncMMInterface import AsyncMMInterface, AsyncProperty
+from Modem import Modem, ModemSnapshot
+from MMEnums import MMModemPowerState, MMModemCapability, MMModemBand, MMModemLock, MMModemState
+
+if TYPE_CHECKING:
+    from AsyncModemManager import AsyncModemManager
+
+
+class AsyncModem(AsyncMMInterface):
+    """
+    asyncio counterpart of Modem. Methods are coroutines and properties are awaitable: `await modem.State`.
+    """
+    INTERFACE = Modem.INTERFACE
+    __slots__ = ()
+
+    def __init__(self, manager: 'AsyncModemManager', path: str):
+        super().__init__(manager, path)
+
+    async def snapshot(self, timeout: float = None) -> ModemSnapshot:
+        """
+        See Modem.snapshot.
+        """
+        return ModemSnapshot(self._path, await self._get_all(timeout))
+
+    async def wait_for_state(self, target: Union[MMModemState, Iterable[MMModemState]],
+                             timeout: float = None) -> MMModemState:
+        """
+        See Modem.wait_for_state; cancel the wait by cancelling its task.
+        """
+        return ModemSnapshot.DECODERS['State'](await self._wait_for('State', target, timeout, signal='StateChanged'))
+
+    async def wait_for_power_state(self, target: Union[MMModemPowerState, Iterable[MMModemPowerState]],
+                                   timeout: float = None) -> MMModemPowerState:
+        """
+        See Modem.wait_for_power_state.
+        """
+        return ModemSnapshot.DECODERS['PowerState'](await self._wait_for('PowerState', target, timeout))
+
+    async def wait_for_unlock_required(
+            self, target: Union[MMModemLock, Iterable[MMModemLock]] = MMModemLock.MM_MODEM_LOCK_NONE,
+            timeout: float = None) -> MMModemLock:
+        """
+        See Modem.wait_for_unlock_required.
+        """
+        return ModemSnapshot.DECODERS['UnlockRequired'](await self._wait_for('UnlockRequired', target, timeout))
+
+    """
+    Methods
+    """
+
+    async def Enable(self, enable: bool, timeout: float = None):
+        """
+        See Modem.Enable.
+        """
+        await self.call('Enable', enable, timeout=timeout)
+
+    async def ListBearers(self, timeout: float = None) -> List[str]:
+        """
+        See Modem.ListBearers.
+        """
+        return await self.call('ListBearers', timeout=timeout)
+
+    async def CreateBearer(self, properties: Dict[str, object], timeout: float = None) -> str:
+        """
+        See Modem.CreateBearer. Values must be given as dbus_next.Variant.
+        """
+        return await self.call('CreateBearer', properties, timeout=timeout)
+
+    async def DeleteBearer(self, bearer: str, timeout: float = None):
+        """
+        See Modem.DeleteBearer.
+        """
+        await self.call('DeleteBearer', bearer, timeout=timeout)
+
+    async def Reset(self, timeout: float = None):
+        """
+        See Modem.Reset.
+        """
+        await self.call('Reset', timeout=timeout)
+
+    async def FactoryReset(self, code: str, timeout: float = None):
+        """
+        See Modem.FactoryReset.
+        """
+        await self.call('FactoryReset', code, timeout=timeout)
+
+    async def SetPowerState(self, state: MMModemPowerState, timeout: float = None):
+        """
+        See Modem.SetPowerState.
+        """
+        await self.call('SetPowerState', state.value, timeout=timeout)
+
+    async def SetCurrentCapabilities(self, capabilities: MMModemCapability, timeout: float = None):
+        """
+        See Modem.SetCurrentCapabilities.
+        """
+        await self.call('SetCurrentCapabilities', capabilities.value, timeout=timeout)
+
+    async def SetCurrentModes(self, modes: Tuple[int, int], timeout: float = None):
+        """
+        See Modem.SetCurrentModes.
+        """
+        await self.call('SetCurrentModes', list(modes), timeout=timeout)
+
+    async def SetCurrentBands(self, bands: List[MMModemBand], timeout: float = None):
+        """
+        See Modem.SetCurrentBands.
+        """
+        await self.call('SetCurrentBands', [v.value for v in bands], timeout=timeout)
+
+    async def SetPrimarySimSlot(self, sim_slot: int, timeout: float = None):
+        """
+        See Modem.SetPrimarySimSlot.
+        """
+        await self.call('SetPrimarySimSlot', sim_slot, timeout=timeout)
+
+    async def Command(self, cmd: str, timeout: int) -> str:
+        """
+        See Modem.Command.
+        """
+        return await self.call('Command', cmd, timeout, timeout=timeout + Modem.COMMAND_TIMEOUT_MARGIN)
+
+    """
+    Properties
+    """
+
+    Sim = AsyncProperty()
+    SimSlots = AsyncProperty()
+    PrimarySimSlot = AsyncProperty()
+    Bearers = AsyncProperty()
+    SupportedCapabilities = AsyncProperty()
+    CurrentCapabilities = AsyncProperty()
+    MaxBearers = AsyncProperty()
+    MaxActiveBearers = AsyncProperty()
+    MaxActiveMultiplexedBearers = AsyncProperty()
+    Manufacturer = AsyncProperty()
+    Model = AsyncProperty()
+    Revision = AsyncProperty()
+    CarrierConfiguration = AsyncProperty()
+    CarrierConfigurationRevision = AsyncProperty()
+    HardwareRevision = AsyncProperty()
+    DeviceIdentifier = AsyncProperty()
+    Device = AsyncProperty()
+    Drivers = AsyncProperty()
+    Plugin = AsyncProperty()
+    PrimaryPort = AsyncProperty()
+    Ports = AsyncProperty()
+    EquipmentIdentifier = AsyncProperty()
+    UnlockRequired = AsyncProperty()
+    UnlockRetries = AsyncProperty()
+    State = AsyncProperty()
+    StateFailedReason = AsyncProperty()
+    AccessTechnologies = AsyncProperty()
+    SignalQuality = AsyncProperty()
+    OwnNumbers = AsyncProperty()
+    PowerState = AsyncProperty()
+    SupportedModes = AsyncProperty()
+    CurrentModes = AsyncProperty()
+    SupportedBands = AsyncProperty()
+    CurrentBands = AsyncProperty()
+    SupportedIpFamilies = AsyncProperty()
@@ -0,0 +1,123 @@
+import asyncio
+from typing import List, Tuple, Dict, Optional
+
+from dbus_next import BusType, Message, MessageType
+from dbus_next.aio import MessageBus
+from dbus_next.errors import DBusError
+
+import MMIntrospection
+from AsyncMMInterface import AsyncMMInterface, AsyncProperty, unpack_body
+from AsyncModem import AsyncModem
+from MMMetrics import MetricsRegistry
+from MMTracing import Tracer
+from SignalRouter import SignalRouter
+from SingleFlight import AsyncSingleFlight
+
+
+class AsyncModemManager(AsyncMMInterface):
+    """
+    asyncio counterpart of ModemManager, running on a dbus-next MessageBus.
+
+    Use `manager = await AsyncModemManager.connect()` to create one.
+    """
+    PATH = '/org/freedesktop/ModemManager1'
+    OBJECT_MANAGER_INTERFACE = 'org.freedesktop.DBus.ObjectManager'
+
+    def __init__(self, bus: MessageBus):
+        super().__init__(self, self.PATH)
+        self._bus = bus
+        self._introspection = None
+        self._signatures: Dict[Tuple[str, str], str] = {}
+        self._reads = AsyncSingleFlight()
+        self.metrics = MetricsRegistry()
+        self.tracer: Optional[Tracer] = None
+        self.signals = SignalRouter()
+        self._subscription: Optional[asyncio.Future] = None
+
+    @classmethod
+    async def connect(cls, bus: MessageBus = None) -> 'AsyncModemManager':
+        """
+        Connect to ModemManager.
+
+        :param bus: Connected MessageBus to use instead of the system bus.
+        """
+        if bus is None:
+            bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+        manager = cls(bus)
+        manager._introspection = MMIntrospection.select_version(await manager.Version)
+        return manager
+
+    async def _method_signature(self, path: str, interface: str, method: str) -> str:
+        signature = MMIntrospection.method_signature(self._introspection, interface, method)
+        if signature is not None:
+            return signature
+        if (interface, method) not in self._signatures:
+            node = await self._bus.introspect(self.BUS_NAME, path)
+            for node_interface in node.interfaces:
+                for node_method in node_interface.methods:
+                    self._signatures[(node_interface.name, node_method.name)] = node_method.in_signature
+        return self._signatures[(interface, method)]
+
+    async def _subscribe_signals(self):
+        # One match rule covering every object of the daemon, routed in-process by path, added on first use.
+        if self._subscription is None:
+            self._subscription = asyncio.ensure_future(self._add_subscription())
+        await asyncio.shield(self._subscription)
+
+    async def _add_subscription(self):
+        rule = f"type='signal',sender='{self.BUS_NAME}',path_namespace='{self.PATH}'"
+        reply = await self._bus.call(Message(destination='org.freedesktop.DBus', path='/org/freedesktop/DBus',
+                                             interface='org.freedesktop.DBus', member='AddMatch', signature='s',
+                                             body=[rule]))
+        if reply.message_type == MessageType.ERROR:
+            self._subscription = None
+            raise DBusError._from_message(reply)
+        self._bus.add_message_handler(self._on_message)
+
+    def _on_message(self, message: Message):
+        path = message.path
+        if message.message_type == MessageType.SIGNAL and (path == self.PATH or path.startswith(self.PATH + '/')):
+            self.signals.dispatch(path, message.interface, message.member,
+                                  tuple(unpack_body(message.body, message.signature)))
+        return None
+
+    @property
+    async def modems(self) -> List[AsyncModem]:
+        return [AsyncModem(self, path) for path in await self.GetManagedObjects()]
+
+    """
+    Methods
+    """
+
+    async def ScanDevices(self, timeout: float = None):
+        """
+        See ModemManager.ScanDevices.
+        """
+        await self.call('ScanDevices', timeout=timeout)
+
+    async def SetLogging(self, level: str, timeout: float = None):
+        """
+        See ModemManager.SetLogging.
+        """
+        await self.call('SetLogging', level, timeout=timeout)
+
+    async def ReportKernelEvent(self, properties: Dict[str, object], timeout: float = None):
+        """
+        See ModemManager.ReportKernelEvent. Values must be given as dbus_next.Variant.
+        """
+        await self.call('ReportKernelEvent', properties, timeout=timeout)
+
+    async def InhibitDevice(self, uid: str, inhibit: bool, timeout: float = None):
+        """
+        See ModemManager.InhibitDevice.
+        """
+        await self.call('InhibitDevice', uid, inhibit, timeout=timeout)
+
+    async def GetManagedObjects(self, timeout: float = None) -> Dict:
+        return await self.call('GetManagedObjects', interface=self.OBJECT_MANAGER_INTERFACE, timeout=timeout)
+
+    """
+    Properties
+    """
+
+    Version = AsyncProperty()
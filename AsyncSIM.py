@@ -0,0 +1,63 @@
+from typing import List, Tuple, TYPE_CHECKING
+
+from AsyncMMInterface import AsyncMMInterface, AsyncProperty
+from SIM import SIM, SIMSnapshot
+
+if TYPE_CHECKING:
+    from AsyncModemManager import AsyncModemManager
+
+
+class AsyncSIM(AsyncMMInterface):
+    """
+    asyncio counterpart of SIM. Methods are coroutines and properties are awaitable.
+    """
+    INTERFACE = SIM.INTERFACE
+    __slots__ = ()
+
+    def __init__(self, manager: 'AsyncModemManager', path: str):
+        super().__init__(manager, path)
+
+    async def snapshot(self, timeout: float = None) -> SIMSnapshot:
+        """
+        See SIM.snapshot.
+        """
+        return SIMSnapshot(self._path, await self._get_all(timeout))
+
+    async def SendPin(self, pin: str, timeout: float = None):
+        """
+        See SIM.SendPin.
+        """
+        await self.call('SendPin', pin, timeout=timeout)
+
+    async def SendPuk(self, puk: str, pin: str, timeout: float = None):
+        """
+        See SIM.SendPuk.
+        """
+        await self.call('SendPuk', puk, pin, timeout=timeout)
+
+    async def EnablePin(self, pin: str, enable: bool, timeout: float = None):
+        """
+        See SIM.EnablePin.
+        """
+        await self.call('EnablePin', pin, enable, timeout=timeout)
+
+    async def ChangePin(self, old_pin: str, new_pin: str, timeout: float = None):
+        """
+        See SIM.ChangePin.
+        """
+        await self.call('ChangePin', old_pin, new_pin, timeout=timeout)
+
+    async def SetPreferredNetworks(self, preferred_networks: List[Tuple[str, int]], timeout: float = None):
+        """
+        See SIM.SetPreferredNetworks.
+        """
+        await self.call('SetPreferredNetworks', [list(v) for v in preferred_networks], timeout=timeout)
+
+    Active = AsyncProperty()
+    SimIdentifier = AsyncProperty()
+    Imsi = AsyncProperty()
+    Eid = AsyncProperty()
+    OperatorIdentifier = AsyncProperty()
+    OperatorName = AsyncProperty()
+    EmergencyNumbers = AsyncProperty()
+    PreferredNetworks = AsyncProperty()
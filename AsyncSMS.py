@@ -0,0 +1,55 @@
+from typing import TYPE_CHECKING
+
+from AsyncMMInterface import AsyncMMInterface, AsyncProperty
+from SMS import SMS, SMSSnapshot
+from MMEnums import MMSmsState, MMSmsPduType, MMSmsCdmaTeleserviceId, MMSmsCdmaServiceCategory, MMSmsDeliveryState, \
+    MMSmsStorage, MMSmsValidityType
+
+if TYPE_CHECKING:
+    from AsyncModemManager import AsyncModemManager
+
+
+class AsyncSMS(AsyncMMInterface):
+    """
+    asyncio counterpart of SMS. Methods are coroutines and properties are awaitable.
+    """
+    INTERFACE = SMS.INTERFACE
+    __slots__ = ()
+
+    def __init__(self, manager: 'AsyncModemManager', path: str):
+        super().__init__(manager, path)
+
+    async def snapshot(self, timeout: float = None) -> SMSSnapshot:
+        """
+        See SMS.snapshot.
+        """
+        return SMSSnapshot(self._path, await self._get_all(timeout))
+
+    async def Send(self, timeout: float = None):
+        """
+        See SMS.Send.
+        """
+        await self.call('Send', timeout=timeout)
+
+    async def Store(self, storage: MMSmsStorage, timeout: float = None):
+        """
+        See SMS.Store.
+        """
+        await self.call('Store', storage.value, timeout=timeout)
+
+    State = AsyncProperty(MMSmsState)
+    PduType = AsyncProperty(MMSmsPduType)
+    Number = AsyncProperty()
+    Text = AsyncProperty()
+    Data = AsyncProperty(bytes)
+    SMSC = AsyncProperty()
+    Validity = AsyncProperty(lambda v: (MMSmsValidityType(v[0]), int(v[1])))
+    Class = AsyncProperty()
+    TeleserviceId = AsyncProperty(MMSmsCdmaTeleserviceId)
+    ServiceCategory = AsyncProperty(MMSmsCdmaServiceCategory)
+    DeliveryReportRequest = AsyncProperty()
+    MessageReference = AsyncProperty()
+    Timestamp = AsyncProperty()
+    DischargeTimestamp = AsyncProperty()
+    DeliveryState = AsyncProperty(MMSmsDeliveryState)
+    Storage = AsyncProperty(MMSmsStorage)
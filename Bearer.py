@@ -1,17 +1,83 @@
-from typing import Dict, Tuple
+from typing import Dict, Tuple, TYPE_CHECKING
 
+from MMErrors import CancelToken
 from MMInterface import MMInterface
-from ModemManager import ModemManager
+from MMEnums import MMBearerType
+from MMSnapshot import MMSnapshot, enum_of, tuple_of
+
+
+if TYPE_CHECKING:
+    from ModemManager import ModemManager
+
+
+class BearerSnapshot(MMSnapshot):
+    """
+    All properties of a Barer object, read at once and decoded to MMEnums types.
+    """
+    __slots__ = (
+        'Interface',
+        'Connected',
+        'ConnectionError',
+        'Suspended',
+        'Multiplexed',
+        'Ip4Config',
+        'Ip6Config',
+        'Stats',
+        'IpTimeout',
+        'BearerType',
+        'ProfileId',
+        'Properties',
+    )
+    DECODERS = {
+        'ConnectionError': tuple_of(str, str),
+        'BearerType': enum_of(MMBearerType),
+    }
 
 
 class Barer(MMInterface):
     """
     This interface provides access to specific actions that may be performed on available bearers.
     """
+    INTERFACE = 'org.freedesktop.ModemManager1.Bearer'
+    __slots__ = ()
+
+    def __init__(self, manager: 'ModemManager', instance, properties: Dict[str, Dict[str, object]] = None):
+        super().__init__(manager, instance, properties)
+
+    def snapshot(self, timeout: float = None, cancel: CancelToken = None) -> BearerSnapshot:
+        """
+        Read every property of this bearer with a single Properties.GetAll call.
+
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
+        :return: Immutable BearerSnapshot, with values decoded to MMEnums types.
+        """
+        return BearerSnapshot(self.path, self._get_all(timeout, cancel))
 
-    def __init__(self, manager: ModemManager, instance):
-        super().__init__(manager)
-        self._instance = instance
+    """
+    Methods
+    """
+
+    def Connect(self, timeout: float = None, cancel: CancelToken = None):
+        """
+        Requests activation of a packet data connection with the network using this bearer's properties.
+        Upon successful activation, the modem can send and receive packet data and, depending on the addressing capability of the modem, a connection manager may need to start PPP, perform DHCP, or assign the IP address returned by the modem to the data interface.
+        Upon successful return, the "Ip4Config" and/or "Ip6Config" properties become valid and may contain IP configuration information for the data interface associated with this bearer.
+        Since: 1.0
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
+        """
+        self._call('Connect', timeout=timeout, cancel=cancel)
+
+    def Disconnect(self, timeout: float = None, cancel: CancelToken = None):
+        """
+        Disconnect and deactivate this packet data connection.
+        Any ongoing data session will be terminated and IP addresses become invalid when this method returns.
+        Since: 1.0
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
+        """
+        self._call('Disconnect', timeout=timeout, cancel=cancel)
 
     """
     Properties
@@ -25,7 +91,7 @@ class Barer(MMInterface):
         If MM_BEARER_IP_METHOD_STATIC or MM_BEARER_IP_METHOD_DHCP methods are given, the interface will be an ethernet-style interface suitable for DHCP or setting static IP configuration on, while if the MM_BEARER_IP_METHOD_PPP method is given, the interface will be a serial TTY which must then have PPP run over it.
         Since: 1.0
         """
-        return self._instance.Interface
+        return self._get_property('Interface')
 
     @property
     def Connected(self) -> bool:
@@ -33,7 +99,7 @@ class Barer(MMInterface):
         Indicates whether or not the bearer is connected and thus whether packet data communication using this bearer is possible.
         Since: 1.0
         """
-        return self._instance.Connected
+        return self._get_property('Connected')
 
     @property
     def ConnectionError(self) -> Tuple[str, str]:
@@ -42,7 +108,7 @@ class Barer(MMInterface):
         The value is composed of two strings: the registered DBus error name, and an optional error message.
         Since: 1.18
         """
-        return self._instance.ConnectionError
+        return self._get_property('ConnectionError')
 
     @property
     def Suspended(self) -> bool:
@@ -50,7 +116,7 @@ class Barer(MMInterface):
         In some devices, packet data service will be suspended while the device is handling other communication, like a voice call. If packet data service is suspended (but not deactivated) this property will be TRUE.
         Since: 1.0
         """
-        return self._instance.Suspended
+        return self._get_property('Suspended')
 
     @property
     def Multiplexed(self) -> bool:
@@ -58,7 +124,7 @@ class Barer(MMInterface):
         This property will be TRUE if the bearer is connected through a multiplexed network link.
         Since: 1.18
         """
-        return self._instance.Multiplexed
+        return self._get_property('Multiplexed')
 
     @property
     def Ip4Config(self) -> Dict[str, object]:
@@ -81,7 +147,7 @@ class Barer(MMInterface):
 
         Since: 1.0
         """
-        return dict(self._instance.Ip4Config)
+        return self._get_plain_property('Ip4Config')
 
     @property
     def Ip6Config(self) -> Dict[str, object]:
@@ -104,7 +170,7 @@ class Barer(MMInterface):
 
         Since: 1.0
         """
-        return dict(self._instance.Ip6Config)
+        return self._get_plain_property('Ip6Config')
 
     @property
     def Stats(self) -> Dict[str, object]:
@@ -124,7 +190,7 @@ class Barer(MMInterface):
 
         Since: 1.6
         """
-        return dict(self._instance.Stats)
+        return self._get_plain_property('Stats')
 
     @property
     def IpTimeout(self) -> int:
@@ -132,7 +198,7 @@ class Barer(MMInterface):
         Maximum time to wait for a successful IP establishment, when PPP is used.
         Since: 1.0
         """
-        return self._instance.IpTimeout
+        return self._get_property('IpTimeout')
 
     @property
     def BearerType(self) -> int:
@@ -140,7 +206,7 @@ class Barer(MMInterface):
         A MMBearerType
         Since: 1.10
         """
-        return self._instance.BearerType
+        return self._get_property('BearerType')
 
     @property
     def ProfileId(self) -> int:
@@ -149,7 +215,7 @@ class Barer(MMInterface):
         If the bearer is disconnected, or if profile management operations are not supported, -1 will be reported.
         Since: 1.18
         """
-        return self._instance.ProfileId
+        return self._get_property('ProfileId')
 
     @property
     def Properties(self) -> Dict[str, object]:
@@ -177,4 +243,4 @@ class Barer(MMInterface):
 
         Since: 1.0
         """
-        return dict(self._instance.Properties)
+        return self._get_plain_property('Properties')
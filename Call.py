@@ -1,40 +1,81 @@
-from typing import Dict
+from typing import Dict, TYPE_CHECKING
 
+from MMErrors import CancelToken
 from MMInterface import MMInterface
-from ModemManager import ModemManager
+from MMSnapshot import MMSnapshot, enum_of
 from MMEnums import MMCallState, MMCallStateReason, MMCallDirection
 
 
+if TYPE_CHECKING:
+    from ModemManager import ModemManager
+
+
+class CallSnapshot(MMSnapshot):
+    """
+    All properties of a Call object, read at once and decoded to MMEnums types.
+    """
+    __slots__ = (
+        'State',
+        'StateReason',
+        'Direction',
+        'Number',
+        'Multiparty',
+        'AudioPort',
+        'AudioFormat',
+    )
+    DECODERS = {
+        'State': enum_of(MMCallState),
+        'StateReason': enum_of(MMCallStateReason),
+        'Direction': enum_of(MMCallDirection),
+    }
+
+
 class Call(MMInterface):
     """
     The Call interface Defines operations and properties of a single Call.
     """
+    INTERFACE = 'org.freedesktop.ModemManager1.Call'
+    __slots__ = ()
+    FORWARDED = ('StateChanged', 'DtmfReceived')
+
+    def __init__(self, manager: 'ModemManager', instance, properties: Dict[str, Dict[str, object]] = None):
+        super().__init__(manager, instance, properties)
 
-    def __init__(self, manager: ModemManager, instance):
-        super().__init__(manager)
-        self._instance = instance
+    def snapshot(self, timeout: float = None, cancel: CancelToken = None) -> CallSnapshot:
+        """
+        Read every property of this Call with a single Properties.GetAll call.
+
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
+        :return: Immutable CallSnapshot, with values decoded to MMEnums types.
+        """
+        return CallSnapshot(self.path, self._get_all(timeout, cancel))
 
-    def Start(self):
+    def Start(self, timeout: float = None, cancel: CancelToken = None):
         """
         If the outgoing call has not yet been started, start it.
 
         Applicable only if state is MM_CALL_STATE_UNKNOWN and direction is MM_CALL_DIRECTION_OUTGOING.
 
         Since: 1.6
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         """
-        self._instance.Start()
+        self._call('Start', timeout=timeout, cancel=cancel)
 
-    def Accept(self):
+    def Accept(self, timeout: float = None, cancel: CancelToken = None):
         """
         Accept incoming call (answer).
 
         Applicable only if state is MM_CALL_STATE_RINGING_IN and direction is MM_CALL_DIRECTION_INCOMING.
 
         Since: 1.6
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         """
-        self._instance.Accept()
+        self._call('Accept', timeout=timeout, cancel=cancel)
 
-    def Deflect(self, number: str):
+    def Deflect(self, number: str, timeout: float = None, cancel: CancelToken = None):
         """
         Deflect an incoming or waiting call to a new number. This call will be considered terminated once the deflection is performed.
 
@@ -42,10 +83,12 @@ class Call(MMInterface):
 
         Since: 1.12
         :param number: new number where the call will be deflected.
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         """
-        self._instance.Deflect(number)
+        self._call('Deflect', number, timeout=timeout, cancel=cancel)
 
-    def JoinMultiparty(self):
+    def JoinMultiparty(self, timeout: float = None, cancel: CancelToken = None):
         """
         Join the currently held call into a single multiparty call with another already active call.
 
@@ -54,10 +97,12 @@ class Call(MMInterface):
         Applicable only if state is MM_CALL_STATE_HELD.
 
         Since: 1.12
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         """
-        self._instance.JoinMultiparty()
+        self._call('JoinMultiparty', timeout=timeout, cancel=cancel)
 
-    def LeaveMultiparty(self):
+    def LeaveMultiparty(self, timeout: float = None, cancel: CancelToken = None):
         """
         If this call is part of an ongoing multiparty call, detach it from the multiparty call,
         put the multiparty call on hold, and activate this one alone.
@@ -66,20 +111,24 @@ class Call(MMInterface):
         Applicable only if state is MM_CALL_STATE_ACTIVE or MM_CALL_STATE_HELD and the call is a multiparty call.
 
         Since: 1.12
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         """
-        self._instance.LeaveMultiparty()
+        self._call('LeaveMultiparty', timeout=timeout, cancel=cancel)
 
-    def Hangup(self):
+    def Hangup(self, timeout: float = None, cancel: CancelToken = None):
         """
         Hangup the active call.
 
         Applicable only if state is MM_CALL_STATE_UNKNOWN.
 
         Since: 1.6
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         """
-        self._instance.Hangup()
+        self._call('Hangup', timeout=timeout, cancel=cancel)
 
-    def SendDtmf(self, dtmf: str):
+    def SendDtmf(self, dtmf: str, timeout: float = None, cancel: CancelToken = None):
         """
         Send a DTMF tone (Dual Tone Multi-Frequency) (only on supported modem).
 
@@ -87,8 +136,10 @@ class Call(MMInterface):
 
         Since: 1.6
         :param dtmf: DTMF tone identifier [0-9A-D*#].
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         """
-        self._instance.SendDtmf(dtmf)
+        self._call('SendDtmf', dtmf, timeout=timeout, cancel=cancel)
 
     @property
     def State(self) -> MMCallState:
@@ -98,7 +149,7 @@ class Call(MMInterface):
         Since: 1.6
         :return: MMCallState
         """
-        return MMCallState(self._instance.State)
+        return MMCallState(self._get_property('State'))
 
     @property
     def StateReason(self) -> MMCallStateReason:
@@ -108,7 +159,7 @@ class Call(MMInterface):
         Since: 1.6
         :return: MMCallStateReason
         """
-        return MMCallStateReason(self._instance.StateReason)
+        return MMCallStateReason(self._get_property('StateReason'))
 
     @property
     def Direction(self) -> MMCallDirection:
@@ -118,7 +169,7 @@ class Call(MMInterface):
         Since: 1.6
         :return: MMCallDirection
         """
-        return MMCallDirection(self._instance.Direction)
+        return MMCallDirection(self._get_property('Direction'))
 
     @property
     def Number(self) -> str:
@@ -128,7 +179,7 @@ class Call(MMInterface):
         Since: 1.6
         :return: string
         """
-        return self._instance.Number
+        return self._get_property('Number')
 
     @property
     def Multiparty(self) -> bool:
@@ -138,7 +189,7 @@ class Call(MMInterface):
         Since: 1.12
         :return: bool
         """
-        return self._instance.Multiparty
+        return self._get_property('Multiparty')
 
     @property
     def AudioPort(self) -> str:
@@ -148,7 +199,7 @@ class Call(MMInterface):
         Since: 1.10
         :return: string
         """
-        return self._instance.AudioPort
+        return self._get_property('AudioPort')
 
     @property
     def AudioFormat(self) -> Dict[str, object]:
@@ -167,4 +218,4 @@ class Call(MMInterface):
         Since: 1.10
         :return:
         """
-        return dict(self._instance.AudioFormat)
+        return self._get_plain_property('AudioFormat')
@@ -0,0 +1,627 @@
+"""
+Minimal pure-Python D-Bus client: SASL EXTERNAL authentication over a unix socket, the D-Bus wire format,
+method calls matched to their replies by serial, and signal delivery from a reader thread.
+"""
+
+import os
+import socket
+import struct
+import threading
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+from MMBackend import TimerQueue
+
+METHOD_CALL = 1
+METHOD_RETURN = 2
+ERROR = 3
+SIGNAL = 4
+
+NO_REPLY_EXPECTED = 0x1
+
+_FIELD_PATH = 1
+_FIELD_INTERFACE = 2
+_FIELD_MEMBER = 3
+_FIELD_ERROR_NAME = 4
+_FIELD_REPLY_SERIAL = 5
+_FIELD_DESTINATION = 6
+_FIELD_SENDER = 7
+_FIELD_SIGNATURE = 8
+
+_FIELD_TYPES = {
+    _FIELD_PATH: 'o',
+    _FIELD_INTERFACE: 's',
+    _FIELD_MEMBER: 's',
+    _FIELD_ERROR_NAME: 's',
+    _FIELD_REPLY_SERIAL: 'u',
+    _FIELD_DESTINATION: 's',
+    _FIELD_SENDER: 's',
+    _FIELD_SIGNATURE: 'g',
+}
+
+_FIXED = {
+    'y': ('B', 1),
+    'b': ('I', 4),
+    'n': ('h', 2),
+    'q': ('H', 2),
+    'i': ('i', 4),
+    'u': ('I', 4),
+    'x': ('q', 8),
+    't': ('Q', 8),
+    'd': ('d', 8),
+    'h': ('I', 4),
+}
+
+_ALIGNMENT = {'s': 4, 'o': 4, 'g': 1, 'a': 4, '(': 8, '{': 8, 'v': 1}
+
+SYSTEM_BUS_ADDRESS = 'unix:path=/var/run/dbus/system_bus_socket'
+
+
+class DBusError(Exception):
+    """
+    Error reply to a method call.
+    """
+
+    def __init__(self, name: str, message: str = ''):
+        super().__init__(f'{name}: {message}' if message else name)
+        self.name = name
+        self.message = message
+
+
+class Variant(object):
+    """
+    Value of D-Bus type "v", with an explicit signature, e.g. Variant('u', 1).
+    """
+    __slots__ = ('signature', 'value')
+
+    def __init__(self, signature: str, value):
+        self.signature = signature
+        self.value = value
+
+    def __eq__(self, other):
+        return isinstance(other, Variant) and (self.signature, self.value) == (other.signature, other.value)
+
+    def __repr__(self):
+        return f'Variant({self.signature!r}, {self.value!r})'
+
+
+@lru_cache(maxsize=None)
+def split_signature(signature: str) -> Tuple[str, ...]:
+    """
+    Split a signature into its complete types, e.g. "sa{sv}(ii)" -> ("s", "a{sv}", "(ii)").
+    """
+    types = []
+    i = 0
+    while i < len(signature):
+        end = _type_end(signature, i)
+        types.append(signature[i:end])
+        i = end
+    return tuple(types)
+
+
+def _type_end(signature: str, i: int) -> int:
+    token = signature[i]
+    if token == 'a':
+        return _type_end(signature, i + 1)
+    if token in '({':
+        close = ')' if token == '(' else '}'
+        depth = 0
+        for j in range(i, len(signature)):
+            if signature[j] == token:
+                depth += 1
+            elif signature[j] == close:
+                depth -= 1
+                if depth == 0:
+                    return j + 1
+        raise ValueError(f'Unbalanced signature {signature!r}')
+    return i + 1
+
+
+def _guess_signature(value) -> str:
+    if isinstance(value, Variant):
+        return 'v'
+    if isinstance(value, bool):
+        return 'b'
+    if isinstance(value, float):
+        return 'd'
+    if isinstance(value, str):
+        return 's'
+    if isinstance(value, (bytes, bytearray)):
+        return 'ay'
+    raise TypeError(f'Cannot guess the D-Bus type of {value!r}, wrap it in a Variant')
+
+
+class _Writer(object):
+    __slots__ = ('buf', 'endian')
+
+    def __init__(self, endian: str = '<', buf: bytearray = None):
+        self.buf = buf if buf is not None else bytearray()
+        self.endian = endian
+
+    def align(self, n: int):
+        self.buf.extend(b'\0' * (-len(self.buf) % n))
+
+    def write(self, type_: str, value):
+        token = type_[0]
+        fixed = _FIXED.get(token)
+        if fixed is not None:
+            fmt, size = fixed
+            self.align(size)
+            self.buf.extend(struct.pack(self.endian + fmt, value))
+        elif token in 'so':
+            data = value.encode()
+            self.align(4)
+            self.buf.extend(struct.pack(self.endian + 'I', len(data)))
+            self.buf.extend(data)
+            self.buf.append(0)
+        elif token == 'g':
+            data = value.encode()
+            self.buf.append(len(data))
+            self.buf.extend(data)
+            self.buf.append(0)
+        elif token == 'a':
+            self._write_array(type_[1:], value)
+        elif token in '({':
+            self.align(8)
+            for member_type, member in zip(split_signature(type_[1:-1]), value):
+                self.write(member_type, member)
+        elif token == 'v':
+            if isinstance(value, Variant):
+                signature, value = value.signature, value.value
+            elif hasattr(value, 'get_type_string'):
+                signature, value = value.get_type_string(), value.unpack()
+            else:
+                signature = _guess_signature(value)
+            self.write('g', signature)
+            self.write(signature, value)
+        else:
+            raise ValueError(f'Unsupported D-Bus type {type_!r}')
+
+    def _write_array(self, element: str, value):
+        self.align(4)
+        offset = len(self.buf)
+        self.buf.extend(b'\0\0\0\0')
+        self.align(_FIXED[element[0]][1] if element[0] in _FIXED else _ALIGNMENT[element[0]])
+        start = len(self.buf)
+        if element == 'y':
+            self.buf.extend(value)
+        elif element[0] == '{':
+            key_type, value_type = split_signature(element[1:-1])
+            for k, v in value.items():
+                self.align(8)
+                self.write(key_type, k)
+                self.write(value_type, v)
+        else:
+            for v in value:
+                self.write(element, v)
+        struct.pack_into(self.endian + 'I', self.buf, offset, len(self.buf) - start)
+
+
+Decoder = Callable[[bytes, int], Tuple[object, int]]
+
+
+@lru_cache(maxsize=None)
+def _decoder(type_: str, endian: str) -> Decoder:
+    """
+    Decoder of one complete type, compiled once per signature: called with the message data and the offset
+    of the value, it returns the value and the offset after it.
+    """
+    token = type_[0]
+    if token in _FIXED:
+        fmt, size = _FIXED[token]
+        unpack = struct.Struct(endian + fmt).unpack_from
+
+        if token == 'b':
+            def decode(buf, pos):
+                pos += -pos % 4
+                return unpack(buf, pos)[0] != 0, pos + 4
+        else:
+            def decode(buf, pos):
+                pos += -pos % size
+                return unpack(buf, pos)[0], pos + size
+        return decode
+    if token in 'so':
+        unpack_length = struct.Struct(endian + 'I').unpack_from
+
+        def decode(buf, pos):
+            pos += -pos % 4
+            start = pos + 4
+            end = start + unpack_length(buf, pos)[0]
+            return str(buf[start:end], 'utf-8'), end + 1
+        return decode
+    if token == 'g':
+        return _decode_signature
+    if token == 'v':
+        def decode(buf, pos):
+            signature, pos = _decode_signature(buf, pos)
+            return _decoder(signature, endian)(buf, pos)
+        return decode
+    if token == '(':
+        members = tuple(_decoder(member_type, endian) for member_type in split_signature(type_[1:-1]))
+
+        def decode(buf, pos):
+            pos += -pos % 8
+            values = []
+            for member in members:
+                value, pos = member(buf, pos)
+                values.append(value)
+            return tuple(values), pos
+        return decode
+    if token == 'a':
+        return _array_decoder(type_[1:], endian)
+    raise ValueError(f'Unsupported D-Bus type {type_!r}')
+
+
+def _array_decoder(element: str, endian: str) -> Decoder:
+    unpack_length = struct.Struct(endian + 'I').unpack_from
+    alignment = _FIXED[element[0]][1] if element[0] in _FIXED else _ALIGNMENT[element[0]]
+    if element == 'y':
+        def decode(buf, pos):
+            pos += -pos % 4
+            start = pos + 4
+            end = start + unpack_length(buf, pos)[0]
+            return bytes(buf[start:end]), end
+        return decode
+    if element[0] == '{':
+        key_type, value_type = split_signature(element[1:-1])
+        decode_key = _decoder(key_type, endian)
+        decode_value = _decoder(value_type, endian)
+
+        def decode(buf, pos):
+            pos += -pos % 4
+            length = unpack_length(buf, pos)[0]
+            pos += 4
+            pos += -pos % 8
+            end = pos + length
+            result = {}
+            while pos < end:
+                pos += -pos % 8
+                key, pos = decode_key(buf, pos)
+                result[key], pos = decode_value(buf, pos)
+            return result, pos
+        return decode
+    decode_element = _decoder(element, endian)
+
+    def decode(buf, pos):
+        pos += -pos % 4
+        length = unpack_length(buf, pos)[0]
+        pos += 4
+        pos += -pos % alignment
+        end = pos + length
+        result = []
+        while pos < end:
+            value, pos = decode_element(buf, pos)
+            result.append(value)
+        return result, pos
+    return decode
+
+
+def _decode_signature(buf, pos: int) -> Tuple[str, int]:
+    start = pos + 1
+    end = start + buf[pos]
+    return str(buf[start:end], 'ascii'), end + 1
+
+
+@lru_cache(maxsize=None)
+def _body_decoder(signature: str, endian: str) -> Callable[[bytes, int], list]:
+    decoders = tuple(_decoder(type_, endian) for type_ in split_signature(signature))
+
+    def decode(buf, pos):
+        body = []
+        for decoder in decoders:
+            value, pos = decoder(buf, pos)
+            body.append(value)
+        return body
+    return decode
+
+
+class Message(object):
+    """
+    One D-Bus message. Bodies are lists of plain Python values; variants are unwrapped on reading.
+    """
+    __slots__ = ('type', 'flags', 'serial', 'path', 'interface', 'member', 'error_name', 'reply_serial',
+                 'destination', 'sender', 'signature', 'body')
+
+    def __init__(self, type_: int, path: str = None, interface: str = None, member: str = None,
+                 destination: str = None, signature: str = '', body: list = None, flags: int = 0,
+                 error_name: str = None, reply_serial: int = None, sender: str = None, serial: int = 0):
+        self.type = type_
+        self.flags = flags
+        self.serial = serial
+        self.path = path
+        self.interface = interface
+        self.member = member
+        self.error_name = error_name
+        self.reply_serial = reply_serial
+        self.destination = destination
+        self.sender = sender
+        self.signature = signature
+        self.body = body if body is not None else []
+
+    def to_bytes(self) -> bytes:
+        body = _Writer()
+        for type_, value in zip(split_signature(self.signature), self.body):
+            body.write(type_, value)
+        fields = []
+        for code, value in ((_FIELD_PATH, self.path), (_FIELD_INTERFACE, self.interface),
+                            (_FIELD_MEMBER, self.member), (_FIELD_ERROR_NAME, self.error_name),
+                            (_FIELD_REPLY_SERIAL, self.reply_serial), (_FIELD_DESTINATION, self.destination),
+                            (_FIELD_SENDER, self.sender), (_FIELD_SIGNATURE, self.signature or None)):
+            if value is not None:
+                fields.append((code, Variant(_FIELD_TYPES[code], value)))
+        header = _Writer(buf=bytearray(struct.pack('<cBBBII', b'l', self.type, self.flags, 1,
+                                                   len(body.buf), self.serial)))
+        header.write('a(yv)', fields)
+        header.align(8)
+        return bytes(header.buf + body.buf)
+
+    @classmethod
+    def from_bytes(cls, data) -> 'Message':
+        endian = '<' if data[0:1] == b'l' else '>'
+        type_, flags, _, body_length, serial = struct.unpack_from(endian + 'BBBII', data, 1)
+        fields, pos = _decoder('a(yv)', endian)(data, 12)
+        fields = dict(fields)
+        pos += -pos % 8
+        message = cls(type_, flags=flags, serial=serial, path=fields.get(_FIELD_PATH),
+                      interface=fields.get(_FIELD_INTERFACE), member=fields.get(_FIELD_MEMBER),
+                      error_name=fields.get(_FIELD_ERROR_NAME), reply_serial=fields.get(_FIELD_REPLY_SERIAL),
+                      destination=fields.get(_FIELD_DESTINATION), sender=fields.get(_FIELD_SENDER),
+                      signature=fields.get(_FIELD_SIGNATURE, ''))
+        message.body = _body_decoder(message.signature, endian)(data, pos)
+        return message
+
+    @staticmethod
+    def length(header: bytes) -> int:
+        """
+        Total length of a message, from its first 16 bytes.
+        """
+        endian = '<' if header[0:1] == b'l' else '>'
+        body_length, = struct.unpack_from(endian + 'I', header, 4)
+        fields_length, = struct.unpack_from(endian + 'I', header, 12)
+        header_length = 16 + fields_length
+        return header_length + (-header_length % 8) + body_length
+
+
+def system_bus_address() -> str:
+    return os.environ.get('DBUS_SYSTEM_BUS_ADDRESS', SYSTEM_BUS_ADDRESS)
+
+
+def _open_socket(address: str) -> socket.socket:
+    for entry in address.split(';'):
+        transport, _, params = entry.partition(':')
+        options = dict(param.split('=', 1) for param in params.split(',') if '=' in param)
+        if transport != 'unix':
+            continue
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if 'path' in options:
+            sock.connect(options['path'])
+        elif 'abstract' in options:
+            sock.connect('\0' + options['abstract'])
+        else:
+            sock.close()
+            continue
+        return sock
+    raise ConnectionError(f'No usable unix transport in D-Bus address {address!r}')
+
+
+class DBusConnection(object):
+    """
+    Connection to a message bus. Replies and signals are read by a daemon thread; signal handlers and
+    method handlers are called on that thread.
+
+    Method calls to this connection are answered with UnknownMethod unless method_handler is set; it is called
+    with each call Message and answers it with reply() or reply_error(), e.g. to serve a mock daemon.
+    """
+
+    def __init__(self, address: str = None):
+        self.address = address or system_bus_address()
+        self.unique_name: Optional[str] = None
+        self._sock: Optional[socket.socket] = None
+        self._send_lock = threading.Lock()
+        self._serial_lock = threading.Lock()
+        self._serial = 0
+        self._pending: Dict[int, Future] = {}
+        self._signal_handlers: List[Callable[[Message], None]] = []
+        self.method_handler: Optional[Callable[[Message], None]] = None
+        self._reader: Optional[threading.Thread] = None
+        self._timeouts = TimerQueue('DBusTimeouts')
+        self._buffer = bytearray()
+        self.closed = False
+
+    def connect(self) -> 'DBusConnection':
+        self._sock = _open_socket(self.address)
+        self._authenticate()
+        self._reader = threading.Thread(target=self._read_loop, name='DBusConnection', daemon=True)
+        self._reader.start()
+        self.unique_name = self.call('org.freedesktop.DBus', '/org/freedesktop/DBus', 'org.freedesktop.DBus', 'Hello')
+        return self
+
+    def close(self):
+        self.closed = True
+        if self._sock is not None:
+            try:
+                self._sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._sock.close()
+
+    def _authenticate(self):
+        uid = str(os.getuid()).encode().hex()
+        self._sock.sendall(b'\0AUTH EXTERNAL ' + uid.encode() + b'\r\n')
+        line = self._read_line()
+        if not line.startswith(b'OK '):
+            raise ConnectionError(f'D-Bus authentication failed: {line!r}')
+        self._sock.sendall(b'BEGIN\r\n')
+
+    def _read_line(self) -> bytes:
+        while b'\r\n' not in self._buffer:
+            data = self._sock.recv(4096)
+            if not data:
+                raise ConnectionError('D-Bus connection closed during authentication')
+            self._buffer.extend(data)
+        line, _, rest = bytes(self._buffer).partition(b'\r\n')
+        self._buffer = bytearray(rest)
+        return line
+
+    def _next_serial(self) -> int:
+        with self._serial_lock:
+            self._serial += 1
+            return self._serial
+
+    def send(self, message: Message) -> int:
+        """
+        Send a message, assigning its serial.
+
+        :return: The serial of the message.
+        """
+        if not message.serial:
+            message.serial = self._next_serial()
+        data = message.to_bytes()
+        with self._send_lock:
+            self._sock.sendall(data)
+        return message.serial
+
+    def send_all(self, messages: List[Message]):
+        """
+        Send several messages with a single write, assigning their serials.
+        """
+        data = bytearray()
+        for message in messages:
+            if not message.serial:
+                message.serial = self._next_serial()
+            data += message.to_bytes()
+        with self._send_lock:
+            self._sock.sendall(data)
+
+    def call_async(self, destination: str, path: str, interface: str, member: str, signature: str = '',
+                   args: tuple = (), timeout: float = None) -> Future:
+        """
+        Send a method call without waiting; the future resolves with the reply body, or a DBusError.
+
+        :param timeout: Seconds after which the call fails with org.freedesktop.DBus.Error.NoReply, or None.
+            The timeouts of every call share one timer thread.
+        """
+        future = Future()
+        future.set_running_or_notify_cancel()
+        message = Message(METHOD_CALL, path, interface, member, destination, signature, list(args))
+        message.serial = self._next_serial()
+        self._pending[message.serial] = future
+        try:
+            self.send(message)
+        except OSError as e:
+            self._pending.pop(message.serial, None)
+            future.set_exception(ConnectionError(str(e)))
+            return future
+        if timeout is not None:
+            timer = self._timeouts.schedule(timeout, self._expire, message.serial, f'{interface}.{member}', timeout)
+            future.add_done_callback(lambda _: self._timeouts.cancel(timer))
+        return future
+
+    def _expire(self, serial: int, name: str, timeout: float):
+        future = self._pending.pop(serial, None)
+        if future is not None and not future.done():
+            future.set_exception(DBusError('org.freedesktop.DBus.Error.NoReply', f'{name} timed out after {timeout}s'))
+
+    def call(self, destination: str, path: str, interface: str, member: str, signature: str = '',
+             args: tuple = (), timeout: float = 25.0):
+        """
+        Call a method and wait for the reply.
+
+        :return: None, the single output argument, or a tuple of output arguments.
+        """
+        return unpack_body(self.call_async(destination, path, interface, member, signature, args, timeout).result())
+
+    def add_match(self, rule: str):
+        self.call('org.freedesktop.DBus', '/org/freedesktop/DBus', 'org.freedesktop.DBus', 'AddMatch', 's', (rule,))
+
+    def request_name(self, name: str) -> int:
+        """
+        Ask the bus for a well-known name, without queueing for it.
+
+        :return: Reply code of RequestName, 1 if this connection became the primary owner.
+        """
+        return self.call('org.freedesktop.DBus', '/org/freedesktop/DBus', 'org.freedesktop.DBus', 'RequestName', 'su',
+                         (name, 0x4))
+
+    def reply(self, call: Message, signature: str = '', body: tuple = ()):
+        """
+        Answer a method call received by method_handler.
+        """
+        if not call.flags & NO_REPLY_EXPECTED:
+            self.send(Message(METHOD_RETURN, reply_serial=call.serial, destination=call.sender, signature=signature,
+                              body=list(body)))
+
+    def reply_error(self, call: Message, name: str, text: str = ''):
+        """
+        Answer a method call received by method_handler with an error.
+        """
+        if not call.flags & NO_REPLY_EXPECTED:
+            self.send(Message(ERROR, error_name=name, reply_serial=call.serial, destination=call.sender,
+                              signature='s', body=[text]))
+
+    def emit(self, path: str, interface: str, member: str, signature: str = '', args: tuple = ()):
+        """
+        Broadcast a signal from this connection.
+        """
+        self.send(Message(SIGNAL, path, interface, member, signature=signature, body=list(args)))
+
+    def add_signal_handler(self, handler: Callable[[Message], None]):
+        self._signal_handlers.append(handler)
+
+    def remove_signal_handler(self, handler: Callable[[Message], None]):
+        if handler in self._signal_handlers:
+            self._signal_handlers.remove(handler)
+
+    def _read_loop(self):
+        buffer = self._buffer
+        try:
+            while True:
+                while len(buffer) >= 16:
+                    length = Message.length(buffer[:16])
+                    if len(buffer) < length:
+                        break
+                    message = Message.from_bytes(bytes(buffer[:length]))
+                    del buffer[:length]
+                    self._dispatch(message)
+                data = self._sock.recv(65536)
+                if not data:
+                    break
+                buffer.extend(data)
+        except OSError:
+            pass
+        finally:
+            self.closed = True
+            pending, self._pending = self._pending, {}
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError('D-Bus connection closed'))
+            self._timeouts.close()
+
+    def _dispatch(self, message: Message):
+        if message.type in (METHOD_RETURN, ERROR):
+            future = self._pending.pop(message.reply_serial, None)
+            if future is None or future.done():
+                return
+            if message.type == ERROR:
+                text = message.body[0] if message.body and isinstance(message.body[0], str) else ''
+                future.set_exception(DBusError(message.error_name, text))
+            else:
+                future.set_result(message.body)
+        elif message.type == SIGNAL:
+            for handler in list(self._signal_handlers):
+                handler(message)
+        elif message.type == METHOD_CALL:
+            if self.method_handler is not None:
+                self.method_handler(message)
+            else:
+                self.reply_error(message, 'org.freedesktop.DBus.Error.UnknownMethod',
+                                 f'No such method {message.interface}.{message.member}')
+
+
+def unpack_body(body: list):
+    if not body:
+        return None
+    if len(body) == 1:
+        return body[0]
+    return tuple(body)
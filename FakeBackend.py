@@ -0,0 +1,494 @@
+import collections
+import hashlib
+import itertools
+import random
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import MMIntrospection
+from DBusSocket import DBusError, Variant, split_signature
+from MMBackend import MMBackend, SignalQueue, TimerQueue
+from MMEnums import MMBearerIpMethod, MMCallState, MMModemAccessTechnology, MMModemCapability, MMModemLock, \
+    MMModemMode, MMModemPowerState, MMModemState, MMModemStateChangeReason, MMSmsState
+from SignalRouter import SignalRouter
+from SocketBackend import PROPERTIES_INTERFACE, SocketProxy, SocketProxyClass
+
+MANAGER_PATH = '/org/freedesktop/ModemManager1'
+MANAGER_INTERFACE = 'org.freedesktop.ModemManager1'
+OBJECT_MANAGER_INTERFACE = 'org.freedesktop.DBus.ObjectManager'
+MODEM_INTERFACE = 'org.freedesktop.ModemManager1.Modem'
+SIM_INTERFACE = 'org.freedesktop.ModemManager1.Sim'
+BEARER_INTERFACE = 'org.freedesktop.ModemManager1.Bearer'
+SMS_INTERFACE = 'org.freedesktop.ModemManager1.Sms'
+CALL_INTERFACE = 'org.freedesktop.ModemManager1.Call'
+MESSAGING_INTERFACE = 'org.freedesktop.ModemManager1.Modem.Messaging'
+VOICE_INTERFACE = 'org.freedesktop.ModemManager1.Modem.Voice'
+
+FAILED = 'org.freedesktop.ModemManager1.Error.Core.Failed'
+NO_REPLY = 'org.freedesktop.DBus.Error.NoReply'
+UNKNOWN_OBJECT = 'org.freedesktop.DBus.Error.UnknownObject'
+UNKNOWN_METHOD = 'org.freedesktop.DBus.Error.UnknownMethod'
+INVALID_ARGS = 'org.freedesktop.DBus.Error.InvalidArgs'
+
+Latency = Union[float, Callable[[str, str, str], float]]
+
+
+def default_value(signature: str):
+    """
+    Zero value of a D-Bus type: 0, "", False, an empty container, or a struct of zero values.
+    """
+    token = signature[0]
+    if token in 'ybnqiuxth':
+        return False if token == 'b' else 0
+    if token == 'd':
+        return 0.0
+    if token in 'sg':
+        return ''
+    if token == 'o':
+        return '/'
+    if token == 'v':
+        return 0
+    if token == '(':
+        return tuple(default_value(member) for member in split_signature(signature[1:-1]))
+    if signature == 'ay':
+        return b''
+    if signature.startswith('a{'):
+        return {}
+    return []
+
+
+@lru_cache(maxsize=None)
+def _defaults(version: str, interface: str) -> Dict[str, object]:
+    # Shared by every object of the interface: simulated objects replace property values, never mutate them.
+    element = MMIntrospection.interface_element(version, interface)
+    if element is None:
+        return {}
+    return {member.attrib['name']: default_value(member.attrib['type']) for member in element.iter('property')}
+
+
+class FakeBackend(MMBackend):
+    """
+    In-process simulation of ModemManager behind the backend interface, for load tests and benchmarks of the
+    wrappers without modems, a bus or gi:
+
+        backend = FakeBackend(modems=10000, latency=0.002, failure_rate=0.001)
+        manager = ModemManager(backend=backend)
+        backend.start_signals(rate=500)
+
+    Objects carry every property of their bundled interfaces, with zero values unless set. Properties.Get,
+    GetAll and Set, GetManagedObjects, and the methods the wrappers expose are answered from these objects,
+    changing them as ModemManager would and emitting PropertiesChanged and the other signals. Other methods
+    of the bundled interfaces succeed without effect. Replace or add behaviour in handlers, keyed by
+    (interface, method) and called with the object path and the method arguments.
+
+    Replies arrive after `latency` seconds, from a timer thread; calls with a shorter timeout fail with NoReply,
+    and calls still waiting when the backend is closed fail with ConnectionError.
+    A `failure_rate` share of the calls fails with org.freedesktop.ModemManager1.Error.Core.Failed.
+    Signal handlers run on a dispatch thread.
+    """
+
+    def __init__(self, modems: int = 0, latency: Latency = 0.0, failure_rate: float = 0.0, version: str = None,
+                 seed: int = None, signals: bool = True):
+        """
+        :param modems: Number of modems to create with default properties.
+        :param latency: Seconds until each reply, or a callable taking path, interface and method returning them.
+        :param failure_rate: Share of calls failing, between 0 and 1.
+        :param version: Bundled interface set the objects implement, defaults to the newest one.
+        :param seed: Seed of the random failures and simulated signals, for repeatable runs.
+        :param signals: Whether signals are delivered; False simulates the pydbus backend without a running
+            main loop, where the wrappers have to read every value from the daemon.
+        """
+        self.version = version or MMIntrospection.latest_version()
+        self.signals = signals
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.command_handler: Callable[[str, str], str] = lambda path, cmd: 'OK'
+        self.handlers: Dict[Tuple[str, str], Callable] = {
+            (PROPERTIES_INTERFACE, 'Get'): self._get,
+            (PROPERTIES_INTERFACE, 'GetAll'): self._get_all,
+            (PROPERTIES_INTERFACE, 'Set'): self._set,
+            (OBJECT_MANAGER_INTERFACE, 'GetManagedObjects'): self._get_managed_objects,
+            (MODEM_INTERFACE, 'Enable'): self._enable,
+            (MODEM_INTERFACE, 'ListBearers'): lambda path: list(self.get_property(path, MODEM_INTERFACE, 'Bearers')),
+            (MODEM_INTERFACE, 'CreateBearer'): self._create_bearer,
+            (MODEM_INTERFACE, 'DeleteBearer'): self._child_deleter(MODEM_INTERFACE, 'Bearers'),
+            (MODEM_INTERFACE, 'SetPowerState'): self._setter(MODEM_INTERFACE, 'PowerState'),
+            (MODEM_INTERFACE, 'SetCurrentCapabilities'): self._setter(MODEM_INTERFACE, 'CurrentCapabilities'),
+            (MODEM_INTERFACE, 'SetCurrentModes'): self._setter(MODEM_INTERFACE, 'CurrentModes'),
+            (MODEM_INTERFACE, 'SetCurrentBands'): self._setter(MODEM_INTERFACE, 'CurrentBands'),
+            (MODEM_INTERFACE, 'SetPrimarySimSlot'): self._setter(MODEM_INTERFACE, 'PrimarySimSlot'),
+            (MODEM_INTERFACE, 'Command'): lambda path, cmd, timeout: self.command_handler(path, cmd),
+            (MESSAGING_INTERFACE, 'Create'): self._child_creator(MESSAGING_INTERFACE, 'Messages', 'SMS', SMS_INTERFACE),
+            (MESSAGING_INTERFACE, 'List'): lambda path: list(self.get_property(path, MESSAGING_INTERFACE, 'Messages')),
+            (MESSAGING_INTERFACE, 'Delete'): self._child_deleter(MESSAGING_INTERFACE, 'Messages'),
+            (VOICE_INTERFACE, 'CreateCall'): self._child_creator(VOICE_INTERFACE, 'Calls', 'Call', CALL_INTERFACE),
+            (VOICE_INTERFACE, 'ListCalls'): lambda path: list(self.get_property(path, VOICE_INTERFACE, 'Calls')),
+            (VOICE_INTERFACE, 'DeleteCall'): self._child_deleter(VOICE_INTERFACE, 'Calls'),
+            (SIM_INTERFACE, 'SetPreferredNetworks'): self._setter(SIM_INTERFACE, 'PreferredNetworks'),
+            (BEARER_INTERFACE, 'Connect'): lambda path: self._connect_bearer(path, True),
+            (BEARER_INTERFACE, 'Disconnect'): lambda path: self._connect_bearer(path, False),
+            (SMS_INTERFACE, 'Send'): lambda path: self.set_property(path, SMS_INTERFACE, 'State',
+                                                                    MMSmsState.MM_SMS_STATE_SENT.value),
+            (SMS_INTERFACE, 'Store'): self._setter(SMS_INTERFACE, 'Storage'),
+            (CALL_INTERFACE, 'Start'): self._call_state(MMCallState.MM_CALL_STATE_ACTIVE),
+            (CALL_INTERFACE, 'Accept'): self._call_state(MMCallState.MM_CALL_STATE_ACTIVE),
+            (CALL_INTERFACE, 'Hangup'): self._call_state(MMCallState.MM_CALL_STATE_TERMINATED),
+        }
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._objects: Dict[str, Dict[str, Dict[str, object]]] = {}
+        self._modems: Dict[str, None] = {}
+        self._counters: Dict[str, itertools.count] = collections.defaultdict(itertools.count)
+        self._proxy_classes: Dict[frozenset, SocketProxyClass] = {}
+        self._subscriptions: List[Tuple[str, Callable]] = []
+        self._owner_callbacks: List[Callable[[str, str], None]] = []
+        self._owner = ':1.1'
+        self._direct = SignalRouter()
+        self._signals = SignalQueue('FakeSignalDispatch')
+        self._timers = TimerQueue('FakeReplies')
+        self._emitter: Optional[threading.Thread] = None
+        self._emitting = threading.Event()
+        self._closed = False
+        self.add_object(MANAGER_PATH, {MANAGER_INTERFACE: {'Version': f'{self.version}.0'},
+                                       OBJECT_MANAGER_INTERFACE: {}})
+        for _ in range(modems):
+            self.add_modem()
+
+    """
+    Simulated objects
+    """
+
+    def add_object(self, path: str, interfaces: Dict[str, Dict[str, object]]) -> str:
+        """
+        Export an object. Properties of bundled interfaces that are not given get their zero value.
+
+        :param path: Object path.
+        :param interfaces: Interface name -> property values.
+        """
+        values = {}
+        for interface, properties in interfaces.items():
+            values[interface] = dict(_defaults(self.version, interface), **properties)
+        with self._lock:
+            self._objects[path] = values
+        return path
+
+    def add_modem(self, properties: Dict[str, object] = None, interfaces: Dict[str, Dict[str, object]] = None) -> str:
+        """
+        Add a modem with a SIM, as if it was just plugged in, and announce it with InterfacesAdded.
+        Besides Modem, it implements Modem.Messaging and Modem.Voice.
+
+        :param properties: Values of Modem properties, overriding the simulated ones.
+        :param interfaces: Further interfaces of the modem, e.g. Modem.Modem3gpp, with their property values.
+        :return: Object path of the modem.
+        """
+        index = next(self._counters['Modem'])
+        sim = self.add_object(f'{MANAGER_PATH}/SIM/{next(self._counters["SIM"])}', {SIM_INTERFACE: {
+            'SimIdentifier': f'8901{index:015d}',
+            'Imsi': f'00101{index:010d}',
+            'OperatorIdentifier': '00101',
+            'OperatorName': 'Fake Network',
+            'Active': True,
+        }})
+        modem = {
+            'Sim': sim,
+            'Bearers': [],
+            'SupportedCapabilities': [MMModemCapability.MM_MODEM_CAPABILITY_LTE.value],
+            'CurrentCapabilities': MMModemCapability.MM_MODEM_CAPABILITY_LTE.value,
+            'Manufacturer': 'Fake',
+            'Model': 'FakeModem 1',
+            'Revision': '1.0',
+            'HardwareRevision': '1',
+            'DeviceIdentifier': hashlib.sha1(f'fake-modem-{index}'.encode()).hexdigest(),
+            'Device': f'/sys/devices/fake/{index}',
+            'Drivers': ['fake'],
+            'Plugin': 'fake',
+            'PrimaryPort': f'cdc-wdm{index}',
+            'Ports': [(f'cdc-wdm{index}', 6), (f'wwan{index}', 2)],
+            'EquipmentIdentifier': f'35{index:013d}',
+            'UnlockRequired': MMModemLock.MM_MODEM_LOCK_NONE.value,
+            'State': MMModemState.MM_MODEM_STATE_REGISTERED.value,
+            'AccessTechnologies': MMModemAccessTechnology.MM_MODEM_ACCESS_TECHNOLOGY_LTE.value,
+            'SignalQuality': (70, True),
+            'OwnNumbers': [f'+1555{index:07d}'],
+            'PowerState': MMModemPowerState.MM_MODEM_POWER_STATE_ON.value,
+            'SupportedModes': [(MMModemMode.MM_MODEM_MODE_4G.value, MMModemMode.MM_MODEM_MODE_4G.value)],
+            'CurrentModes': (MMModemMode.MM_MODEM_MODE_4G.value, MMModemMode.MM_MODEM_MODE_4G.value),
+        }
+        modem.update(properties or {})
+        path = self.add_object(f'{MANAGER_PATH}/Modem/{index}', {MODEM_INTERFACE: modem, MESSAGING_INTERFACE: {},
+                                                                 VOICE_INTERFACE: {}, **(interfaces or {})})
+        with self._lock:
+            self._modems[path] = None
+            added = self._managed(path)
+        self.emit(MANAGER_PATH, OBJECT_MANAGER_INTERFACE, 'InterfacesAdded', path, added)
+        return path
+
+    def remove_modem(self, path: str):
+        """
+        Remove a modem and its SIM and bearers, as if it was unplugged, and announce it with InterfacesRemoved.
+        """
+        with self._lock:
+            del self._modems[path]
+            modem = self._objects.pop(path)
+            children = [modem[MODEM_INTERFACE]['Sim'], *modem[MODEM_INTERFACE]['Bearers'],
+                        *modem.get(MESSAGING_INTERFACE, {}).get('Messages', ()),
+                        *modem.get(VOICE_INTERFACE, {}).get('Calls', ())]
+            for child in children:
+                self._objects.pop(child, None)
+        self.emit(MANAGER_PATH, OBJECT_MANAGER_INTERFACE, 'InterfacesRemoved', path, list(modem))
+
+    @property
+    def modem_paths(self) -> List[str]:
+        with self._lock:
+            return list(self._modems)
+
+    def get_property(self, path: str, interface: str, name: str):
+        with self._lock:
+            return self._objects[path][interface][name]
+
+    def set_property(self, path: str, interface: str, name: str, value, emit: bool = True):
+        """
+        Change a property, emitting PropertiesChanged unless emit is False.
+        """
+        with self._lock:
+            self._objects[path][interface][name] = value
+        if emit:
+            self.emit(path, PROPERTIES_INTERFACE, 'PropertiesChanged', interface, {name: value}, [])
+
+    def emit(self, path: str, interface: str, member: str, *args):
+        """
+        Emit a signal of an object, as the daemon would, unless signals are off.
+        """
+        if not self.signals:
+            return
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for namespace, callback in subscriptions:
+            if (path + '/').startswith(namespace):
+                self._signals.put(callback, path, interface, member, args)
+        self._signals.put(self._direct.dispatch, path, interface, member, args)
+
+    def start_signals(self, rate: float, properties: Iterable[str] = ('SignalQuality',)):
+        """
+        Emit PropertiesChanged of random modems at about rate signals per second, with random new values
+        of SignalQuality, or zero-value changes of other properties, until stop_signals() or close().
+        """
+        self.stop_signals()
+        properties = tuple(properties)
+        self._emitting.set()
+
+        def run():
+            interval = 1.0 / rate
+            deadline = time.monotonic()
+            while self._emitting.is_set():
+                paths = self.modem_paths
+                if paths:
+                    path = self._random.choice(paths)
+                    name = self._random.choice(properties)
+                    value = ((self._random.randrange(101), True) if name == 'SignalQuality'
+                             else self.get_property(path, MODEM_INTERFACE, name))
+                    self.set_property(path, MODEM_INTERFACE, name, value)
+                deadline += interval
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+
+        self._emitter = threading.Thread(target=run, name='FakeSignalEmitter', daemon=True)
+        self._emitter.start()
+
+    def stop_signals(self):
+        self._emitting.clear()
+        if self._emitter is not None:
+            self._emitter.join()
+            self._emitter = None
+
+    def restart(self):
+        """
+        Simulate a daemon restart: the bus name changes owner and every modem is exported again under a new path.
+        """
+        old_owner = self._owner
+        with self._lock:
+            modems = [self._objects.pop(path) for path in self._modems]
+            self._modems.clear()
+            callbacks = list(self._owner_callbacks)
+        for callback in callbacks:
+            self._signals.put(callback, old_owner, '')
+        with self._lock:
+            for modem in modems:
+                path = f'{MANAGER_PATH}/Modem/{next(self._counters["Modem"])}'
+                self._objects[path] = modem
+                self._modems[path] = None
+        self._owner = f':1.{int(old_owner[3:]) + 1}'
+        for callback in callbacks:
+            self._signals.put(callback, '', self._owner)
+
+    """
+    Backend interface
+    """
+
+    @property
+    def dispatching(self) -> bool:
+        return self.signals and not self._closed
+
+    def proxy_class(self, node: ET.Element) -> SocketProxyClass:
+        return SocketProxyClass(self, node)
+
+    def introspect(self, path: str) -> SocketProxy:
+        with self._lock:
+            interfaces = frozenset(self._objects.get(path, ()))
+            proxy_class = self._proxy_classes.get(interfaces)
+            if proxy_class is None:
+                node = MMIntrospection.build_node(self.version, sorted(interfaces))
+                if node is None:
+                    raise DBusError(UNKNOWN_OBJECT, f'No bundled description of {path}')
+                proxy_class = self._proxy_classes[interfaces] = SocketProxyClass(self, node)
+        return proxy_class(path)
+
+    def method_signature(self, proxy: SocketProxy, interface: str, method: str) -> str:
+        return proxy._class.interfaces[interface].methods[method]
+
+    def call_async(self, path: str, interface: str, method: str, signature: str, args: tuple,
+                   timeout: float = None) -> Future:
+        future = Future()
+        future.set_running_or_notify_cancel()
+        delay = self.latency(path, interface, method) if callable(self.latency) else self.latency
+        if timeout is not None and delay > timeout:
+            self._timers.resolve(timeout, future,
+                                 error=DBusError(NO_REPLY, f'{interface}.{method} on {path} got no reply'))
+            return future
+        if self.failure_rate and self._random.random() < self.failure_rate:
+            self._timers.resolve(delay, future, error=DBusError(FAILED, 'Simulated failure'))
+            return future
+        try:
+            result = self._handle(path, interface, method, args)
+        except DBusError as e:
+            self._timers.resolve(delay, future, error=e)
+        else:
+            self._timers.resolve(delay, future, result)
+        return future
+
+    def watch_name_owner(self, name: str, callback: Callable[[str, str], None]):
+        with self._lock:
+            self._owner_callbacks.append(callback)
+
+    def timed_out(self, error: BaseException) -> bool:
+        return isinstance(error, DBusError) and error.name == NO_REPLY
+
+    def subscribe(self, sender: str, path_namespace: str, callback: Callable[[str, str, str, tuple], None]):
+        with self._lock:
+            self._subscriptions.append((path_namespace.rstrip('/') + '/', callback))
+
+    def connect_signal(self, path: str, interface: str, member: str, callback: Callable):
+        """
+        Connect a handler to one signal of one object, for proxy.StateChanged.connect().
+
+        :return: Handle with a disconnect() method.
+        """
+        return self._direct.connect(path, interface, member, lambda *args: callback(*args))
+
+    def close(self):
+        """
+        Stop the simulation. Calls still waiting for their simulated latency fail with ConnectionError.
+        """
+        self.stop_signals()
+        self._closed = True
+        self._timers.close(ConnectionError('FakeBackend closed'))
+        self._signals.close()
+
+    """
+    Calls
+    """
+
+    def _handle(self, path: str, interface: str, method: str, args: tuple):
+        with self._lock:
+            interfaces = self._objects.get(path)
+        if interfaces is None:
+            raise DBusError(UNKNOWN_OBJECT, f'No such object path {path!r}')
+        handler = self.handlers.get((interface, method))
+        if handler is not None:
+            return handler(path, *args)
+        element = MMIntrospection.interface_element(self.version, interface)
+        if interface in interfaces and element is not None and any(
+                member.attrib['name'] == method for member in element.iter('method')):
+            return None
+        raise DBusError(UNKNOWN_METHOD, f'No such method {interface}.{method} on {path}')
+
+    def _managed(self, path: str) -> Dict[str, Dict[str, object]]:
+        # called with the lock held; copies, as a reply would be
+        return {interface: dict(values) for interface, values in self._objects[path].items()}
+
+    def _get(self, path: str, interface: str, name: str):
+        try:
+            return self.get_property(path, interface, name)
+        except KeyError:
+            raise DBusError(INVALID_ARGS, f'No such property {interface}.{name}') from None
+
+    def _get_all(self, path: str, interface: str) -> Dict[str, object]:
+        with self._lock:
+            return dict(self._objects[path].get(interface, {}))
+
+    def _set(self, path: str, interface: str, name: str, value):
+        self._get(path, interface, name)
+        self.set_property(path, interface, name, value.value if isinstance(value, Variant) else value)
+
+    def _get_managed_objects(self, path: str) -> Dict[str, Dict[str, Dict[str, object]]]:
+        with self._lock:
+            return {modem: self._managed(modem) for modem in self._modems}
+
+    def _setter(self, interface: str, name: str) -> Callable:
+        return lambda path, value: self.set_property(path, interface, name, value)
+
+    def _enable(self, path: str, enable: bool):
+        old = self.get_property(path, MODEM_INTERFACE, 'State')
+        if enable:
+            new = max(old, MMModemState.MM_MODEM_STATE_REGISTERED.value)
+        else:
+            new = MMModemState.MM_MODEM_STATE_DISABLED.value
+        if new != old:
+            self.set_property(path, MODEM_INTERFACE, 'State', new)
+            self.emit(path, MODEM_INTERFACE, 'StateChanged', old, new,
+                      MMModemStateChangeReason.MM_MODEM_STATE_CHANGE_REASON_USER_REQUESTED.value)
+
+    def _create_bearer(self, path: str, properties: Dict[str, object]) -> str:
+        properties = {key: value.value if isinstance(value, Variant) else value for key, value in properties.items()}
+        bearer = self.add_object(f'{MANAGER_PATH}/Bearer/{next(self._counters["Bearer"])}',
+                                 {BEARER_INTERFACE: {'Properties': properties, 'BearerType': 1}})
+        self.set_property(path, MODEM_INTERFACE, 'Bearers',
+                          self.get_property(path, MODEM_INTERFACE, 'Bearers') + [bearer])
+        return bearer
+
+    def _child_creator(self, interface: str, listed: str, kind: str, child_interface: str) -> Callable:
+        # Messaging.Create() and Voice.CreateCall(): export a child object and list it on the modem
+        def create(path: str, properties: Dict[str, object]) -> str:
+            values = {key: value.value if isinstance(value, Variant) else value for key, value in properties.items()}
+            child = self.add_object(f'{MANAGER_PATH}/{kind}/{next(self._counters[kind])}', {child_interface: values})
+            self.set_property(path, interface, listed, self.get_property(path, interface, listed) + [child])
+            return child
+        return create
+
+    def _child_deleter(self, interface: str, listed: str) -> Callable:
+        def delete(path: str, child: str):
+            children = self.get_property(path, interface, listed)
+            if child not in children:
+                raise DBusError(INVALID_ARGS, f'No object {child} on {path}')
+            with self._lock:
+                self._objects.pop(child, None)
+            self.set_property(path, interface, listed, [c for c in children if c != child])
+        return delete
+
+    def _connect_bearer(self, path: str, connect: bool):
+        self.set_property(path, BEARER_INTERFACE, 'Connected', connect)
+        self.set_property(path, BEARER_INTERFACE, 'Interface', 'wwan0' if connect else '')
+        self.set_property(path, BEARER_INTERFACE, 'Ip4Config',
+                          {'method': MMBearerIpMethod.MM_BEARER_IP_METHOD_DHCP.value} if connect else {})
+
+    def _call_state(self, state: MMCallState) -> Callable:
+        def handle(path: str):
+            old = self.get_property(path, CALL_INTERFACE, 'State')
+            self.set_property(path, CALL_INTERFACE, 'State', state.value)
+            self.emit(path, CALL_INTERFACE, 'StateChanged', old, state.value, 0)
+        return handle
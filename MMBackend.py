@@ -0,0 +1,281 @@
+import heapq
+import itertools
+import logging
+import queue
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import Future, InvalidStateError, wait
+from typing import Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SignalQueue(object):
+    """
+    Thread-safe hand-off of signals from the thread receiving them to a dispatch thread,
+    so handlers may block or make calls without stalling the receiving thread.
+    """
+
+    def __init__(self, name: str = 'SignalDispatch'):
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def put(self, callback: Callable, *args):
+        self._queue.put((callback, args))
+
+    def close(self):
+        """
+        Stop the dispatch thread once the queued signals are handled.
+        """
+        self._queue.put(None)
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            callback, args = item
+            try:
+                callback(*args)
+            except Exception:
+                logger.exception('Error in signal handler %r', callback)
+
+
+class TimerQueue(object):
+    """
+    Runs callbacks after a delay on a single timer thread, started on first use, for backends that simulate
+    reply latency and connections that time out calls. Callbacks due at the same time run in the order they
+    were scheduled.
+    """
+
+    def __init__(self, name: str = 'Timers'):
+        self._name = name
+        self._timers: List[list] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._cancelled = 0
+        self._closed = False
+
+    def schedule(self, delay: float, callback: Callable, *args) -> Optional[list]:
+        """
+        Call callback(*args) after delay seconds; right away, on the calling thread, if delay is not positive.
+
+        :return: Handle to pass to cancel(), or None if the callback already ran.
+        """
+        if delay <= 0:
+            callback(*args)
+            return None
+        timer = [time.monotonic() + delay, next(self._sequence), callback, args]
+        with self._condition:
+            heapq.heappush(self._timers, timer)
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return timer
+
+    def cancel(self, timer: Optional[list]):
+        """
+        Keep a scheduled callback from running, e.g. a timeout once the reply arrived.
+        """
+        if timer is None:
+            return
+        with self._condition:
+            if timer[2] is None:
+                return
+            timer[2] = None
+            self._cancelled += 1
+            # cancelled timers stay in the heap until due; drop them at once when they make up most of it
+            if self._cancelled > 64 and self._cancelled * 2 > len(self._timers):
+                self._timers = [t for t in self._timers if t[2] is not None]
+                heapq.heapify(self._timers)
+                self._cancelled = 0
+
+    def resolve(self, delay: float, future: Future, result=None, error: BaseException = None):
+        """
+        Resolve a future with result, or fail it with error, after delay seconds.
+        """
+        self.schedule(delay, self._settle, future, result, error)
+
+    @staticmethod
+    def _settle(future: Future, result, error: Optional[BaseException]):
+        try:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+        except InvalidStateError:
+            pass
+
+    def close(self, error: BaseException = None):
+        """
+        Stop the timer thread. Callbacks not yet due do not run, but futures passed to resolve() that are not
+        resolved yet fail right away, so nothing waits for them forever.
+
+        :param error: Exception the pending futures fail with, by default a ConnectionError.
+        """
+        with self._condition:
+            self._closed = True
+            dropped, self._timers = self._timers, []
+            self._condition.notify()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        for _, _, callback, args in dropped:
+            if callback == self._settle:
+                self._settle(args[0], None, error or ConnectionError(f'{self._name} closed'))
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if not self._timers:
+                        self._condition.wait()
+                        continue
+                    delay = self._timers[0][0] - time.monotonic()
+                    if delay <= 0:
+                        break
+                    self._condition.wait(delay)
+                if self._closed:
+                    return
+                _, _, callback, args = heapq.heappop(self._timers)
+                if callback is None:
+                    self._cancelled -= 1
+                    continue
+            try:
+                callback(*args)
+            except Exception:
+                logger.exception('Error in timer callback %r', callback)
+
+
+class MMBackend(object):
+    """
+    Transport ModemManager and the wrappers talk to the daemon through.
+
+    A backend builds proxies of D-Bus objects, sends method calls and delivers signals. Proxies expose the
+    methods, properties and signals of their object as attributes, as pydbus proxies do, and give the
+    per-interface proxy with proxy[interface].
+
+    Implementations:
+        PydbusBackend: pydbus on GDBus; signals are delivered while a GLib main loop runs.
+        SocketBackend: pure-Python D-Bus client on a unix socket; needs neither gi nor a main loop.
+        FakeBackend: in-process simulation of the daemon with synthetic modems, for load tests.
+        RecordingBackend: records the traffic of another backend to a file.
+        ReplayBackend: serves a recording without a bus.
+    """
+    BUS_NAME = 'org.freedesktop.ModemManager1'
+
+    @property
+    def dispatching(self) -> bool:
+        """
+        Whether signals are being delivered right now.
+        """
+        raise NotImplementedError
+
+    def proxy_class(self, node: ET.Element) -> Callable[[str], object]:
+        """
+        Build a proxy factory from a <node> introspection element.
+
+        :return: Callable taking an object path and returning the proxy of that object.
+        """
+        raise NotImplementedError
+
+    def introspect(self, path: str):
+        """
+        Build the proxy of an object by introspecting it. The proxy describes every interface of the object.
+        """
+        raise NotImplementedError
+
+    def method_signature(self, proxy, interface: str, method: str) -> str:
+        """
+        Input signature of a method, as described by a proxy built by this backend.
+        """
+        raise NotImplementedError
+
+    def call_async(self, path: str, interface: str, method: str, signature: str, args: tuple,
+                   timeout: float = None) -> Future:
+        """
+        Send a method call without waiting for its reply.
+
+        :return: Future resolved with None, the single output argument, or a tuple of output arguments.
+        """
+        raise NotImplementedError
+
+    def call(self, path: str, interface: str, method: str, signature: str, args: tuple, timeout: float = None):
+        """
+        Call a method and wait for the reply.
+
+        :return: None, the single output argument, or a tuple of output arguments.
+        """
+        return self.call_async(path, interface, method, signature, args, timeout).result()
+
+    def gather(self, futures: List[Future], timeout: float = None) -> List:
+        """
+        Wait for the futures returned by call_async().
+
+        :return: The results, in the order of the futures. The first failed call raises its exception.
+        """
+        wait(futures, timeout=timeout)
+        return [f.result(timeout=0) for f in futures]
+
+    def subscribe(self, sender: str, path_namespace: str, callback: Callable[[str, str, str, tuple], None]):
+        """
+        Deliver every signal a bus name emits below an object path to one callback, with a single match rule.
+
+        :param sender: Bus name emitting the signals.
+        :param path_namespace: Object path the signals are emitted on or below.
+        :param callback: Called with the object path, interface, member and arguments of each signal.
+        """
+        raise NotImplementedError
+
+    def watch_name_owner(self, name: str, callback: Callable[[str, str], None]):
+        """
+        Follow the owner of a well-known bus name.
+
+        :param name: Bus name, e.g. "org.freedesktop.ModemManager1".
+        :param callback: Called with the old and the new unique name of the owner whenever it changes;
+            an empty string stands for no owner.
+        """
+        raise NotImplementedError
+
+    def timed_out(self, error: BaseException) -> bool:
+        """
+        Whether an error raised by a call means it got no reply in time.
+        """
+        return False
+
+    def wakeup(self):
+        """
+        Wake up a thread waiting in gather(), e.g. after a call was cancelled.
+        """
+
+    def start(self):
+        """
+        Start delivering signals, for backends that need a loop to run.
+        """
+
+    def close(self):
+        """
+        Stop delivering signals and release the connection's threads.
+        """
+
+
+def default_backend(main_loop=None, system_bus=None) -> MMBackend:
+    """
+    The pydbus backend if gi and pydbus can be imported, otherwise the socket backend.
+
+    :param main_loop: GLib main loop signals are delivered on, for the pydbus backend.
+    :param system_bus: Bus to use instead of the system bus, for the pydbus backend.
+    """
+    try:
+        from PydbusBackend import PydbusBackend
+    except ImportError:
+        if main_loop is not None or system_bus is not None:
+            raise
+        from SocketBackend import SocketBackend
+        return SocketBackend()
+    return PydbusBackend(main_loop, system_bus)
@@ -0,0 +1,100 @@
+import threading
+from typing import Callable, List, Optional
+
+
+class MMTimeoutError(TimeoutError):
+    """
+    A method call got no reply within its timeout.
+    """
+
+    def __init__(self, path: str, interface: str, method: str, timeout: Optional[float]):
+        limit = 'the D-Bus default timeout' if timeout is None else f'{timeout}s'
+        super().__init__(f'{interface}.{method} on {path} got no reply within {limit}')
+        self.path = path
+        self.interface = interface
+        self.method = method
+        self.timeout = timeout
+
+
+class MMWaitTimeoutError(TimeoutError):
+    """
+    A property did not reach an awaited value within the timeout, e.g. in Modem.wait_for_state().
+    """
+
+    def __init__(self, path: str, interface: str, name: str, value, timeout: Optional[float]):
+        super().__init__(f'{interface}.{name} on {path} still {value!r} after {timeout}s')
+        self.path = path
+        self.interface = interface
+        self.name = name
+        self.value = value
+        self.timeout = timeout
+
+
+class MMGoneError(LookupError):
+    """
+    The object is no longer exported, e.g. a modem that did not come back after the daemon restarted,
+    or the daemon itself is not running.
+    """
+
+
+class MMCancelledError(Exception):
+    """
+    A method call was abandoned through its CancelToken.
+
+    The daemon may still carry out a call that was already sent; only the wait for its reply is abandoned.
+    """
+
+
+class CancelToken(object):
+    """
+    Cancellation token for one or more method calls:
+
+        token = CancelToken()
+        worker: modem.Reset(cancel=token)
+        elsewhere: token.cancel()  # the worker raises MMCancelledError right away
+
+    A token stays cancelled; calls started with a cancelled token fail without being sent.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._callbacks: List[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self):
+        """
+        Cancel every call waiting on this token.
+        """
+        with self._lock:
+            if self._cancelled:
+                return
+            self._cancelled = True
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def raise_if_cancelled(self):
+        if self._cancelled:
+            raise MMCancelledError('Call cancelled')
+
+    def add_callback(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """
+        Call callback when the token is cancelled, or right away if it already is.
+
+        :return: Function removing the callback again.
+        """
+        with self._lock:
+            if not self._cancelled:
+                self._callbacks.append(callback)
+                return lambda: self._remove(callback)
+        callback()
+        return lambda: None
+
+    def _remove(self, callback: Callable[[], None]):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
@@ -1,14 +1,176 @@
+import enum
+import time
+from concurrent.futures import Future, InvalidStateError
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Iterable, List, Tuple, Union
+
+import MMIntrospection
+from DBusSocket import split_signature
+from MMErrors import CancelToken, MMCancelledError, MMGoneError, MMWaitTimeoutError
+from PropertyStream import PropertyChange, PropertyStream
+
+
+class Forward(object):
+    """
+    Class-level descriptor forwarding one attribute to the wrapped proxy.
+    """
+    __slots__ = ('name',)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return getattr(obj._instance, self.name)
+
+
+def settle(setter: Callable, value):
+    """
+    Resolve a future unless it already is, e.g. when a reply and a cancellation race to resolve it.
+    """
+    try:
+        setter(value)
+    except InvalidStateError:
+        pass
+
+
+def _keep(value):
+    return value
+
+
+@lru_cache(maxsize=None)
+def plain_converter(signature: str) -> Callable:
+    """
+    Converter copying a value of one complete type, as unpacked by the pydbus or socket backend, into new plain
+    Python containers: dictionaries, lists for arrays, tuples for structs and bytes for byte arrays. Values of
+    basic types and variants are kept as they are.
+
+    Converters are compiled once per signature and copy a value in one pass, so callers get a value they can
+    change without changing the property cache.
+    """
+    token = signature[0]
+    if token == '(':
+        members = tuple(plain_converter(member) for member in split_signature(signature[1:-1]))
+        if all(member is _keep for member in members):
+            return tuple
+        return lambda value: tuple(member(v) for member, v in zip(members, value))
+    if token != 'a':
+        return _keep
+    element = signature[1:]
+    if element == 'y':
+        return bytes
+    if element[0] == '{':
+        key_type, value_type = split_signature(element[1:-1])
+        value_converter = plain_converter(value_type)
+        if value_converter is _keep:
+            return dict
+        return lambda value: {k: value_converter(v) for k, v in value.items()}
+    element_converter = plain_converter(element)
+    if element_converter is _keep:
+        return list
+    return lambda value: [element_converter(v) for v in value]
+
+
+@lru_cache(maxsize=None)
+def property_converter(interface: str, name: str) -> Callable:
+    """
+    plain_converter() of a property, from its signature in the newest bundled interface set.
+    """
+    signature = MMIntrospection.property_signature(MMIntrospection.latest_version(), interface, name)
+    return _keep if signature is None else plain_converter(signature)
+
+
+def target_values(targets: Union[enum.Enum, int, Iterable]) -> FrozenSet:
+    """
+    Raw values of one awaited enum member or value, or of several.
+    """
+    if isinstance(targets, (enum.Enum, int)):
+        targets = (targets,)
+    return frozenset(target.value if isinstance(target, enum.Enum) else target for target in targets)
+
+
+@contextmanager
+def observed(manager, name: str, path: str, args: tuple = None):
+    """
+    Record the block in the manager's metrics and, if a tracer is set, as a span.
+    """
+    with manager.metrics.measure(name, path):
+        if manager.tracer is None:
+            yield
+        else:
+            with manager.tracer.span(name, path, args):
+                yield
+
+
+class GoneProxy(object):
+    """
+    Stand-in for the proxy of an object the daemon stopped exporting when it restarted.
+    """
+    __slots__ = ('_path',)
+
+    def __init__(self, path: str):
+        self._path = path
+
+    def __getattr__(self, item):
+        raise MMGoneError(f'{self._path} is no longer exported by ModemManager')
+
+    def __getitem__(self, item):
+        raise MMGoneError(f'{self._path} is no longer exported by ModemManager')
+
+
 class MMInterface(object):
     BUS_NAME = 'org.freedesktop.ModemManager1'
+    INTERFACE = 'org.freedesktop.ModemManager1'
+    PROPERTIES_INTERFACE = 'org.freedesktop.DBus.Properties'
+    FORWARDED: Tuple[str, ...] = ()
+    """
+    Proxy members without a wrapper method or property, forwarded as-is.
+    Subclasses may opt into a dict-free layout by declaring __slots__ = ().
+    """
+    FORWARDED_INTERFACES: Tuple[str, ...] = ()
+    """
+    Interfaces whose bundled members without a wrapper method or property are forwarded as-is, defaults to
+    INTERFACE and the interfaces named below it, e.g. Modem.Messaging for Modem.
+    """
+    IDENTITY: Tuple[str, ...] = ()
+    """
+    Properties identifying the same object across daemon restarts, which may export it under another path.
+    """
+
+    __slots__ = ('_manager', '_instance', '_properties', '_subscription', '_streams', '__weakref__')
+
+    PropertiesChanged = Forward('PropertiesChanged')
 
-    def __init__(self, manager=None):
+    def __init_subclass__(cls, **kwargs):
+        # forwarding descriptors are made once per class, from the bundled introspection data
+        super().__init_subclass__(**kwargs)
+        names = set(cls.FORWARDED)
+        if cls.FORWARDED_INTERFACES:
+            for interface in cls.FORWARDED_INTERFACES:
+                names.update(MMIntrospection.member_names(interface))
+        else:
+            names.update(MMIntrospection.member_names(cls.INTERFACE, sub_interfaces=True))
+        for name in sorted(names):
+            if not hasattr(cls, name):
+                setattr(cls, name, Forward(name))
+
+    def __init__(self, manager=None, instance=None, properties: Dict[str, Dict[str, object]] = None):
         self._manager = manager
-        self._instance = None
+        self._instance = instance
+        self._properties: Dict[str, Dict[str, object]] = {}
+        self._subscription = None
+        self._streams: List[PropertyStream] = []
+        if properties:
+            self.seed_properties(properties)
 
     def __getattr__(self, item):
-        if not hasattr(self, item):
-            return getattr(self._instance, item)
-        return getattr(self, item)
+        # Only reached for members missing from the bundled interfaces, e.g. of a newer daemon. Private names
+        # are never forwarded, so a missing _instance raises AttributeError instead of recursing.
+        if item.startswith('_'):
+            raise AttributeError(item)
+        return getattr(self._instance, item)
 
     @property
     def path(self) -> str:
@@ -16,3 +178,211 @@ class MMInterface(object):
 
     def get_object(self, path):
         return self._manager.get_object(path)
+
+    def _call(self, method: str, *args, interface: str = None, timeout: float = None, cancel: CancelToken = None,
+              metric: str = None):
+        self._ensure_current()
+        path = self.path
+        with observed(self._manager, metric or self._metric_name(method, interface), path, args):
+            return self._manager.call(path, interface or self.INTERFACE, method, args, timeout, cancel)
+
+    def _metric_name(self, member: str, interface: str = None) -> str:
+        # "Modem.Command" for the wrapper's own interface, "Simple.Connect" or "Properties.GetAll" for others
+        if interface is None or interface == self.INTERFACE:
+            return f'{type(self).__name__}.{member}'
+        return f'{interface.rsplit(".", 1)[-1]}.{member}'
+
+    def _ensure_current(self):
+        # the first call after a daemon restart re-enumerates the objects, the others wait for it
+        if self._manager._stale:
+            self._manager.recover()
+        if isinstance(self._instance, GoneProxy):
+            raise MMGoneError(f'{self.path} is no longer exported by ModemManager')
+
+    def call_async(self, method: str, *args, interface: str = None, timeout: float = None,
+                   cancel: CancelToken = None) -> Future:
+        """
+        Send a method call on this object without waiting for the reply, e.g. modem.call_async('Enable', True).
+
+        See ModemManager.call_async(); collect the futures with ModemManager.gather().
+        :param method: Method name.
+        :param args: Method arguments.
+        :param interface: Interface of the method, defaults to the wrapper's interface.
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token failing the future with MMCancelledError when cancelled.
+        """
+        self._ensure_current()
+        path = self.path
+        name = self._metric_name(method, interface)
+        metrics = self._manager.metrics
+        tracer = self._manager.tracer
+        span = tracer.begin(name, path, args) if tracer is not None else None
+        start = time.perf_counter()
+        future = self._manager.call_async(path, interface or self.INTERFACE, method, args, timeout, cancel)
+
+        def done(f: Future):
+            error = MMCancelledError('Call cancelled') if f.cancelled() else f.exception()
+            metrics.record(name, path, time.perf_counter() - start, error is not None)
+            if span is not None:
+                tracer.end(span, error)
+
+        future.add_done_callback(done)
+        return future
+
+    def seed_properties(self, properties: Dict[str, Dict[str, object]]):
+        """
+        Fill the property cache from an interface -> properties mapping,
+        as returned per object by ObjectManager.GetManagedObjects().
+
+        The cache is kept current from the PropertiesChanged signal, so it is only served while the backend
+        delivers signals; the pydbus backend does so only while a GLib main loop is running. Otherwise every
+        property read is a Properties.Get call, whose value refreshes the cache.
+        :param properties: Dictionary of interface name to property dictionary.
+        """
+        for interface, values in properties.items():
+            self._properties[interface] = dict(values)
+        self._watch_properties()
+
+    def subscribe(self, properties: Iterable[str] = None, callback: Callable[[PropertyChange], None] = None,
+                  coalesce: float = 0.0, debounce: float = 0.0, interfaces: Iterable[str] = None) -> PropertyStream:
+        """
+        Subscribe to property changes of this object.
+
+        See PropertyStream for how the coalesce and debounce windows merge bursts of changes.
+        :param properties: Names of the properties to follow, defaults to all.
+        :param callback: Called with each PropertyChange; if omitted, iterate over the returned stream instead.
+        :param coalesce: Seconds after the first held change at which held changes are delivered.
+        :param debounce: Seconds without a new change after which held changes are delivered.
+        :param interfaces: Interfaces to follow, defaults to all interfaces of the object.
+        :return: The stream; close it to unsubscribe.
+        """
+        if self.INTERFACE not in self._properties:
+            # old values of the events come from the property cache
+            self.seed_properties({self.INTERFACE: self._call('GetAll', self.INTERFACE,
+                                                             interface=self.PROPERTIES_INTERFACE)})
+        stream = PropertyStream(self, properties, interfaces, callback, coalesce, debounce, self._manager.timers)
+        self._streams.append(stream)
+        self._watch_properties()
+        return stream
+
+    def _unsubscribe(self, stream: PropertyStream):
+        if stream in self._streams:
+            self._streams.remove(stream)
+
+    def connect_signal(self, member: str, callback: Callable, interface: str = None):
+        """
+        Connect a handler to a signal of this object through the manager's namespace-wide subscription,
+        instead of the per-proxy match rule `wrapper.StateChanged.connect(...)` would add.
+
+        :param member: Signal name, e.g. "StateChanged".
+        :param callback: Called with the signal arguments.
+        :param interface: Interface of the signal, defaults to the wrapper's interface.
+        :return: Handle with a disconnect() method.
+        """
+        return self._manager.signals.connect(self.path, interface or self.INTERFACE, member, callback)
+
+    def _watch_properties(self):
+        if self._subscription is None and self._instance is not None:
+            self._subscription = self.connect_signal('PropertiesChanged', self._on_properties_changed,
+                                                     self.PROPERTIES_INTERFACE)
+
+    def _get_property(self, name: str):
+        properties = self._properties.get(self.INTERFACE)
+        if self._manager.backend.dispatching and properties is not None and name in properties:
+            return properties[name]
+        return self._read_property(name)
+
+    def _get_plain_property(self, name: str):
+        # container properties are copied, so callers cannot change the property cache
+        value = self._get_property(name)
+        return None if value is None else property_converter(self.INTERFACE, name)(value)
+
+    def _read_property(self, name: str):
+        # concurrent reads of the same property share one Get call
+        value = self._manager._reads.do((self.path, self.INTERFACE, name),
+                                        lambda: self._call('Get', self.INTERFACE, name,
+                                                           interface=self.PROPERTIES_INTERFACE,
+                                                           metric=self._metric_name(name)))
+        properties = self._properties.get(self.INTERFACE)
+        if properties is not None and not self._manager.backend.dispatching:
+            # without signals nothing else keeps the cache current
+            properties[name] = value
+        return value
+
+    def _get_all(self, timeout: float = None, cancel: CancelToken = None) -> Dict[str, object]:
+        # recorded as "Modem.snapshot" rather than "Properties.GetAll", to tell the wrapper types apart
+        properties = self._call('GetAll', self.INTERFACE, interface=self.PROPERTIES_INTERFACE, timeout=timeout,
+                                cancel=cancel, metric=f'{type(self).__name__}.snapshot')
+        if self.INTERFACE in self._properties:
+            self._properties[self.INTERFACE].update(properties)
+        return properties
+
+    def _wait_for(self, name: str, targets, timeout: float = None, cancel: CancelToken = None,
+                  signal: str = None):
+        """
+        Wait until a property of this interface takes one of the target values. Changes are taken from a
+        signal carrying the new value as its second argument, e.g. StateChanged, or else from PropertiesChanged.
+        The handler is connected before the current value is read with its own Get call, bypassing the property
+        cache and reads already in flight, so no change is missed in between.
+
+        :return: The value reached.
+        :raises MMWaitTimeoutError: The value was not reached within the timeout; it reports the last value seen.
+        """
+        wanted = target_values(targets)
+        future = Future()
+        future.set_running_or_notify_cancel()
+        changes = []
+
+        if signal is not None:
+            def on_signal(*args):
+                changes.append(args[1])
+                if args[1] in wanted:
+                    settle(future.set_result, args[1])
+
+            handle = self.connect_signal(signal, on_signal)
+        else:
+            def on_signal(interface: str, changed: Dict[str, object], invalidated: List[str]):
+                if interface != self.INTERFACE or name not in changed:
+                    return
+                changes.append(changed[name])
+                if changed[name] in wanted:
+                    settle(future.set_result, changed[name])
+
+            handle = self.connect_signal('PropertiesChanged', on_signal, self.PROPERTIES_INTERFACE)
+        remove = None
+        if cancel is not None:
+            def on_cancel():
+                settle(future.set_exception, MMCancelledError(f'Waiting for {name} of {self.path} cancelled'))
+                self._manager.backend.wakeup()
+
+            remove = cancel.add_callback(on_cancel)
+        try:
+            value = self._call('Get', self.INTERFACE, name, interface=self.PROPERTIES_INTERFACE, cancel=cancel,
+                               metric=self._metric_name(name))
+            if value in wanted:
+                return value
+            # changes delivered before the reply are older than the value read
+            read = len(changes)
+            try:
+                return self._manager.gather([future], timeout)[0]
+            except TimeoutError:
+                last = changes[-1] if len(changes) > read else value
+                raise MMWaitTimeoutError(self.path, self.INTERFACE, name, last, timeout) from None
+        finally:
+            handle.disconnect()
+            if remove is not None:
+                remove()
+
+    def _on_properties_changed(self, interface: str, changed: Dict[str, object], invalidated: List[str]):
+        properties = self._properties.get(interface)
+        if self._streams:
+            old = properties or {}
+            for name, value in changed.items():
+                change = PropertyChange(self.path, interface, name, old.get(name), value)
+                for stream in list(self._streams):
+                    stream._push(change)
+        if properties is None:
+            return
+        properties.update(changed)
+        for name in invalidated:
+            properties.pop(name, None)
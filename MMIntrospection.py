@@ -0,0 +1,167 @@
+"""
+Interface descriptions bundled with the wrapper, so proxies can be built without an Introspect round trip.
+The org.freedesktop.ModemManager1.* sets are generated per ModemManager version by tools/introspection_generator.py.
+"""
+
+import xml.etree.ElementTree as ET
+from functools import lru_cache
+from typing import FrozenSet, Iterable, Optional
+
+from MMIntrospectionData import INTROSPECTION
+
+STANDARD = {
+    'org.freedesktop.DBus.Properties': '''
+<interface name="org.freedesktop.DBus.Properties">
+  <method name="Get">
+    <arg name="interface_name" type="s" direction="in"/>
+    <arg name="property_name" type="s" direction="in"/>
+    <arg name="value" type="v" direction="out"/>
+  </method>
+  <method name="GetAll">
+    <arg name="interface_name" type="s" direction="in"/>
+    <arg name="properties" type="a{sv}" direction="out"/>
+  </method>
+  <method name="Set">
+    <arg name="interface_name" type="s" direction="in"/>
+    <arg name="property_name" type="s" direction="in"/>
+    <arg name="value" type="v" direction="in"/>
+  </method>
+  <signal name="PropertiesChanged">
+    <arg name="interface_name" type="s"/>
+    <arg name="changed_properties" type="a{sv}"/>
+    <arg name="invalidated_properties" type="as"/>
+  </signal>
+</interface>
+''',
+    'org.freedesktop.DBus.Introspectable': '''
+<interface name="org.freedesktop.DBus.Introspectable">
+  <method name="Introspect">
+    <arg name="xml_data" type="s" direction="out"/>
+  </method>
+</interface>
+''',
+    'org.freedesktop.DBus.Peer': '''
+<interface name="org.freedesktop.DBus.Peer">
+  <method name="Ping"/>
+  <method name="GetMachineId">
+    <arg name="machine_uuid" type="s" direction="out"/>
+  </method>
+</interface>
+''',
+    'org.freedesktop.DBus.ObjectManager': '''
+<interface name="org.freedesktop.DBus.ObjectManager">
+  <method name="GetManagedObjects">
+    <arg name="objects" type="a{oa{sa{sv}}}" direction="out"/>
+  </method>
+  <signal name="InterfacesAdded">
+    <arg name="object_path" type="o"/>
+    <arg name="interfaces_and_properties" type="a{sa{sv}}"/>
+  </signal>
+  <signal name="InterfacesRemoved">
+    <arg name="object_path" type="o"/>
+    <arg name="interfaces" type="as"/>
+  </signal>
+</interface>
+''',
+}
+
+COMMON_INTERFACES = ('org.freedesktop.DBus.Properties', 'org.freedesktop.DBus.Introspectable',
+                     'org.freedesktop.DBus.Peer')
+
+
+def _version_key(version: str):
+    return tuple(int(x) for x in version.split('.'))
+
+
+def latest_version() -> str:
+    """
+    The newest ModemManager version with a bundled interface set.
+    """
+    return max(INTROSPECTION, key=_version_key)
+
+
+def select_version(version: str) -> Optional[str]:
+    """
+    Select the bundled interface set matching a ModemManager version.
+
+    :param version: Runtime version of the daemon, e.g. "1.18.6", as reported by ModemManager.Version.
+    :return: Key of the bundled set with the same major.minor version, or None if there is none.
+    """
+    key = '.'.join(version.split('.')[:2])
+    if key in INTROSPECTION:
+        return key
+    return None
+
+
+@lru_cache(maxsize=None)
+def interface_element(version: str, interface: str) -> Optional[ET.Element]:
+    """
+    Parsed <interface> element of a bundled interface, or None if it is not bundled for that version.
+    """
+    xml = STANDARD.get(interface) or INTROSPECTION.get(version, {}).get(interface)
+    if xml is None:
+        return None
+    return ET.fromstring(xml)
+
+
+def build_node(version: str, interfaces: Iterable[str]) -> Optional[ET.Element]:
+    """
+    Build the <node> introspection of an object implementing the given interfaces,
+    plus the standard Properties, Introspectable and Peer interfaces.
+
+    :param version: Key of a bundled interface set, see select_version().
+    :param interfaces: Interfaces implemented by the object.
+    :return: The node element, or None if any of the interfaces is not bundled.
+    """
+    node = ET.Element('node')
+    for interface in dict.fromkeys(tuple(interfaces) + COMMON_INTERFACES):
+        element = interface_element(version, interface)
+        if element is None:
+            return None
+        node.append(element)
+    return node
+
+
+def method_signature(version: str, interface: str, method: str) -> Optional[str]:
+    """
+    D-Bus signature of the input arguments of a bundled method.
+
+    :return: The concatenated "in" argument types, or None if the method is not bundled for that version.
+    """
+    element = interface_element(version, interface)
+    if element is None:
+        return None
+    for member in element.iter('method'):
+        if member.attrib['name'] == method:
+            return ''.join(arg.attrib['type'] for arg in member.iter('arg')
+                           if arg.attrib.get('direction', 'in') == 'in')
+    return None
+
+
+def property_signature(version: str, interface: str, name: str) -> Optional[str]:
+    """
+    D-Bus signature of a bundled property, or None if the property is not bundled for that version.
+    """
+    element = interface_element(version, interface)
+    if element is None:
+        return None
+    for member in element.iter('property'):
+        if member.attrib['name'] == name:
+            return member.attrib['type']
+    return None
+
+
+@lru_cache(maxsize=None)
+def member_names(interface: str, sub_interfaces: bool = False) -> FrozenSet[str]:
+    """
+    Names of the methods, properties and signals of an interface in any bundled version.
+
+    :param sub_interfaces: Include the interfaces named below it, e.g. Modem.Messaging for Modem.
+    """
+    names = set()
+    for version, bundled in INTROSPECTION.items():
+        for name in (*STANDARD, *bundled):
+            if name == interface or (sub_interfaces and name.startswith(interface + '.')):
+                names.update(member.attrib['name'] for member in interface_element(version, name)
+                             if member.tag in ('method', 'property', 'signal'))
+    return frozenset(names)
@@ -0,0 +1,420 @@
+INTROSPECTION = {
+    '1.18': {
+        'org.freedesktop.ModemManager1.Bearer': '''
+<interface name="org.freedesktop.ModemManager1.Bearer">
+  <method name="Connect"/>
+  <method name="Disconnect"/>
+  <property name="Interface" type="s" access="read"/>
+  <property name="Connected" type="b" access="read"/>
+  <property name="ConnectionError" type="(ss)" access="read"/>
+  <property name="Suspended" type="b" access="read"/>
+  <property name="Multiplexed" type="b" access="read"/>
+  <property name="Ip4Config" type="a{sv}" access="read"/>
+  <property name="Ip6Config" type="a{sv}" access="read"/>
+  <property name="Stats" type="a{sv}" access="read"/>
+  <property name="IpTimeout" type="u" access="read"/>
+  <property name="BearerType" type="u" access="read"/>
+  <property name="ProfileId" type="i" access="read"/>
+  <property name="Properties" type="a{sv}" access="read"/>
+</interface>
+''',
+        'org.freedesktop.ModemManager1.Call': '''
+<interface name="org.freedesktop.ModemManager1.Call">
+  <method name="Start"/>
+  <method name="Accept"/>
+  <method name="Deflect">
+    <arg name="number" type="s" direction="in"/>
+  </method>
+  <method name="JoinMultiparty"/>
+  <method name="LeaveMultiparty"/>
+  <method name="Hangup"/>
+  <method name="SendDtmf">
+    <arg name="dtmf" type="s" direction="in"/>
+  </method>
+  <signal name="DtmfReceived">
+    <arg name="dtmf" type="s"/>
+  </signal>
+  <signal name="StateChanged">
+    <arg name="old" type="i"/>
+    <arg name="new" type="i"/>
+    <arg name="reason" type="u"/>
+  </signal>
+  <property name="State" type="i" access="read"/>
+  <property name="StateReason" type="i" access="read"/>
+  <property name="Direction" type="i" access="read"/>
+  <property name="Number" type="s" access="read"/>
+  <property name="Multiparty" type="b" access="read"/>
+  <property name="AudioPort" type="s" access="read"/>
+  <property name="AudioFormat" type="a{sv}" access="read"/>
+</interface>
+''',
+        'org.freedesktop.ModemManager1.Modem.Firmware': '''
+<interface name="org.freedesktop.ModemManager1.Modem.Firmware">
+  <method name="List">
+    <arg name="selected" type="s" direction="out"/>
+    <arg name="installed" type="aa{sv}" direction="out"/>
+  </method>
+  <method name="Select">
+    <arg name="uniqueid" type="s" direction="in"/>
+  </method>
+  <property name="UpdateSettings" type="(ua{sv})" access="read"/>
+</interface>
+''',
+        'org.freedesktop.ModemManager1.Modem.Location': '''
+<interface name="org.freedesktop.ModemManager1.Modem.Location">
+  <method name="Setup">
+    <arg name="sources" type="u" direction="in"/>
+    <arg name="signal_location" type="b" direction="in"/>
+  </method>
+  <method name="GetLocation">
+    <arg name="Location" type="a{uv}" direction="out"/>
+  </method>
+  <method name="SetSuplServer">
+    <arg name="supl" type="s" direction="in"/>
+  </method>
+  <method name="InjectAssistanceData">
+    <arg name="data" type="ay" direction="in"/>
+  </method>
+  <method name="SetGpsRefreshRate">
+    <arg name="rate" type="u" direction="in"/>
+  </method>
+  <property name="Capabilities" type="u" access="read"/>
+  <property name="SupportedAssistanceData" type="u" access="read"/>
+  <property name="Enabled" type="u" access="read"/>
+  <property name="SignalsLocation" type="b" access="read"/>
+  <property name="Location" type="a{uv}" access="read"/>
+  <property name="SuplServer" type="s" access="read"/>
+  <property name="AssistanceDataServers" type="as" access="read"/>
+  <property name="GpsRefreshRate" type="u" access="read"/>
+</interface>
+''',
+        'org.freedesktop.ModemManager1.Modem.Messaging': '''
+<interface name="org.freedesktop.ModemManager1.Modem.Messaging">
+  <method name="List">
+    <arg name="result" type="ao" direction="out"/>
+  </method>
+  <method name="Delete">
+    <arg name="path" type="o" direction="in"/>
+  </method>
+  <method name="Create">
+    <arg name="properties" type="a{sv}" direction="in"/>
+    <arg name="path" type="o" direction="out"/>
+  </method>
+  <signal name="Added">
+    <arg name="path" type="o"/>
+    <arg name="received" type="b"/>
+  </signal>
+  <signal name="Deleted">
+    <arg name="path" type="o"/>
+  </signal>
+  <property name="Messages" type="ao" access="read"/>
+  <property name="SupportedStorages" type="au" access="read"/>
+  <property name="DefaultStorage" type="u" access="read"/>
+</interface>
+''',
+        'org.freedesktop.ModemManager1.Modem.Modem3gpp.ProfileManager': '''
+<interface name="org.freedesktop.ModemManager1.Modem.Modem3gpp.ProfileManager">
+  <method name="List">
+    <arg name="profiles" type="aa{sv}" direction="out"/>
+  </method>
+  <method name="Set">
+    <arg name="requested" type="a{sv}" direction="in"/>
+    <arg name="stored" type="a{sv}" direction="out"/>
+  </method>
+  <method name="Delete">
+    <arg name="properties" type="a{sv}" direction="in"/>
+  </method>
+  <signal name="Updated"/>
+</interface>
+''',
+        'org.freedesktop.ModemManager1.Modem.Modem3gpp.Ussd': '''
+<interface name="org.freedesktop.ModemManager1.Modem.Modem3gpp.Ussd">
+  <method name="Initiate">
+    <arg name="command" type="s" direction="in"/>
+    <arg name="reply" type="s" direction="out"/>
+  </method>
+  <method name="Respond">
+    <arg name="response" type="s" direction="in"/>
+    <arg name="reply" type="s" direction="out"/>
+  </method>
+  <method name="Cancel"/>
+  <property name="State" type="u" access="read"/>
+  <property name="NetworkNotification" type="s" access="read"/>
+  <property name="NetworkRequest" type="s" access="read"/>
+</interface>
+''',
+        'org.freedesktop.ModemManager1.Modem.Modem3gpp': '''
+<interface name="org.freedesktop.ModemManager1.Modem.Modem3gpp">
+  <method name="Register">
+    <arg name="operator_id" type="s" direction="in"/>
+  </method>
+  <method name="Scan">
+    <arg name="results" type="aa{sv}" direction="out"/>
+  </method>
+  <method name="SetEpsUeModeOperation">
+    <arg name="mode" type="u" direction="in"/>
+  </method>
+  <method name="SetInitialEpsBearerSettings">
+    <arg name="settings" type="a{sv}" direction="in"/>
+  </method>
+  <method name="DisableFacilityLock">
+    <arg name="properties" type="(us)" direction="in"/>
+  </method>
+  <property name="Imei" type="s" access="read"/>
+  <property name="RegistrationState" type="u" access="read"/>
+  <property name="OperatorCode" type="s" access="read"/>
+  <property name="OperatorName" type="s" access="read"/>
+  <property name="EnabledFacilityLocks" type="u" access="read"/>
+  <property name="SubscriptionState" type="u" access="read"/>
+  <property name="EpsUeModeOperation" type="u" access="read"/>
+  <property name="Pco" type="a(ubay)" access="read"/>
+  <property name="InitialEpsBearer" type="o" access="read"/>
+  <property name="InitialEpsBearerSettings" type="a{sv}" access="read"/>
+</interface>
+''',
+        'org.freedesktop.ModemManager1.Modem.ModemCdma': '''
+<interface name="org.freedesktop.ModemManager1.Modem.ModemCdma">
+  <method name="Activate">
+    <arg name="carrier_code" type="s" direction="in"/>
+  </method>
+  <method name="ActivateManual">
+    <arg name="properties" type="a{sv}" direction="in"/>
+  </method>
+  <signal name="ActivationStateChanged">
+    <arg name="activation_state" type="u"/>
+    <arg name="activation_error" type="u"/>
+    <arg name="status_changes" type="a{sv}"/>
+  </signal>
+  <property name="ActivationState" type="u" access="read"/>
+  <property name="Meid" type="s" access="read"/>
+  <property name="Esn" type="s" access="read"/>
+  <property name="Sid" type="u" access="read"/>
+  <property name="Nid" type="u" access="read"/>
+  <property name="Cdma1xRegistrationState" type="u" access="read"/>
+  <property name="EvdoRegistrationState" type="u" access="read"/>
+</interface>
+''',
+        'org.freedesktop.ModemManager1.Modem.Signal': '''
+<interface name="org.freedesktop.ModemManager1.Modem.Signal">
+  <method name="Setup">
+    <arg name="rate" type="u" direction="in"/>
+  </method>
+  <property name="Rate" type="u" access="read"/>
+  <property name="Cdma" type="a{sv}" access="read"/>
+  <property name="Evdo" type="a{sv}" access="read"/>
+  <property name="Gsm" type="a{sv}" access="read"/>
+  <property name="Umts" type="a{sv}" access="read"/>
+  <property name="Lte" type="a{sv}" access="read"/>
+  <property name="Nr5g" type="a{sv}" access="read"/>
+</interface>
+''',
+        'org.freedesktop.ModemManager1.Modem.Simple': '''
+<interface name="org.freedesktop.ModemManager1.Modem.Simple">
+  <method name="Connect">
+    <arg name="properties" type="a{sv}" direction="in"/>
+    <arg name="bearer" type="o" direction="out"/>
+  </method>
+  <method name="Disconnect">
+    <arg name="bearer" type="o" direction="in"/>
+  </method>
+  <method name="GetStatus">
+    <arg name="properties" type="a{sv}" direction="out"/>
+  </method>
+</interface>
+''',
+        'org.freedesktop.ModemManager1.Modem.Time': '''
+<interface name="org.freedesktop.ModemManager1.Modem.Time">
+  <method name="GetNetworkTime">
+    <arg name="time" type="s" direction="out"/>
+  </method>
+  <signal name="NetworkTimeChanged">
+    <arg name="time" type="s"/>
+  </signal>
+  <property name="NetworkTimezone" type="a{sv}" access="read"/>
+</interface>
+''',
+        'org.freedesktop.ModemManager1.Modem.Voice': '''
+<interface name="org.freedesktop.ModemManager1.Modem.Voice">
+  <method name="ListCalls">
+    <arg name="result" type="ao" direction="out"/>
+  </method>
+  <method name="DeleteCall">
+    <arg name="path" type="o" direction="in"/>
+  </method>
+  <method name="CreateCall">
+    <arg name="properties" type="a{sv}" direction="in"/>
+    <arg name="path" type="o" direction="out"/>
+  </method>
+  <method name="HoldAndAccept"/>
+  <method name="HangupAndAccept"/>
+  <method name="HangupAll"/>
+  <method name="Transfer"/>
+  <method name="CallWaitingSetup">
+    <arg name="enable" type="b" direction="in"/>
+  </method>
+  <method name="CallWaitingQuery">
+    <arg name="status" type="b" direction="out"/>
+  </method>
+  <signal name="CallAdded">
+    <arg name="path" type="o"/>
+  </signal>
+  <signal name="CallDeleted">
+    <arg name="path" type="o"/>
+  </signal>
+  <property name="Calls" type="ao" access="read"/>
+  <property name="EmergencyOnly" type="b" access="read"/>
+</interface>
+''',
+        'org.freedesktop.ModemManager1.Modem': '''
+<interface name="org.freedesktop.ModemManager1.Modem">
+  <method name="Enable">
+    <arg name="enable" type="b" direction="in"/>
+  </method>
+  <method name="ListBearers">
+    <arg name="bearers" type="ao" direction="out"/>
+  </method>
+  <method name="CreateBearer">
+    <arg name="properties" type="a{sv}" direction="in"/>
+    <arg name="path" type="o" direction="out"/>
+  </method>
+  <method name="DeleteBearer">
+    <arg name="bearer" type="o" direction="in"/>
+  </method>
+  <method name="Reset"/>
+  <method name="FactoryReset">
+    <arg name="code" type="s" direction="in"/>
+  </method>
+  <method name="SetPowerState">
+    <arg name="state" type="u" direction="in"/>
+  </method>
+  <method name="SetCurrentCapabilities">
+    <arg name="capabilities" type="u" direction="in"/>
+  </method>
+  <method name="SetCurrentModes">
+    <arg name="modes" type="(uu)" direction="in"/>
+  </method>
+  <method name="SetCurrentBands">
+    <arg name="bands" type="au" direction="in"/>
+  </method>
+  <method name="SetPrimarySimSlot">
+    <arg name="sim_slot" type="u" direction="in"/>
+  </method>
+  <method name="Command">
+    <arg name="cmd" type="s" direction="in"/>
+    <arg name="timeout" type="u" direction="in"/>
+    <arg name="response" type="s" direction="out"/>
+  </method>
+  <signal name="StateChanged">
+    <arg name="old" type="i"/>
+    <arg name="new" type="i"/>
+    <arg name="reason" type="u"/>
+  </signal>
+  <property name="Sim" type="o" access="read"/>
+  <property name="SimSlots" type="ao" access="read"/>
+  <property name="PrimarySimSlot" type="u" access="read"/>
+  <property name="Bearers" type="ao" access="read"/>
+  <property name="SupportedCapabilities" type="au" access="read"/>
+  <property name="CurrentCapabilities" type="u" access="read"/>
+  <property name="MaxBearers" type="u" access="read"/>
+  <property name="MaxActiveBearers" type="u" access="read"/>
+  <property name="MaxActiveMultiplexedBearers" type="u" access="read"/>
+  <property name="Manufacturer" type="s" access="read"/>
+  <property name="Model" type="s" access="read"/>
+  <property name="Revision" type="s" access="read"/>
+  <property name="CarrierConfiguration" type="s" access="read"/>
+  <property name="CarrierConfigurationRevision" type="s" access="read"/>
+  <property name="HardwareRevision" type="s" access="read"/>
+  <property name="DeviceIdentifier" type="s" access="read"/>
+  <property name="Device" type="s" access="read"/>
+  <property name="Drivers" type="as" access="read"/>
+  <property name="Plugin" type="s" access="read"/>
+  <property name="PrimaryPort" type="s" access="read"/>
+  <property name="Ports" type="a(su)" access="read"/>
+  <property name="EquipmentIdentifier" type="s" access="read"/>
+  <property name="UnlockRequired" type="u" access="read"/>
+  <property name="UnlockRetries" type="a{uu}" access="read"/>
+  <property name="State" type="i" access="read"/>
+  <property name="StateFailedReason" type="u" access="read"/>
+  <property name="AccessTechnologies" type="u" access="read"/>
+  <property name="SignalQuality" type="(ub)" access="read"/>
+  <property name="OwnNumbers" type="as" access="read"/>
+  <property name="PowerState" type="u" access="read"/>
+  <property name="SupportedModes" type="a(uu)" access="read"/>
+  <property name="CurrentModes" type="(uu)" access="read"/>
+  <property name="SupportedBands" type="au" access="read"/>
+  <property name="CurrentBands" type="au" access="read"/>
+  <property name="SupportedIpFamilies" type="u" access="read"/>
+</interface>
+''',
+        'org.freedesktop.ModemManager1.Sim': '''
+<interface name="org.freedesktop.ModemManager1.Sim">
+  <method name="SendPin">
+    <arg name="pin" type="s" direction="in"/>
+  </method>
+  <method name="SendPuk">
+    <arg name="puk" type="s" direction="in"/>
+    <arg name="pin" type="s" direction="in"/>
+  </method>
+  <method name="EnablePin">
+    <arg name="pin" type="s" direction="in"/>
+    <arg name="enabled" type="b" direction="in"/>
+  </method>
+  <method name="ChangePin">
+    <arg name="old_pin" type="s" direction="in"/>
+    <arg name="new_pin" type="s" direction="in"/>
+  </method>
+  <method name="SetPreferredNetworks">
+    <arg name="preferred_networks" type="a(su)" direction="in"/>
+  </method>
+  <property name="Active" type="b" access="read"/>
+  <property name="SimIdentifier" type="s" access="read"/>
+  <property name="Imsi" type="s" access="read"/>
+  <property name="Eid" type="s" access="read"/>
+  <property name="OperatorIdentifier" type="s" access="read"/>
+  <property name="OperatorName" type="s" access="read"/>
+  <property name="EmergencyNumbers" type="as" access="read"/>
+  <property name="PreferredNetworks" type="a(su)" access="read"/>
+</interface>
+''',
+        'org.freedesktop.ModemManager1.Sms': '''
+<interface name="org.freedesktop.ModemManager1.Sms">
+  <method name="Send"/>
+  <method name="Store">
+    <arg name="storage" type="u" direction="in"/>
+  </method>
+  <property name="State" type="u" access="read"/>
+  <property name="PduType" type="u" access="read"/>
+  <property name="Number" type="s" access="read"/>
+  <property name="Text" type="s" access="read"/>
+  <property name="Data" type="ay" access="read"/>
+  <property name="SMSC" type="s" access="read"/>
+  <property name="Validity" type="(uv)" access="read"/>
+  <property name="Class" type="i" access="read"/>
+  <property name="TeleserviceId" type="u" access="read"/>
+  <property name="ServiceCategory" type="u" access="read"/>
+  <property name="DeliveryReportRequest" type="b" access="read"/>
+  <property name="MessageReference" type="u" access="read"/>
+  <property name="Timestamp" type="s" access="read"/>
+  <property name="DischargeTimestamp" type="s" access="read"/>
+  <property name="DeliveryState" type="u" access="read"/>
+  <property name="Storage" type="u" access="read"/>
+</interface>
+''',
+        'org.freedesktop.ModemManager1': '''
+<interface name="org.freedesktop.ModemManager1">
+  <method name="ScanDevices"/>
+  <method name="SetLogging">
+    <arg name="level" type="s" direction="in"/>
+  </method>
+  <method name="ReportKernelEvent">
+    <arg name="properties" type="a{sv}" direction="in"/>
+  </method>
+  <method name="InhibitDevice">
+    <arg name="uid" type="s" direction="in"/>
+    <arg name="inhibit" type="b" direction="in"/>
+  </method>
+  <property name="Version" type="s" access="read"/>
+</interface>
+''',
+    },
+}
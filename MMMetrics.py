@@ -0,0 +1,200 @@
+import json
+import math
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, math.inf)
+"""
+Upper bounds in seconds of the latency histogram buckets.
+"""
+
+
+class CallStats(object):
+    """
+    Call count, error count and latency histogram of one method or property, on one object path.
+    """
+    __slots__ = ('count', 'errors', 'total', 'min', 'max', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.buckets = [0] * len(BUCKETS)
+
+    def add(self, seconds: float, error: bool):
+        self.count += 1
+        if error:
+            self.errors += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        self.buckets[bisect_left(BUCKETS, seconds)] += 1
+
+    def merge(self, other: 'CallStats'):
+        self.count += other.count
+        self.errors += other.errors
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Upper bound of the bucket holding the q-quantile of the latencies, e.g. quantile(0.99).
+        The largest latency seen stands in for the unbounded last bucket.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS, self.buckets):
+            seen += count
+            if seen >= rank and count:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'total': self.total,
+            'mean': self.total / self.count if self.count else None,
+            'min': self.min if self.count else None,
+            'max': self.max if self.count else None,
+            'p50': self.quantile(0.5),
+            'p99': self.quantile(0.99),
+            'buckets': {('+Inf' if math.isinf(bound) else str(bound)): count
+                        for bound, count in zip(BUCKETS, self.buckets)},
+        }
+
+
+class MetricsRegistry(object):
+    """
+    In-process registry of call metrics, kept by every ModemManager as manager.metrics.
+
+    Each D-Bus method call and property read made through a wrapper is recorded under its name, e.g.
+    "Modem.Command", "Modem.SignalQuality" or "SMS.Send", and the object path it went to. Property reads
+    answered from the property cache send nothing and are not recorded.
+
+        stats = manager.metrics.get('Modem.Command')
+        print(stats.count, stats.errors, stats.quantile(0.99))
+        manager.metrics.dump('metrics.json', per_path=True)
+
+    The statistics of an object path are folded into the totals when ModemManager releases the object, e.g.
+    when the modem is removed, or its wrapper is collected, so per-path statistics only cover current objects.
+
+    Set enabled to False to stop recording.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        # path -> name -> stats; calls on forgotten paths are kept under the path None
+        self._stats: Dict[Optional[str], Dict[str, CallStats]] = {}
+
+    def record(self, name: str, path: str, seconds: float, error: bool = False):
+        """
+        Record one call.
+
+        :param name: Metric name, e.g. "Modem.Command".
+        :param path: Object path the call went to.
+        :param seconds: Latency of the call.
+        :param error: Whether the call failed.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            by_name = self._stats.get(path)
+            if by_name is None:
+                by_name = self._stats[path] = {}
+            stats = by_name.get(name)
+            if stats is None:
+                stats = by_name[name] = CallStats()
+            stats.add(seconds, error)
+
+    @contextmanager
+    def measure(self, name: str, path: str):
+        """
+        Record the block as one call, failed if it raises.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.record(name, path, time.perf_counter() - start, True)
+            raise
+        self.record(name, path, time.perf_counter() - start)
+
+    def forget(self, path: str):
+        """
+        Fold the statistics of an object path into the totals of their metrics, e.g. once the object is gone,
+        so a long-running process does not keep the statistics of every path it ever called.
+
+        get() and snapshot() keep counting the folded calls; snapshot(per_path=True) lists them under None.
+        """
+        with self._lock:
+            by_name = self._stats.pop(path, None)
+            if not by_name:
+                return
+            totals = self._stats.setdefault(None, {})
+            for name, stats in by_name.items():
+                if name in totals:
+                    totals[name].merge(stats)
+                else:
+                    totals[name] = stats
+
+    def get(self, name: str, path: str = None) -> CallStats:
+        """
+        Statistics of one metric, on one object path or summed over all paths.
+        """
+        result = CallStats()
+        with self._lock:
+            for stats_path, by_name in self._stats.items():
+                if (path is None or stats_path == path) and name in by_name:
+                    result.merge(by_name[name])
+        return result
+
+    def snapshot(self, per_path: bool = False) -> Dict[str, Dict[str, object]]:
+        """
+        Copy of every metric, as plain dictionaries.
+
+        :param per_path: Break each metric down by object path, {name: {path: stats}}, instead of {name: stats}.
+        """
+        with self._lock:
+            if per_path:
+                result = {}
+                for path, by_name in self._stats.items():
+                    for name, stats in by_name.items():
+                        result.setdefault(name, {})[path] = stats.to_dict()
+                return result
+            merged: Dict[str, CallStats] = {}
+            for by_name in self._stats.values():
+                for name, stats in by_name.items():
+                    merged.setdefault(name, CallStats()).merge(stats)
+        return {name: stats.to_dict() for name, stats in merged.items()}
+
+    def dump(self, file: str = None, per_path: bool = False) -> str:
+        """
+        Snapshot as JSON.
+
+        :param file: File to write the JSON to.
+        :param per_path: Break each metric down by object path.
+        :return: The JSON text.
+        """
+        text = json.dumps(self.snapshot(per_path), indent=2)
+        if file is not None:
+            with open(file, 'w') as f:
+                f.write(text)
+        return text
+
+    def reset(self):
+        """
+        Drop every recorded call.
+        """
+        with self._lock:
+            self._stats.clear()
@@ -0,0 +1,100 @@
+from types import MappingProxyType
+from typing import Callable, Dict
+
+
+def _freeze(value):
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, tuple):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    return value
+
+
+def _hashable(value):
+    # frozen dictionaries are read-only but not hashable; hash their items instead
+    if isinstance(value, MappingProxyType):
+        return frozenset((k, _hashable(v)) for k, v in value.items())
+    if isinstance(value, tuple):
+        return tuple(_hashable(v) for v in value)
+    return value
+
+
+def enum_of(enum_type):
+    """
+    Decoder turning a raw integer into enum_type, keeping the raw value if the daemon
+    reports a value this version of MMEnums does not know about.
+    """
+
+    def decode(value):
+        try:
+            return enum_type(value)
+        except ValueError:
+            return value
+
+    return decode
+
+
+def list_of(decoder: Callable):
+    def decode(value):
+        return tuple(decoder(v) for v in value)
+
+    return decode
+
+
+def tuple_of(*decoders: Callable):
+    def decode(value):
+        return tuple(decoder(v) for decoder, v in zip(decoders, value))
+
+    return decode
+
+
+def dict_of(key_decoder: Callable, value_decoder: Callable):
+    def decode(value):
+        return MappingProxyType({key_decoder(k): value_decoder(v) for k, v in value.items()})
+
+    return decode
+
+
+class MMSnapshot(object):
+    """
+    Immutable record of every property of one D-Bus interface, read with a single
+    org.freedesktop.DBus.Properties.GetAll call.
+
+    Subclasses list the property names in __slots__ and the decoders turning raw values
+    into MMEnums types in DECODERS. Properties the daemon does not report (e.g. ones added
+    in a later ModemManager version) are None. Snapshots compare equal when their type, path
+    and values are, and can be used in sets and as dictionary keys.
+    """
+    __slots__ = ('path',)
+    DECODERS: Dict[str, Callable] = {}
+
+    def __init__(self, path: str, properties: Dict[str, object]):
+        object.__setattr__(self, 'path', path)
+        for name in type(self).__slots__:
+            value = properties.get(name)
+            if value is not None:
+                value = self.DECODERS.get(name, _freeze)(value)
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __delattr__(self, item):
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def as_dict(self) -> Dict[str, object]:
+        return {name: getattr(self, name) for name in type(self).__slots__}
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.path == other.path and self.as_dict() == other.as_dict()
+
+    def __hash__(self):
+        return hash((type(self), self.path, tuple(_hashable(getattr(self, name)) for name in type(self).__slots__)))
+
+    def __repr__(self):
+        fields = ', '.join(f'{k}={v!r}' for k, v in self.as_dict().items())
+        return f'{type(self).__name__}(path={self.path!r}, {fields})'
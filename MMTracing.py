@@ -0,0 +1,200 @@
+import collections
+import contextvars
+import itertools
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_current_span: contextvars.ContextVar[Optional['Span']] = contextvars.ContextVar('mm_current_span', default=None)
+
+
+def summarize(args: Iterable, limit: int = 200) -> str:
+    """
+    Short repr of call arguments for a span, cut to limit characters.
+    """
+    text = ', '.join(repr(arg) for arg in args)
+    if len(text) > limit:
+        return text[:limit - 3] + '...'
+    return text
+
+
+class Span(object):
+    """
+    One timed operation: a D-Bus method call or property read of a wrapper, or an operation opened with
+    Tracer.span() around several calls. Spans opened while another span is open on the same thread or asyncio
+    task are its children and share its trace_id.
+    """
+    __slots__ = ('name', 'path', 'args', 'trace_id', 'span_id', 'parent_id', 'start', 'duration', 'error',
+                 'attributes', '_started')
+
+    def __init__(self, name: str, path: Optional[str], args: Optional[str], span_id: int, parent: Optional['Span'],
+                 attributes: Dict[str, object]):
+        self.name = name
+        self.path = path
+        self.args = args
+        self.span_id = span_id
+        self.parent_id = parent.span_id if parent is not None else None
+        self.trace_id = parent.trace_id if parent is not None else span_id
+        self.start = time.time()
+        self.duration: Optional[float] = None
+        self.error: Optional[str] = None
+        self.attributes = attributes
+        self._started = time.perf_counter()
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            'name': self.name,
+            'path': self.path,
+            'args': self.args,
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'start': self.start,
+            'duration': self.duration,
+            'error': self.error,
+            'attributes': self.attributes,
+        }
+
+    def __repr__(self):
+        duration = 'open' if self.duration is None else f'{self.duration * 1000:.1f}ms'
+        return f'<Span {self.name} {self.path or ""} {duration}{" " + self.error if self.error else ""}>'
+
+
+class SpanExporter(object):
+    """
+    Destination of finished spans. export() is called on the thread that finished the span.
+    """
+
+    def export(self, span: Span):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class RingExporter(SpanExporter):
+    """
+    Keeps the last maxlen spans in memory.
+    """
+
+    def __init__(self, maxlen: int = 1000):
+        self._spans = collections.deque(maxlen=maxlen)
+
+    def export(self, span: Span):
+        self._spans.append(span)
+
+    def spans(self) -> List[Span]:
+        return list(self._spans)
+
+    def clear(self):
+        self._spans.clear()
+
+
+class JsonLinesExporter(SpanExporter):
+    """
+    Appends each span to a file as one JSON object per line.
+    """
+
+    def __init__(self, file: str):
+        self._lock = threading.Lock()
+        self._file = open(file, 'a')
+
+    def export(self, span: Span):
+        line = json.dumps(span.to_dict(), default=repr)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class CallbackExporter(SpanExporter):
+    """
+    Hands each span to a callback.
+    """
+
+    def __init__(self, callback: Callable[[Span], None]):
+        self._callback = callback
+
+    def export(self, span: Span):
+        self._callback(span)
+
+
+class Tracer(object):
+    """
+    Records spans of wrapper operations and hands them to exporters. Tracing is off until a tracer is set:
+
+        ring = RingExporter()
+        manager.tracer = Tracer(ring, JsonLinesExporter('spans.jsonl'))
+        with manager.tracer.span('create-and-connect', modem.path):
+            bearer = manager.get_bearer(modem.CreateBearer({'apn': 'internet'}))
+            bearer.Connect()
+
+    Every method call and uncached property read of a wrapper gets its own span, so a slow operation shows
+    whether the time went into D-Bus round trips or into the application between them.
+    """
+
+    def __init__(self, *exporters: SpanExporter, record_args: bool = True):
+        """
+        :param exporters: Destinations of finished spans.
+        :param record_args: Put a summary of the call arguments into spans; turn off to keep e.g. PINs out of them.
+        """
+        self.exporters: List[SpanExporter] = list(exporters)
+        self.record_args = record_args
+        self._ids = itertools.count(1)
+
+    def begin(self, name: str, path: str = None, args: Iterable = None, **attributes) -> Span:
+        """
+        Open a span without making it the parent of spans opened after it, e.g. for a call whose reply
+        arrives on another thread. Finish it with end().
+        """
+        summary = summarize(args) if args is not None and self.record_args else None
+        return Span(name, path, summary, next(self._ids), _current_span.get(), attributes)
+
+    def end(self, span: Span, error: BaseException = None):
+        """
+        Finish a span opened with begin() and export it.
+        """
+        span.duration = time.perf_counter() - span._started
+        if error is not None:
+            span.error = f'{type(error).__name__}: {error}'
+        for exporter in self.exporters:
+            try:
+                exporter.export(span)
+            except Exception:
+                logger.exception('Error in span exporter %r', exporter)
+
+    @contextmanager
+    def span(self, name: str, path: str = None, args: Iterable = None, **attributes):
+        """
+        Span around a block; spans opened inside the block become its children.
+
+        :param name: Operation name, e.g. "Modem.Command" or "send-sms".
+        :param path: Object path the operation is about.
+        :param args: Arguments of the operation, recorded as a summary.
+        :param attributes: Further values to record.
+        """
+        span = self.begin(name, path, args, **attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            _current_span.reset(token)
+            self.end(span, e)
+            raise
+        _current_span.reset(token)
+        self.end(span)
+
+    def close(self):
+        """
+        Close every exporter.
+        """
+        for exporter in self.exporters:
+            exporter.close()
@@ -1,137 +1,274 @@
-from typing import Dict, Tuple, List
+from typing import Dict, Tuple, List, TYPE_CHECKING, Iterable, Union
 
+from MMErrors import CancelToken
 from MMInterface import MMInterface
-from ModemManager import ModemManager
+from MMSnapshot import MMSnapshot, enum_of, list_of, tuple_of, dict_of
 from MMEnums import MMModemPowerState, MMModemCapability, MMModemBand, MMModemPortType, MMModemLock, \
     MMModemState, MMModemStateFailedReason, MMModemAccessTechnology, MMModemMode, MMBearerIpFamily
 
 
+if TYPE_CHECKING:
+    from ModemManager import ModemManager
+
+
+class ModemSnapshot(MMSnapshot):
+    """
+    All properties of a Modem object, read at once and decoded to MMEnums types.
+    """
+    __slots__ = (
+        'Sim',
+        'SimSlots',
+        'PrimarySimSlot',
+        'Bearers',
+        'SupportedCapabilities',
+        'CurrentCapabilities',
+        'MaxBearers',
+        'MaxActiveBearers',
+        'MaxActiveMultiplexedBearers',
+        'Manufacturer',
+        'Model',
+        'Revision',
+        'CarrierConfiguration',
+        'CarrierConfigurationRevision',
+        'HardwareRevision',
+        'DeviceIdentifier',
+        'Device',
+        'Drivers',
+        'Plugin',
+        'PrimaryPort',
+        'Ports',
+        'EquipmentIdentifier',
+        'UnlockRequired',
+        'UnlockRetries',
+        'State',
+        'StateFailedReason',
+        'AccessTechnologies',
+        'SignalQuality',
+        'OwnNumbers',
+        'PowerState',
+        'SupportedModes',
+        'CurrentModes',
+        'SupportedBands',
+        'CurrentBands',
+        'SupportedIpFamilies',
+    )
+    DECODERS = {
+        'SupportedCapabilities': list_of(enum_of(MMModemCapability)),
+        'CurrentCapabilities': enum_of(MMModemCapability),
+        'Ports': list_of(tuple_of(str, enum_of(MMModemPortType))),
+        'UnlockRequired': enum_of(MMModemLock),
+        'UnlockRetries': dict_of(enum_of(MMModemLock), int),
+        'State': enum_of(MMModemState),
+        'StateFailedReason': enum_of(MMModemStateFailedReason),
+        'AccessTechnologies': enum_of(MMModemAccessTechnology),
+        'SignalQuality': tuple_of(int, bool),
+        'PowerState': enum_of(MMModemPowerState),
+        'SupportedModes': list_of(tuple_of(enum_of(MMModemMode), enum_of(MMModemMode))),
+        'CurrentModes': tuple_of(enum_of(MMModemMode), enum_of(MMModemMode)),
+        'SupportedBands': list_of(enum_of(MMModemBand)),
+        'CurrentBands': list_of(enum_of(MMModemBand)),
+        'SupportedIpFamilies': enum_of(MMBearerIpFamily),
+    }
+
+
 class Modem(MMInterface):
     """
     The Modem interface controls the status and actions in a given modem object.
     This interface will always be available as long a the modem is considered valid.
     """
+    INTERFACE = 'org.freedesktop.ModemManager1.Modem'
+    __slots__ = ()
+    FORWARDED = ('StateChanged',)
+    COMMAND_TIMEOUT_MARGIN = 5
+    IDENTITY = ('DeviceIdentifier', 'Device')
+
+    def __init__(self, manager: 'ModemManager', instance, properties: Dict[str, Dict[str, object]] = None):
+        super().__init__(manager, instance, properties)
+
+    def snapshot(self, timeout: float = None, cancel: CancelToken = None) -> ModemSnapshot:
+        """
+        Read every property of this Modem with a single Properties.GetAll call.
+
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
+        :return: Immutable ModemSnapshot, with values decoded to MMEnums types.
+        """
+        return ModemSnapshot(self.path, self._get_all(timeout, cancel))
+
+    def wait_for_state(self, target: Union[MMModemState, Iterable[MMModemState]], timeout: float = None,
+                       cancel: CancelToken = None) -> MMModemState:
+        """
+        Wait until the modem is in a state, following the StateChanged signal instead of polling State.
+        Signals must be delivered while waiting: by the socket backend, a main loop thread, or, for the pydbus
+        backend without a running loop, by the GLib main context this call iterates.
+
+        :param target: State to wait for, or several, e.g. (MM_MODEM_STATE_REGISTERED, MM_MODEM_STATE_CONNECTED).
+            Add MM_MODEM_STATE_FAILED to stop waiting when the modem fails.
+        :param timeout: Seconds to wait, or None to wait without limit.
+        :param cancel: Token abandoning the wait when cancelled.
+        :return: The state reached; returns right away if the modem already is in a target state.
+        :raises MMWaitTimeoutError: The modem did not reach the state within the timeout.
+        :raises MMCancelledError: The token was cancelled.
+        """
+        return ModemSnapshot.DECODERS['State'](self._wait_for('State', target, timeout, cancel, signal='StateChanged'))
 
-    def __init__(self, manager: ModemManager, instance):
-        super().__init__(manager)
-        self._instance = instance
+    def wait_for_power_state(self, target: Union[MMModemPowerState, Iterable[MMModemPowerState]],
+                             timeout: float = None, cancel: CancelToken = None) -> MMModemPowerState:
+        """
+        Wait until the modem is in a power state, following PropertiesChanged; see wait_for_state().
+        """
+        return ModemSnapshot.DECODERS['PowerState'](self._wait_for('PowerState', target, timeout, cancel))
+
+    def wait_for_unlock_required(self,
+                                 target: Union[MMModemLock, Iterable[MMModemLock]] = MMModemLock.MM_MODEM_LOCK_NONE,
+                                 timeout: float = None, cancel: CancelToken = None) -> MMModemLock:
+        """
+        Wait until the modem requires an unlock code, by default until it requires none,
+        following PropertiesChanged; see wait_for_state().
+        """
+        return ModemSnapshot.DECODERS['UnlockRequired'](self._wait_for('UnlockRequired', target, timeout, cancel))
 
     """
     Methods
     """
 
-    def Enable(self, enable: bool):
+    def Enable(self, enable: bool, timeout: float = None, cancel: CancelToken = None):
         """
         Enable or disable the modem.
         When enabled, the modem's radio is powered on and data sessions, voice calls, location services, and Short Message Service may be available.
         When disabled, the modem enters low-power state and no network-related operations are available.
         Since: 1.0
         :param enable: True to enable the modem and False to disable it.
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         """
-        self._instance.Enable(enable)
+        self._call('Enable', enable, timeout=timeout, cancel=cancel)
 
-    def ListBearers(self):
+    def ListBearers(self, timeout: float = None, cancel: CancelToken = None):
         """
         List configured packet data bearers (EPS Bearers, PDP Contexts, or CDMA2000 Packet Data Sessions).
         Since: 1.0
         Deprecated: 1.10.0. Use "Bearers" property instead.
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         :return: The list of bearer object paths.
         """
-        return self._instance.ListBearers()
+        return self._call('ListBearers', timeout=timeout, cancel=cancel)
 
-    def CreateBearer(self, properties: Dict[str, object]) -> str:
+    def CreateBearer(self, properties: Dict[str, object], timeout: float = None, cancel: CancelToken = None) -> str:
         """
         Create a new packet data bearer using the given characteristics.
         This request may fail if the modem does not support additional bearers, if too many bearers are already defined, or if properties are invalid.
         The properties allowed are any of the ones defined in the bearer properties.
         Since: 1.0
         :param properties: Dictionary of properties needed to get the bearer connected.
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         :return: On success, the object path of the newly created bearer.
         """
-        return self._instance.CreateBearer(properties)
+        return self._call('CreateBearer', properties, timeout=timeout, cancel=cancel)
 
-    def DeleteBearer(self, bearer: str):
+    def DeleteBearer(self, bearer: str, timeout: float = None, cancel: CancelToken = None):
         """
         Delete an existing packet data bearer.
         If the bearer is currently active and providing packet data server, it will be disconnected and that packet data service will terminate.
         Since: 1.0
         :param bearer: Object path of the bearer to delete.
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         """
-        self._instance.DeleteBearer(bearer)
+        self._call('DeleteBearer', bearer, timeout=timeout, cancel=cancel)
 
-    def Reset(self):
+    def Reset(self, timeout: float = None, cancel: CancelToken = None):
         """
         Clear non-persistent configuration and state, and return the device to a newly-powered-on state.
         This command may power-cycle the device.
         Since: 1.0
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         """
-        self._instance.Reset()
+        self._call('Reset', timeout=timeout, cancel=cancel)
 
-    def FactoryReset(self, code: str):
+    def FactoryReset(self, code: str, timeout: float = None, cancel: CancelToken = None):
         """
         Clear the modem's configuration (including persistent configuration and state), and return the device to a factory-default state.
         If not required by the modem, code may be ignored.
         This command may or may not power-cycle the device.
         Since: 1.0
         :param code: Carrier-supplied code required to reset the modem.
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         """
-        self._instance.FactoryReset(code)
+        self._call('FactoryReset', code, timeout=timeout, cancel=cancel)
 
-    def SetPowerState(self, state: MMModemPowerState):
+    def SetPowerState(self, state: MMModemPowerState, timeout: float = None, cancel: CancelToken = None):
         """
         Set the power state of the modem. This action can only be run when the modem is in MM_MODEM_STATE_DISABLED state.
         Since: 1.0
         :param state: A MMModemPowerState value, to specify the desired power state.
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         """
-        self._instance.SetPowerState(state.value)
+        self._call('SetPowerState', state.value, timeout=timeout, cancel=cancel)
 
-    def SetCurrentCapabilities(self, capabilities: MMModemCapability):
+    def SetCurrentCapabilities(self, capabilities: MMModemCapability,
+                               timeout: float = None, cancel: CancelToken = None):
         """
         Set the capabilities of the device.
         The given bitmask should be supported by the modem, as specified in the "SupportedCapabilities" property.
         This command may power-cycle the device.
         Since: 1.0
         :param capabilities: Bitmask of MMModemCapability values, to specify the capabilities to use.
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         """
-        self._instance.SetCurrentCapabilities(capabilities.value)
+        self._call('SetCurrentCapabilities', capabilities.value, timeout=timeout, cancel=cancel)
 
-    def SetCurrentModes(self, modes: Tuple[int, int]):
+    def SetCurrentModes(self, modes: Tuple[int, int], timeout: float = None, cancel: CancelToken = None):
         """
         Set the access technologies (e.g. 2G/3G/4G preference) the device is currently allowed to use when connecting to a network.
         The given combination should be supported by the modem, as specified in the "SupportedModes" property.
         Since: 1.0
         :param modes: A pair of MMModemMode values, where the first one is a bitmask of allowed modes, and the second one the preferred mode, if any.
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         """
-        self._instance.SetCurrentModes(modes)
+        self._call('SetCurrentModes', modes, timeout=timeout, cancel=cancel)
 
-    def SetCurrentBands(self, bands: List[MMModemBand]):
+    def SetCurrentBands(self, bands: List[MMModemBand], timeout: float = None, cancel: CancelToken = None):
         """
         Set the radio frequency and technology bands the device is currently allowed to use when connecting to a network.
         Since: 1.0
         :param bands: List of MMModemBand values, to specify the bands to be used.
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         """
-        self._instance.SetCurrentBands([v.value for v in bands])
+        self._call('SetCurrentBands', [v.value for v in bands], timeout=timeout, cancel=cancel)
 
-    def SetPrimarySimSlot(self, sim_slot: int):
+    def SetPrimarySimSlot(self, sim_slot: int, timeout: float = None, cancel: CancelToken = None):
         """
         Selects which SIM slot to be considered as primary, on devices that expose multiple slots in the "SimSlots" property.
         When the switch happens the modem may require a full device reprobe, so the modem object in DBus will get removed, and recreated once the selected SIM slot is in use.
         There is no limitation on which SIM slot to select, so the user may also set as primary a slot that doesn't currently have any valid SIM card inserted.
         Since: 1.16
         :param sim_slot: SIM slot number to set as primary.
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         """
-        self._instance.SetPrimarySimSlot(sim_slot)
+        self._call('SetPrimarySimSlot', sim_slot, timeout=timeout, cancel=cancel)
 
-    def Command(self, cmd: str, timeout: int) -> str:
+    def Command(self, cmd: str, timeout: int, cancel: CancelToken = None) -> str:
         """
         Send an arbitrary AT command to a modem and get the response.
         Note that using this interface call is only allowed when running ModemManager in debug mode or if the project was built using the with-at-command-via-dbus configure option.
         Since: 1.0
         :param cmd: The command string, e.g. "AT+GCAP" or "+GCAP" (leading AT is inserted if necessary).
-        :param timeout: The number of seconds to wait for a response.
+        :param timeout: The number of seconds to wait for a response. The D-Bus call waits COMMAND_TIMEOUT_MARGIN
+            seconds longer, so the modem's own timeout is reported rather than a D-Bus one.
+        :param cancel: Token abandoning the call when cancelled.
         :return: The modem's response.
         """
-        return self._instance.Command(cmd, timeout)
+        return self._call('Command', cmd, timeout, timeout=timeout + self.COMMAND_TIMEOUT_MARGIN, cancel=cancel)
 
     """
     Properties
@@ -145,7 +282,7 @@ class Modem(MMInterface):
         If multiple org.freedesktop.ModemManager1.Modem.SimSlots are supported, the org.freedesktop.ModemManager1.Modem.PrimarySimSlot index value specifies which is the slot number where this SIM card is available.
         Since: 1.0
         """
-        return self._instance.Sim
+        return self._get_property('Sim')
 
     @property
     def SimSlots(self) -> List[str]:
@@ -155,7 +292,7 @@ class Modem(MMInterface):
         This list includes the SIM object considered as primary active SIM slot (org.freedesktop.ModemManager1.Modem.Sim) at index org.freedesktop.ModemManager1.Modem.ActiveSimSlot.
         Since: 1.16
         """
-        return self._instance.SimSlots
+        return self._get_property('SimSlots')
 
     @property
     def PrimarySimSlot(self) -> int:
@@ -166,7 +303,7 @@ class Modem(MMInterface):
         In a Multi SIM Multi Standby setup, this index identifies the active SIM that is considered primary, i.e. the one that will be used when a data connection is setup.
         Since: 1.16
         """
-        return self._instance.PrimarySimSlot
+        return self._get_property('PrimarySimSlot')
 
     @property
     def Bearers(self) -> List[str]:
@@ -175,7 +312,7 @@ class Modem(MMInterface):
         This list does not include the initial EPS bearer details (see "InitialEpsBearer").
         Since: 1.2
         """
-        return self._instance.Bearers
+        return self._get_property('Bearers')
 
     @property
     def SupportedCapabilities(self) -> List[MMModemCapability]:
@@ -185,7 +322,7 @@ class Modem(MMInterface):
         Only multimode devices implementing both 3GPP (GSM/UMTS/LTE/5GNR) and 3GPP2 (CDMA/EVDO) specs will report more than one combination of capabilities.
         Since: 1.0
         """
-        return self._instance.SupportedCapabilities
+        return self._get_property('SupportedCapabilities')
 
     @property
     def CurrentCapabilities(self) -> MMModemCapability:
@@ -194,7 +331,7 @@ class Modem(MMInterface):
         This bitmask will be one of the ones listed in "SupportedCapabilities".
         Since: 1.0
         """
-        return self._instance.CurrentCapabilities
+        return self._get_property('CurrentCapabilities')
 
     @property
     def MaxBearers(self) -> int:
@@ -204,7 +341,7 @@ class Modem(MMInterface):
         Deprecated: 1.18.0. There is no way to query the modem how many bearers it supports, so the value exposed in this property in all the different implementations is always equal to the value in "MaxActiveBearers", so there is no point in using this property.
         Since: 1.0
         """
-        return self._instance.MaxBearers
+        return self._get_property('MaxBearers')
 
     @property
     def MaxActiveBearers(self) -> int:
@@ -213,7 +350,7 @@ class Modem(MMInterface):
         POTS and CDMA2000-only devices support one active bearer, while GSM/UMTS and LTE/5GNR capable devices (including 3GPP+3GPP3 multimode devices) may support one or more active bearers, depending on the amount of physical ports exposed by the device.
         Since: 1.0
         """
-        return self._instance.MaxActiveBearers
+        return self._get_property('MaxActiveBearers')
 
     @property
     def MaxActiveMultiplexedBearers(self) -> int:
@@ -222,7 +359,7 @@ class Modem(MMInterface):
         If the modem doesn't support multiplexing of data sessiones, a value of 0 will be reported.
         Since: 1.18
         """
-        return self._instance.MaxActiveMultiplexedBearers
+        return self._get_property('MaxActiveMultiplexedBearers')
 
     @property
     def Manufacturer(self) -> str:
@@ -230,7 +367,7 @@ class Modem(MMInterface):
         The equipment manufacturer, as reported by the modem.
         Since: 1.0
         """
-        return self._instance.Manufacturer
+        return self._get_property('Manufacturer')
 
     @property
     def Model(self) -> str:
@@ -238,7 +375,7 @@ class Modem(MMInterface):
         The equipment model, as reported by the modem.
         Since: 1.0
         """
-        return self._instance.Model
+        return self._get_property('Model')
 
     @property
     def Revision(self) -> str:
@@ -246,7 +383,7 @@ class Modem(MMInterface):
         The revision identification of the software, as reported by the modem.
         Since: 1.0
         """
-        return self._instance.Revision
+        return self._get_property('Revision')
 
     @property
     def CarrierConfiguration(self) -> str:
@@ -254,7 +391,7 @@ class Modem(MMInterface):
         The description of the carrier-specific configuration (MCFG) in use by the modem.
         Since: 1.12
         """
-        return self._instance.CarrierConfiguration
+        return self._get_property('CarrierConfiguration')
 
     @property
     def CarrierConfigurationRevision(self) -> str:
@@ -262,7 +399,7 @@ class Modem(MMInterface):
         The revision identification of the carrier-specific configuration (MCFG) in use by the modem.
         Since: 1.12
         """
-        return self._instance.CarrierConfigurationRevision
+        return self._get_property('CarrierConfigurationRevision')
 
     @property
     def HardwareRevision(self) -> str:
@@ -270,7 +407,7 @@ class Modem(MMInterface):
         The revision identification of the hardware, as reported by the modem.
         Since: 1.8
         """
-        return self._instance.HardwareRevision
+        return self._get_property('HardwareRevision')
 
     @property
     def DeviceIdentifier(self) -> str:
@@ -280,7 +417,7 @@ class Modem(MMInterface):
         This is not the device's IMEI or ESN since those may not be available before unlocking the device via a PIN.
         Since: 1.0
         """
-        return self._instance.DeviceIdentifier
+        return self._get_property('DeviceIdentifier')
 
     @property
     def Device(self) -> str:
@@ -290,7 +427,7 @@ class Modem(MMInterface):
         This value may also be set by the user using the MM_ID_PHYSDEV_UID udev tag (e.g. binding the tag to a specific sysfs path).
         Since: 1.0
         """
-        return self._instance.Device
+        return self._get_property('Device')
 
     @property
     def Drivers(self) -> List[str]:
@@ -298,7 +435,7 @@ class Modem(MMInterface):
         The Operating System device drivers handling communication with the modem hardware.
         Since: 1.0
         """
-        return self._instance.Drivers
+        return self._get_property('Drivers')
 
     @property
     def Plugin(self) -> str:
@@ -306,7 +443,7 @@ class Modem(MMInterface):
         The name of the plugin handling this modem.
         Since: 1.0
         """
-        return self._instance.Plugin
+        return self._get_property('Plugin')
 
     @property
     def PrimaryPort(self) -> str:
@@ -314,7 +451,7 @@ class Modem(MMInterface):
         The name of the primary port using to control the modem.
         Since: 1.0
         """
-        return self._instance.PrimaryPort
+        return self._get_property('PrimaryPort')
 
     @property
     def Ports(self) -> List[Tuple[str, MMModemPortType]]:
@@ -322,7 +459,7 @@ class Modem(MMInterface):
         The list of ports in the modem, given as an array of string and unsigned integer pairs. The string is the port name or path, and the integer is the port type given as a MMModemPortType value.
         Since: 1.0
         """
-        return self._instance.Ports
+        return self._get_property('Ports')
 
     @property
     def EquipmentIdentifier(self) -> str:
@@ -331,7 +468,7 @@ class Modem(MMInterface):
         This will be the IMEI number for GSM devices and the hex-format ESN/MEID for CDMA devices.
         Since: 1.0
         """
-        return self._instance.EquipmentIdentifier
+        return self._get_property('EquipmentIdentifier')
 
     @property
     def UnlockRequired(self) -> MMModemLock:
@@ -339,7 +476,7 @@ class Modem(MMInterface):
         Current lock state of the device, given as a MMModemLock value.
         Since: 1.0
         """
-        return self._instance.UnlockRequired
+        return self._get_property('UnlockRequired')
 
     @property
     def UnlockRetries(self) -> Dict[MMModemLock, int]:
@@ -347,7 +484,7 @@ class Modem(MMInterface):
         A dictionary in which the keys are MMModemLock flags, and the values are integers giving the number of PIN tries remaining before the code becomes blocked (requiring a PUK) or permanently blocked. Dictionary entries exist only for the codes for which the modem is able to report retry counts.
         Since: 1.0
         """
-        return self._instance.UnlockRetries
+        return self._get_plain_property('UnlockRetries')
 
     @property
     def State(self) -> MMModemState:
@@ -356,7 +493,7 @@ class Modem(MMInterface):
         If the device's state cannot be determined, MM_MODEM_STATE_UNKNOWN will be reported.
         Since: 1.0
         """
-        return self._instance.State
+        return self._get_property('State')
 
     @property
     def StateFailedReason(self) -> MMModemStateFailedReason:
@@ -364,7 +501,7 @@ class Modem(MMInterface):
         Error specifying why the modem is in MM_MODEM_STATE_FAILED state, given as a MMModemStateFailedReason value.
         Since: 1.0
         """
-        return self._instance.StateFailedReason
+        return self._get_property('StateFailedReason')
 
     @property
     def AccessTechnologies(self) -> MMModemAccessTechnology:
@@ -374,7 +511,7 @@ class Modem(MMInterface):
         Since: 1.0
 
         """
-        return self._instance.AccessTechnologies
+        return self._get_property('AccessTechnologies')
 
     @property
     def SignalQuality(self) -> Tuple[int, bool]:
@@ -383,7 +520,7 @@ class Modem(MMInterface):
         The additional boolean value indicates if the quality value given was recently taken.
         Since: 1.0
         """
-        return self._instance.SignalQuality
+        return self._get_property('SignalQuality')
 
     @property
     def OwnNumbers(self) -> List[str]:
@@ -391,7 +528,7 @@ class Modem(MMInterface):
         List of numbers (e.g. MSISDN in 3GPP) being currently handled by this modem.
         Since: 1.0
         """
-        return self._instance.OwnNumbers
+        return self._get_property('OwnNumbers')
 
     @property
     def PowerState(self) -> MMModemPowerState:
@@ -399,7 +536,7 @@ class Modem(MMInterface):
         A MMModemPowerState value specifying the current power state of the modem.
         Since: 1.0
         """
-        return self._instance.PowerState
+        return self._get_property('PowerState')
 
     @property
     def SupportedModes(self) -> List[Tuple[MMModemMode, MMModemMode]]:
@@ -411,7 +548,7 @@ class Modem(MMInterface):
 
         Since: 1.0
         """
-        return self._instance.SupportedModes
+        return self._get_property('SupportedModes')
 
     @property
     def CurrentModes(self) -> Tuple:
@@ -420,7 +557,7 @@ class Modem(MMInterface):
         The pair must be one of those specified in "SupportedModes".
         Since: 1.0
         """
-        return self._instance.CurrentModes
+        return self._get_property('CurrentModes')
 
     @property
     def SupportedBands(self) -> List[MMModemBand]:
@@ -429,7 +566,7 @@ class Modem(MMInterface):
         For POTS devices, only the MM_MODEM_BAND_ANY mode will be returned.
         Since: 1.0
         """
-        return self._instance.SupportedBands
+        return self._get_property('SupportedBands')
 
     @property
     def CurrentBands(self) -> List[MMModemBand]:
@@ -438,7 +575,7 @@ class Modem(MMInterface):
         It must be a subset of "SupportedBands".
         Since: 1.0
         """
-        return self._instance.CurrentBands
+        return self._get_property('CurrentBands')
 
     @property
     def SupportedIpFamilies(self) -> MMBearerIpFamily:
@@ -446,4 +583,4 @@ class Modem(MMInterface):
         Bitmask of MMBearerIpFamily values, specifying the IP families supported by the device.
         Since: 1.0
         """
-        return self._instance.SupportedIpFamilies
+        return self._get_property('SupportedIpFamilies')
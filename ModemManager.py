@@ -1,61 +1,497 @@
-from typing import List, Tuple, Dict
+import collections
+import enum
+import threading
+import weakref
+from concurrent.futures import Future, wait
+from typing import List, Tuple, Dict, Iterable, Optional, Type, TypeVar, Callable, NamedTuple, Any
 
-from gi.repository import GLib
-from pydbus import SystemBus
-
-from MMInterface import MMInterface
+import MMIntrospection
+from Bearer import Barer
+from Call import Call
+from MMBackend import MMBackend, TimerQueue, default_backend
+from MMErrors import CancelToken, MMCancelledError, MMGoneError, MMTimeoutError
+from MMInterface import GoneProxy, MMInterface, observed, settle
+from MMMetrics import MetricsRegistry
+from MMTracing import Tracer
 from Modem import Modem
+from ModemRegistry import ModemRegistry
+from SIM import SIM
+from SMS import SMS
+from SignalRouter import SignalHandle, SignalRouter
+from SingleFlight import SingleFlight
+
+Wrapper = TypeVar('Wrapper', bound=MMInterface)
+
+
+class ModemResult(NamedTuple):
+    """
+    Outcome of a callable run against one modem by ModemManager.map_modems().
+    """
+    modem: Modem
+    result: Any
+    error: Optional[BaseException]
 
 
 class ModemManager(MMInterface):
     """
     The Manager interface allows controlling and querying the status of the ModemManager daemon.
     """
+    FORWARDED = ('InterfacesAdded', 'InterfacesRemoved')
+    PATH = '/org/freedesktop/ModemManager1'
+    OBJECT_MANAGER_INTERFACE = 'org.freedesktop.DBus.ObjectManager'
+    MANAGER_INTERFACES = ('org.freedesktop.ModemManager1', OBJECT_MANAGER_INTERFACE)
+    FORWARDED_INTERFACES = MANAGER_INTERFACES
 
-    def __init__(self, main_loop=None, system_bus=None):
+    def __init__(self, main_loop=None, system_bus=None, static_introspection: bool = True,
+                 backend: MMBackend = None, loop_thread: bool = False):
+        """
+        :param main_loop: GLib main loop signals are delivered on, for the default pydbus backend.
+        :param system_bus: Bus to use instead of the system bus, for the default pydbus backend.
+        :param static_introspection: Build proxies from the interface descriptions bundled for the daemon's version
+            instead of introspecting every object. Falls back to introspection for unknown versions or interfaces.
+        :param backend: Transport to the daemon, e.g. SocketBackend() to run without gi.
+            Defaults to the pydbus backend, or the socket backend if gi or pydbus is not installed.
+        :param loop_thread: Let the backend run its main loop on a dedicated thread, so signals are delivered
+            without the caller driving GLib. Calls from other threads are then marshalled onto the loop thread
+            and signal handlers run on a dispatch thread. Release the threads with close().
+        """
         super().__init__(self)
-        if main_loop:
-            self._loop = main_loop
-        else:
-            self._loop = GLib.MainLoop()
-        if system_bus:
-            self._bus = system_bus
-        else:
-            self._bus = SystemBus()
+        self.backend = backend if backend else default_backend(main_loop, system_bus)
+        if loop_thread:
+            self.backend.start()
 
-        self._instance = self.get_object(None)
+        self._pool_lock = threading.Lock()
+        self._proxies: Dict[str, Tuple[object, Optional[frozenset]]] = {}
+        self._proxy_classes: Dict[frozenset, Callable[[str], object]] = {}
+        # wrappers stay pooled while the application references them; see _prune()
+        self._wrappers: 'weakref.WeakValueDictionary[str, MMInterface]' = weakref.WeakValueDictionary()
+        self._collected: collections.deque = collections.deque()
+        self._registry: Optional[ModemRegistry] = None
+        self._reads = SingleFlight()
+        self.metrics = MetricsRegistry()
+        self.tracer: Optional[Tracer] = None
+        self._recover_lock = threading.Lock()
+        self._stale = False
+        self._daemon_present = True
+        self._orphans: Dict[Tuple[str, object], Tuple[weakref.ref, List[SignalHandle]]] = {}
+        self.signals = SignalRouter()
+        # windows of property streams, started on first use
+        self.timers = TimerQueue('ModemManagerTimers')
+        self._subscribe_signals()
+        self.backend.watch_name_owner(self.BUS_NAME, self._on_name_owner_changed)
+        self._static_introspection = static_introspection
+        # the Manager interface is unchanged since 1.10, so any bundled set can describe it
+        self._introspection = MMIntrospection.latest_version() if static_introspection else None
+        self._instance = self.get_object(self.PATH, self.MANAGER_INTERFACES)
+        if self._introspection:
+            self._introspection = MMIntrospection.select_version(self.Version)
+        self.connect_signal('InterfacesRemoved', self._on_interfaces_removed, self.OBJECT_MANAGER_INTERFACE)
 
     @property
-    def modems(self):
+    def modems(self) -> List[Modem]:
+        """
+        The modems currently exported by ModemManager.
+
+        While the backend delivers signals, they come from the live registry;
+        otherwise they are enumerated with GetManagedObjects() on each access.
+        """
+        self._ensure_current()
+        if self.backend.dispatching:
+            return list(self.registry)
         modems = []
-        for path in self.GetManagedObjects().keys():
-            modem = self.get_object(path)
-            modems.append(Modem(self, modem))
+        for path, interfaces in self.GetManagedObjects().items():
+            modems.append(self.get_wrapper(Modem, path, interfaces))
 
         return modems
 
+    @property
+    def registry(self) -> ModemRegistry:
+        """
+        Live registry of the modems, loaded on first access and kept current from ObjectManager signals.
+        """
+        if self._registry is None:
+            registry = ModemRegistry(self)
+            registry.load()
+            self._registry = registry
+        return self._registry
+
+    def map_modems(self, fn: Callable[[Modem], Any], max_workers: int = 16, timeout: float = None,
+                   modems: List[Modem] = None) -> List[ModemResult]:
+        """
+        Run fn against every modem in parallel on a bounded pool of worker threads.
+
+        Exceptions raised by fn are collected per modem instead of aborting the batch.
+        Modems that have not finished when the timeout expires are reported with a TimeoutError, and modems
+        not started by then are skipped. A timed-out call keeps running in the background until fn returns,
+        on a daemon worker thread, so a hung modem can neither stall the batch nor keep the process from exiting.
+        :param fn: Callable taking a Modem, e.g. lambda modem: modem.SignalQuality.
+        :param max_workers: Maximum number of modems handled at the same time.
+        :param timeout: Seconds to wait for the whole batch, or None to wait for every modem.
+        :param modems: Modems to run fn against, defaults to all modems.
+        :return: One ModemResult per modem, in the order of the modems.
+        """
+        if modems is None:
+            modems = self.modems
+        if not modems:
+            return []
+        futures = [Future() for _ in modems]
+        work = collections.deque(zip(modems, futures))
+
+        def worker():
+            while True:
+                try:
+                    modem, future = work.popleft()
+                except IndexError:
+                    return
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(fn(modem))
+                except BaseException as e:
+                    future.set_exception(e)
+
+        for i in range(min(max_workers, len(modems))):
+            threading.Thread(target=worker, name=f'map_modems_{i}', daemon=True).start()
+        wait(futures, timeout=timeout)
+        for future in futures:
+            # only succeeds for modems no worker has started yet
+            future.cancel()
+
+        results = []
+        for modem, future in zip(modems, futures):
+            if not future.done():
+                results.append(ModemResult(modem, None, TimeoutError(f'{modem.path} did not finish in {timeout}s')))
+            elif future.cancelled():
+                results.append(ModemResult(modem, None, TimeoutError(f'{modem.path} was not started in {timeout}s')))
+            elif future.exception() is not None:
+                results.append(ModemResult(modem, None, future.exception()))
+            else:
+                results.append(ModemResult(modem, future.result(), None))
+        return results
+
+    def get_object(self, path: str, interfaces: Iterable[str] = None):
+        """
+        Get the proxy of a ModemManager object, reusing the pooled one if the path was seen before.
+
+        If the interfaces of the object are given and bundled for the daemon's version, the proxy is built
+        from the bundled descriptions, otherwise the object is introspected.
+        :param path: D-Bus object path.
+        :param interfaces: Interfaces the object implements, if known.
+        """
+        interfaces = frozenset(interfaces or ())
+        with self._pool_lock:
+            self._prune()
+            proxy, known = self._proxies.get(path, (None, None))
+            if proxy is None or (known is not None and not known.issuperset(interfaces)):
+                proxy, known = self._create_proxy(path, interfaces | (known or frozenset()))
+                self._proxies[path] = (proxy, known)
+            return proxy
+
+    def _create_proxy(self, path: str, interfaces: frozenset) -> Tuple[object, Optional[frozenset]]:
+        if interfaces and self._introspection:
+            proxy_class = self._proxy_classes.get(interfaces)
+            if proxy_class is None:
+                node = MMIntrospection.build_node(self._introspection, sorted(interfaces))
+                if node is not None:
+                    proxy_class = self.backend.proxy_class(node)
+                    self._proxy_classes[interfaces] = proxy_class
+            if proxy_class is not None:
+                return proxy_class(path), interfaces
+        # introspected proxies describe every interface of the object
+        return self.backend.introspect(path), None
+
+    def get_wrapper(self, cls: Type[Wrapper], path: str, properties: Dict[str, Dict[str, object]] = None) -> Wrapper:
+        """
+        Get the wrapper of type cls for a ModemManager object, reusing the pooled one if the path was seen before,
+        so that repeated lookups of the same object return the same wrapper.
+
+        Wrappers are pooled weakly: a wrapper the application no longer references is collected, and its pooled
+        proxy and signal handlers are dropped with it, so a long-running process does not accumulate wrappers of
+        objects that come and go.
+
+        :param cls: Wrapper class, e.g. Modem or SIM.
+        :param path: D-Bus object path.
+        :param properties: Optional interface -> properties mapping to (re)seed the wrapper's property cache with.
+        """
+        proxy = self.get_object(path, properties.keys() if properties else (cls.INTERFACE,))
+        with self._pool_lock:
+            wrapper = self._wrappers.get(path)
+            if type(wrapper) is not cls:
+                wrapper = self._adopt_orphan(cls, path, proxy, properties) or cls(self, proxy)
+                self._wrappers[path] = wrapper
+                weakref.finalize(wrapper, self._collected.append, path)
+            else:
+                wrapper._instance = proxy
+        if properties:
+            wrapper.seed_properties(properties)
+        return wrapper
+
+    def _adopt_orphan(self, cls: Type[Wrapper], path: str, proxy,
+                      properties: Optional[Dict[str, Dict[str, object]]]) -> Optional[Wrapper]:
+        # Called with the pool lock held: hand a wrapper left over from before a daemon restart,
+        # and its signal handlers, to the object re-exported with the same identity.
+        values = (properties or {}).get(cls.INTERFACE, {})
+        for name in cls.IDENTITY:
+            entry = self._orphans.get((name, values.get(name)))
+            if entry is not None and type(entry[0]()) is cls:
+                break
+        else:
+            return None
+        for key in [key for key, value in self._orphans.items() if value is entry]:
+            del self._orphans[key]
+        ref, handles = entry
+        wrapper = ref()
+        wrapper._instance = proxy
+        self.signals.attach(path, handles)
+        return wrapper
+
+    def recover(self):
+        """
+        Rebuild the proxies and wrappers after the daemon restarted.
+
+        The objects are re-enumerated with one GetManagedObjects() call and each modem is re-matched to its
+        wrapper by DeviceIdentifier or Device, so wrappers held by the application keep working under the
+        modem's new path, with the handlers registered with connect_signal(). Handlers connected on the proxy,
+        e.g. modem.StateChanged.connect(...), are lost. Wrappers that are not matched raise MMGoneError.
+
+        Called by the first call made after a restart; concurrent callers wait for it instead of sending
+        their own calls to stale paths.
+        :raises MMGoneError: The daemon has not come back yet.
+        """
+        with self._recover_lock:
+            if not self._stale:
+                return
+            if not self._daemon_present:
+                raise MMGoneError('ModemManager is not running')
+            with observed(self, 'ModemManager.recover', self.PATH):
+                if self._static_introspection:
+                    version = self.call(self.PATH, self.PROPERTIES_INTERFACE, 'Get', (self.INTERFACE, 'Version'))
+                    self._introspection = MMIntrospection.select_version(version)
+                self._instance = self.get_object(self.PATH, self.MANAGER_INTERFACES)
+                objects = self.call(self.PATH, self.OBJECT_MANAGER_INTERFACE, 'GetManagedObjects')
+                for path, interfaces in objects.items():
+                    if Modem.INTERFACE in interfaces:
+                        self.get_wrapper(Modem, path, interfaces)
+            self._stale = False
+        if self._registry is not None:
+            self._registry.load(objects)
+
+    def _prune(self):
+        # Called with the pool lock held. Wrapper finalizers only queue the path, since the garbage collector
+        # may run them on a thread that already holds the pool lock.
+        if not self._collected:
+            return
+        while self._collected:
+            path = self._collected.popleft()
+            if path not in self._wrappers:
+                self._proxies.pop(path, None)
+                self.signals.prune(path)
+                self.metrics.forget(path)
+        for key in [key for key, (ref, _) in self._orphans.items() if ref() is None]:
+            del self._orphans[key]
+
+    def get_sim(self, path: str) -> SIM:
+        """
+        The pooled SIM wrapper of an object path, e.g. modem.Sim.
+        """
+        return self.get_wrapper(SIM, path)
+
+    def get_bearer(self, path: str) -> Barer:
+        """
+        The pooled Barer wrapper of an object path, e.g. one of modem.Bearers.
+        """
+        return self.get_wrapper(Barer, path)
+
+    def get_sms(self, path: str) -> SMS:
+        """
+        The pooled SMS wrapper of an object path, e.g. one listed by the modem's Messaging interface.
+        """
+        return self.get_wrapper(SMS, path)
+
+    def get_call(self, path: str) -> Call:
+        """
+        The pooled Call wrapper of an object path, e.g. one listed by the modem's Voice interface.
+        """
+        return self.get_wrapper(Call, path)
+
+    def release(self, path: str):
+        """
+        Drop the pooled proxy and wrapper of an object path, and fold its metrics into the totals.
+
+        Modems are released automatically when ModemManager removes them;
+        SIM, bearer, SMS and call objects are not announced by the ObjectManager and can be released with this.
+        :param path: D-Bus object path.
+        """
+        with self._pool_lock:
+            self._proxies.pop(path, None)
+            self._wrappers.pop(path, None)
+        # handlers of the wrapper dropped above, unless the application still references it
+        self.signals.prune(path)
+        self.metrics.forget(path)
+
+    def close(self):
+        """
+        Stop the backend's threads, e.g. the main loop thread started with loop_thread=True, and the timer thread.
+        """
+        self.backend.close()
+        self.timers.close()
+
+    def call(self, path: str, interface: str, method: str, args: tuple = (), timeout: float = None,
+             cancel: CancelToken = None):
+        """
+        Call a method and wait for its reply. Enum arguments are sent as their values.
+
+        :param path: D-Bus object path.
+        :param interface: Interface of the method.
+        :param method: Method name.
+        :param args: Method arguments.
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the wait for the reply when cancelled.
+        :return: None, the single output argument, or a tuple of output arguments.
+        :raises MMTimeoutError: No reply arrived within the timeout.
+        :raises MMCancelledError: The token was cancelled.
+        """
+        if cancel is not None:
+            return self.gather([self.call_async(path, interface, method, args, timeout, cancel)])[0]
+        signature = self._method_signature(path, interface, method)
+        args = tuple(v.value if isinstance(v, enum.Enum) else v for v in args)
+        try:
+            return self.backend.call(path, interface, method, signature, args, timeout)
+        except Exception as e:
+            if self.backend.timed_out(e):
+                raise MMTimeoutError(path, interface, method, timeout) from e
+            raise
+
+    def call_async(self, path: str, interface: str, method: str, args: tuple = (), timeout: float = None,
+                   cancel: CancelToken = None) -> Future:
+        """
+        Send a method call without waiting for its reply.
+
+        Calls go out back-to-back on the bus connection and each reply is matched to its call by serial,
+        so N calls cost about one round trip. Collect the futures with gather().
+        Enum arguments are sent as their values.
+        :param path: D-Bus object path.
+        :param interface: Interface of the method.
+        :param method: Method name.
+        :param args: Method arguments.
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token failing the future with MMCancelledError when cancelled.
+        :return: Future resolved with None, the single output argument, or a tuple of output arguments.
+            It fails with MMTimeoutError if no reply arrived within the timeout.
+        """
+        if cancel is not None:
+            cancel.raise_if_cancelled()
+        signature = self._method_signature(path, interface, method)
+        args = tuple(v.value if isinstance(v, enum.Enum) else v for v in args)
+        reply = self.backend.call_async(path, interface, method, signature, args, timeout)
+        future = Future()
+        future.set_running_or_notify_cancel()
+
+        def on_reply(done: Future):
+            error = done.exception()
+            if error is None:
+                settle(future.set_result, done.result())
+            elif self.backend.timed_out(error):
+                timeout_error = MMTimeoutError(path, interface, method, timeout)
+                timeout_error.__cause__ = error
+                settle(future.set_exception, timeout_error)
+            else:
+                settle(future.set_exception, error)
+
+        reply.add_done_callback(on_reply)
+        if cancel is not None:
+            def on_cancel():
+                settle(future.set_exception, MMCancelledError(f'{interface}.{method} on {path} cancelled'))
+                self.backend.wakeup()
+
+            remove = cancel.add_callback(on_cancel)
+            future.add_done_callback(lambda _: remove())
+        return future
+
+    def gather(self, futures: List[Future], timeout: float = None) -> List:
+        """
+        Wait for the replies of calls sent with call_async().
+
+        With the pydbus backend and no running main loop, the default GLib main context is iterated
+        until every reply arrived.
+        :param futures: Futures returned by call_async().
+        :param timeout: Seconds to wait for all replies, or None to wait until the calls themselves time out.
+        :return: The results, in the order of the futures. The first failed call raises its exception.
+        """
+        return self.backend.gather(futures, timeout)
+
+    def _method_signature(self, path: str, interface: str, method: str) -> str:
+        signature = MMIntrospection.method_signature(self._introspection, interface, method)
+        if signature is None:
+            signature = self.backend.method_signature(self.get_object(path), interface, method)
+        return signature
+
+    def _subscribe_signals(self):
+        # One match rule covering every object of the daemon, routed in-process by path.
+        self.backend.subscribe(self.BUS_NAME, self.PATH, self.signals.dispatch)
+
+    def _on_name_owner_changed(self, old_owner: str, new_owner: str):
+        if old_owner:
+            self._on_daemon_lost()
+        self._daemon_present = bool(new_owner)
+
+    def _on_daemon_lost(self):
+        # Every object path of the old daemon is invalid now. Wrappers become GoneProxy-backed orphans,
+        # keyed by their identity properties so recover() or a later InterfacesAdded can adopt them again.
+        with self._pool_lock:
+            wrappers = list(self._wrappers.items())
+            self._wrappers = weakref.WeakValueDictionary()
+            self._proxies.clear()
+            self._stale = True
+            for path, wrapper in wrappers:
+                # the new daemon exports its objects under new paths
+                self.metrics.forget(path)
+                handles = self.signals.detach(path)
+                values = wrapper._properties.get(wrapper.INTERFACE, {})
+                for name in wrapper.IDENTITY:
+                    if values.get(name):
+                        self._orphans[(name, values[name])] = (weakref.ref(wrapper), handles)
+                wrapper._properties.clear()
+                wrapper._instance = GoneProxy(path)
+        self._properties.clear()
+        if self._registry is not None:
+            self._registry.clear()
+
+    def _on_interfaces_removed(self, path: str, interfaces: List[str]):
+        wrapper = self._wrappers.get(path)
+        if wrapper is None or wrapper.INTERFACE in interfaces:
+            self.release(path)
+            return
+        for interface in interfaces:
+            wrapper._properties.pop(interface, None)
+
     """
     Methods
     """
 
-    def ScanDevices(self):
+    def ScanDevices(self, timeout: float = None, cancel: CancelToken = None):
         """
         Start a new scan for connected modem devices.
 
         Since: 1.0
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         """
-        return self._instance.ScanDevices()
+        return self._call('ScanDevices', timeout=timeout, cancel=cancel)
 
-    def SetLogging(self, level: str):
+    def SetLogging(self, level: str, timeout: float = None, cancel: CancelToken = None):
         """
         Set logging verbosity.
 
         Since: 1.0
         :param level: One of "ERR", "WARN", "INFO", "DEBUG".
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         """
-        return self._instance.SetLogging(level)
+        return self._call('SetLogging', level, timeout=timeout, cancel=cancel)
 
-    def ReportKernelEvent(self, properties: List[Tuple[str, object]]):
+    def ReportKernelEvent(self, properties: List[Tuple[str, object]],
+                          timeout: float = None, cancel: CancelToken = None):
         """
         Reports a kernel event to ModemManager.
 
@@ -82,11 +518,13 @@ class ModemManager(MMInterface):
 
         Since: 1.8
         :param properties:
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         :return:
         """
-        return self._instance.ReportKernelEvent(properties)
+        return self._call('ReportKernelEvent', properties, timeout=timeout, cancel=cancel)
 
-    def InhibitDevice(self, uid: str, inhibit: bool):
+    def InhibitDevice(self, uid: str, inhibit: bool, timeout: float = None, cancel: CancelToken = None):
         """
         org.freedesktop.ModemManager1.Modem:Device property. inhibit: TRUE to inhibit the modem and FALSE to uninhibit it.
 
@@ -101,11 +539,13 @@ class ModemManager(MMInterface):
         Since: 1.10
         :param uid: the unique ID of the physical device, given in the
         :param inhibit:
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         """
-        return self._instance.InhibitDevice(uid, inhibit)
+        return self._call('InhibitDevice', uid, inhibit, timeout=timeout, cancel=cancel)
 
-    def GetManagedObjects(self) -> Dict:
-        return self._instance.GetManagedObjects()
+    def GetManagedObjects(self, timeout: float = None, cancel: CancelToken = None) -> Dict:
+        return self._call('GetManagedObjects', interface=self.OBJECT_MANAGER_INTERFACE, timeout=timeout, cancel=cancel)
 
     """
     Properties
@@ -119,4 +559,4 @@ class ModemManager(MMInterface):
         Since: 1.10
         :return: string
         """
-        return self._instance.Version
+        return self._get_property('Version')
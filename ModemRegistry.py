@@ -0,0 +1,109 @@
+import threading
+from typing import Callable, Dict, Iterator, List, Optional, TYPE_CHECKING
+
+from Modem import Modem
+
+if TYPE_CHECKING:
+    from ModemManager import ModemManager
+
+
+class ModemRegistry(object):
+    """
+    The modems exported by ModemManager, loaded once with GetManagedObjects() and then kept current from the
+    ObjectManager InterfacesAdded and InterfacesRemoved signals.
+
+    With the pydbus backend, signals are only delivered while a GLib main loop is running.
+    """
+
+    def __init__(self, manager: 'ModemManager'):
+        self._manager = manager
+        self._lock = threading.RLock()
+        self._modems: Dict[str, Modem] = {}
+        self._added_callbacks: List[Callable[[Modem], None]] = []
+        self._removed_callbacks: List[Callable[[Modem], None]] = []
+        self._loaded = False
+
+    def load(self, objects: Dict[str, Dict[str, Dict[str, object]]] = None):
+        """
+        Start following the signals and (re)load the modems with a single GetManagedObjects() call.
+
+        :param objects: Result of a GetManagedObjects() call just made, to load from instead of calling it again.
+        """
+        with self._lock:
+            if not self._loaded:
+                self._manager.connect_signal('InterfacesAdded', self._on_interfaces_added,
+                                             self._manager.OBJECT_MANAGER_INTERFACE)
+                self._manager.connect_signal('InterfacesRemoved', self._on_interfaces_removed,
+                                             self._manager.OBJECT_MANAGER_INTERFACE)
+                self._loaded = True
+            if objects is None:
+                objects = self._manager.GetManagedObjects()
+            for path in [path for path in self._modems if path not in objects]:
+                self._remove(path)
+            for path, interfaces in objects.items():
+                self._on_interfaces_added(path, interfaces)
+
+    def clear(self):
+        """
+        Forget every modem, calling the removed callbacks, e.g. when the daemon went away.
+        """
+        for path in list(self._modems):
+            self._remove(path)
+
+    def get(self, path: str) -> Optional[Modem]:
+        """
+        The modem with the given object path, or None.
+        """
+        return self._modems.get(path)
+
+    def __getitem__(self, path: str) -> Modem:
+        return self._modems[path]
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._modems
+
+    def __len__(self) -> int:
+        return len(self._modems)
+
+    def __iter__(self) -> Iterator[Modem]:
+        with self._lock:
+            return iter(list(self._modems.values()))
+
+    def on_added(self, callback: Callable[[Modem], None]) -> Callable[[Modem], None]:
+        """
+        Register a callback called with each modem that appears. Can be used as a decorator.
+        """
+        self._added_callbacks.append(callback)
+        return callback
+
+    def on_removed(self, callback: Callable[[Modem], None]) -> Callable[[Modem], None]:
+        """
+        Register a callback called with each modem that disappears. Can be used as a decorator.
+        """
+        self._removed_callbacks.append(callback)
+        return callback
+
+    def _on_interfaces_added(self, path: str, interfaces: Dict[str, Dict[str, object]]):
+        with self._lock:
+            modem = self._modems.get(path)
+            if modem is not None:
+                self._manager.get_wrapper(Modem, path, interfaces)
+                return
+            if Modem.INTERFACE not in interfaces:
+                return
+            modem = self._manager.get_wrapper(Modem, path, interfaces)
+            self._modems[path] = modem
+        for callback in list(self._added_callbacks):
+            callback(modem)
+
+    def _on_interfaces_removed(self, path: str, interfaces: List[str]):
+        if Modem.INTERFACE in interfaces:
+            self._remove(path)
+
+    def _remove(self, path: str):
+        with self._lock:
+            modem = self._modems.pop(path, None)
+        if modem is None:
+            return
+        for callback in list(self._removed_callbacks):
+            callback(modem)
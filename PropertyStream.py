@@ -0,0 +1,174 @@
+import math
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional, Tuple
+
+from MMBackend import TimerQueue
+
+
+class PropertyChange(NamedTuple):
+    """
+    One property of one object changing value, from org.freedesktop.DBus.Properties.PropertiesChanged.
+    """
+    path: str
+    interface: str
+    property: str
+    old: Any
+    new: Any
+
+
+class PropertyStream(object):
+    """
+    Stream of PropertyChange events of one wrapper object, created with MMInterface.subscribe().
+
+    Without windows every change is delivered as it arrives. With a coalesce and/or debounce window, changes
+    are held back and merged per (interface, property) into one event carrying the first old and the last new
+    value; merged changes that end on the value they started from are dropped. Held changes are delivered when
+    `debounce` seconds pass without a new change, or `coalesce` seconds after the first held change,
+    whichever comes first.
+
+    Events go to the callback if one is given, otherwise they are queued for iteration:
+
+        with modem.subscribe(['SignalQuality', 'AccessTechnologies'], coalesce=1.0) as stream:
+            for change in stream:
+                ...
+
+    Callbacks are called from the thread delivering signals, or, when a window is set, from the timer thread
+    every stream of the manager shares, so slow callbacks delay the other streams' events. With the pydbus
+    backend, signals are only delivered while a GLib main loop is running.
+    """
+
+    def __init__(self, owner, properties: Iterable[str] = None, interfaces: Iterable[str] = None,
+                 callback: Callable[[PropertyChange], None] = None, coalesce: float = 0.0, debounce: float = 0.0,
+                 timers: TimerQueue = None):
+        """
+        :param timers: Timer thread delivering the held changes, shared with other streams; the stream starts
+            its own if a window is set and none is given.
+        """
+        self._owner = owner
+        self._properties = frozenset(properties) if properties else None
+        self._interfaces = frozenset(interfaces) if interfaces else None
+        self._callback = callback
+        self._coalesce = coalesce
+        self._debounce = debounce
+        self._queue: 'queue.Queue[Optional[PropertyChange]]' = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple[str, str], PropertyChange] = {}
+        self._first = 0.0
+        self._last = 0.0
+        self._closed = False
+        self._windowed = coalesce > 0 or debounce > 0
+        self._own_timers = self._windowed and timers is None
+        self._timers = TimerQueue('PropertyStream') if self._own_timers else timers
+        self._timer: Optional[list] = None
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self):
+        """
+        Stop the stream. Held changes are delivered first, and iteration ends once the queue is drained.
+        """
+        if self._closed:
+            return
+        self._owner._unsubscribe(self)
+        with self._lock:
+            self._closed = True
+            if self._timer is not None:
+                self._timers.cancel(self._timer)
+                self._timer = None
+            changes = list(self._pending.values())
+            self._pending.clear()
+        self._deliver_held(changes)
+        if self._own_timers:
+            self._timers.close()
+        self._queue.put(None)
+
+    def get(self, timeout: float = None) -> Optional[PropertyChange]:
+        """
+        Wait for the next event.
+
+        :param timeout: Seconds to wait, or None to wait until an event arrives or the stream is closed.
+        :return: The event, or None if the stream was closed or the timeout expired.
+        """
+        try:
+            change = self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        if change is None:
+            self._queue.put(None)
+        return change
+
+    def __iter__(self):
+        while True:
+            change = self.get()
+            if change is None:
+                return
+            yield change
+
+    def __enter__(self) -> 'PropertyStream':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _accepts(self, change: PropertyChange) -> bool:
+        if self._properties is not None and change.property not in self._properties:
+            return False
+        if self._interfaces is not None and change.interface not in self._interfaces:
+            return False
+        return True
+
+    def _push(self, change: PropertyChange):
+        if self._closed or not self._accepts(change):
+            return
+        if not self._windowed:
+            self._deliver(change)
+            return
+        with self._lock:
+            now = time.monotonic()
+            key = (change.interface, change.property)
+            held = self._pending.get(key)
+            if held is not None:
+                change = held._replace(new=change.new)
+            if not self._pending:
+                self._first = now
+            self._pending[key] = change
+            self._last = now
+            if self._timer is None:
+                self._timer = self._timers.schedule(self._deadline() - now, self._flush)
+
+    def _deadline(self) -> float:
+        deadline = math.inf
+        if self._coalesce > 0:
+            deadline = self._first + self._coalesce
+        if self._debounce > 0:
+            deadline = min(deadline, self._last + self._debounce)
+        return deadline
+
+    def _flush(self):
+        # runs on the timer thread; a debounce window may have moved the deadline since the timer was set
+        with self._lock:
+            self._timer = None
+            if self._closed or not self._pending:
+                return
+            remaining = self._deadline() - time.monotonic()
+            if remaining > 0:
+                self._timer = self._timers.schedule(remaining, self._flush)
+                return
+            changes = list(self._pending.values())
+            self._pending.clear()
+        self._deliver_held(changes)
+
+    def _deliver_held(self, changes):
+        for change in changes:
+            if change.old != change.new:
+                self._deliver(change)
+
+    def _deliver(self, change: PropertyChange):
+        if self._callback is not None:
+            self._callback(change)
+        else:
+            self._queue.put(change)
@@ -0,0 +1,197 @@
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import Future, wait
+from typing import Callable, List, Optional
+
+from gi.repository import GLib, Gio
+from pydbus import SystemBus
+from pydbus.proxy import CompositeInterface
+
+from MMBackend import MMBackend, SignalQueue
+
+
+class PydbusBackend(MMBackend):
+    """
+    Backend on pydbus and GDBus. Signals and the replies of asynchronous calls are delivered through the
+    default GLib main context, so a GLib main loop has to run for signals to arrive.
+
+    Either run the main loop yourself, or let the backend own it with start(): the loop then runs on a
+    dedicated thread, calls made from other threads are marshalled onto it, and signals are handed to a
+    dispatch thread so handlers never block the loop.
+    """
+
+    def __init__(self, main_loop=None, system_bus=None):
+        """
+        :param main_loop: GLib main loop signals are delivered on.
+        :param system_bus: Bus to use instead of the system bus.
+        """
+        self.loop = main_loop if main_loop else GLib.MainLoop()
+        self.bus = system_bus if system_bus else SystemBus()
+        self._thread: Optional[threading.Thread] = None
+        self._signals: Optional[SignalQueue] = None
+
+    def start(self):
+        """
+        Run the main loop on a dedicated daemon thread.
+        """
+        if self._thread is not None:
+            return
+        self._signals = SignalQueue()
+        self._thread = threading.Thread(target=self.loop.run, name='GLibMainLoop', daemon=True)
+        self._thread.start()
+
+    def close(self):
+        """
+        Quit the main loop thread started by start(), once the queued signals are handled.
+        """
+        if self._thread is None:
+            return
+        self.loop.quit()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+        self._signals.close()
+        self._thread = None
+        self._signals = None
+
+    def _marshalled(self) -> bool:
+        # calls from other threads go through the loop thread while the backend owns it
+        return self._thread is not None and self._thread is not threading.current_thread()
+
+    def invoke(self, fn: Callable, *args) -> Future:
+        """
+        Run fn on the main loop thread, or right away if the backend does not own a running loop thread.
+
+        :return: Future resolved with the return value of fn.
+        """
+        future = Future()
+
+        def run():
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn(*args))
+                except BaseException as e:
+                    future.set_exception(e)
+            return False
+
+        if self._marshalled():
+            GLib.idle_add(run)
+        else:
+            run()
+        return future
+
+    @property
+    def dispatching(self) -> bool:
+        return self.loop.is_running()
+
+    def proxy_class(self, node: ET.Element) -> Callable[[str], object]:
+        cls = CompositeInterface(node)
+        return lambda path: cls(self.bus, self.BUS_NAME, path)
+
+    def introspect(self, path: str):
+        return self.bus.get(self.BUS_NAME, path)
+
+    def method_signature(self, proxy, interface: str, method: str) -> str:
+        # input signature of the pydbus method, "(...)"
+        return getattr(type(proxy[interface]), method)._sinargs[1:-1]
+
+    def call_async(self, path: str, interface: str, method: str, signature: str, args: tuple,
+                   timeout: float = None) -> Future:
+        """
+        Calls go out back-to-back on the bus connection and GDBus matches each reply to its call by serial,
+        so N calls cost about one round trip. Replies are delivered through the GLib main context:
+        either run the main loop, or collect the futures with gather().
+        """
+        future = Future()
+        future.set_running_or_notify_cancel()
+        args = GLib.Variant(f'({signature})', args)
+
+        def on_reply(connection, result, _):
+            try:
+                reply = connection.call_finish(result).unpack()
+            except GLib.Error as e:
+                future.set_exception(e)
+                return
+            if len(reply) == 0:
+                future.set_result(None)
+            elif len(reply) == 1:
+                future.set_result(reply[0])
+            else:
+                future.set_result(reply)
+
+        def send():
+            self.bus.con.call(self.BUS_NAME, path, interface, method, args, None, Gio.DBusCallFlags.NONE,
+                              -1 if timeout is None else int(timeout * 1000), None, on_reply, None)
+
+        self.invoke(send)
+        return future
+
+    def call(self, path: str, interface: str, method: str, signature: str, args: tuple, timeout: float = None):
+        """
+        While the backend owns the loop thread, calls from other threads are sent from the loop thread and
+        wait for their reply there; otherwise they are sent with a blocking call on the calling thread.
+        """
+        if self._marshalled():
+            return self.call_async(path, interface, method, signature, args, timeout).result()
+        reply = self.bus.con.call_sync(self.BUS_NAME, path, interface, method, GLib.Variant(f'({signature})', args),
+                                       None, Gio.DBusCallFlags.NONE, -1 if timeout is None else int(timeout * 1000),
+                                       None).unpack()
+        if len(reply) == 0:
+            return None
+        if len(reply) == 1:
+            return reply[0]
+        return reply
+
+    def watch_name_owner(self, name: str, callback: Callable[[str, str], None]):
+        def on_signal(connection, sender_name, path, interface, member, parameters):
+            _, old_owner, new_owner = parameters.unpack()
+            if self._signals is not None:
+                self._signals.put(callback, old_owner, new_owner)
+            else:
+                callback(old_owner, new_owner)
+
+        self.bus.con.signal_subscribe('org.freedesktop.DBus', 'org.freedesktop.DBus', 'NameOwnerChanged',
+                                      '/org/freedesktop/DBus', name, Gio.DBusSignalFlags.NONE, on_signal)
+
+    def timed_out(self, error: BaseException) -> bool:
+        if not isinstance(error, GLib.Error):
+            return False
+        return (error.matches(Gio.io_error_quark(), Gio.IOErrorEnum.TIMED_OUT)
+                or Gio.DBusError.get_remote_error(error) == 'org.freedesktop.DBus.Error.NoReply')
+
+    def wakeup(self):
+        GLib.MainContext.default().wakeup()
+
+    def gather(self, futures: List[Future], timeout: float = None) -> List:
+        """
+        If the main loop is not running, the default GLib main context is iterated until every reply arrived.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if self._thread is not None or self.loop.is_running():
+            wait(futures, timeout=timeout)
+        else:
+            context = GLib.MainContext.default()
+            wakeup = None if timeout is None else GLib.timeout_add(int(timeout * 1000), lambda: False)
+            while not all(f.done() for f in futures):
+                if deadline is not None and time.monotonic() >= deadline:
+                    break
+                context.iteration(True)
+            if wakeup is not None and time.monotonic() < deadline:
+                GLib.source_remove(wakeup)
+        return [f.result(timeout=0) for f in futures]
+
+    def subscribe(self, sender: str, path_namespace: str, callback: Callable[[str, str, str, tuple], None]):
+        # One match rule covering the whole namespace; GDBus then hands every signal of the sender to the
+        # callback without adding a rule per subscription.
+        rule = f"type='signal',sender='{sender}',path_namespace='{path_namespace}'"
+        self.bus.con.call_sync('org.freedesktop.DBus', '/org/freedesktop/DBus', 'org.freedesktop.DBus', 'AddMatch',
+                               GLib.Variant('(s)', (rule,)), None, Gio.DBusCallFlags.NONE, -1, None)
+
+        def on_signal(connection, sender_name, path, interface, member, parameters):
+            if path == path_namespace or path.startswith(path_namespace.rstrip('/') + '/'):
+                if self._signals is not None:
+                    self._signals.put(callback, path, interface, member, parameters.unpack())
+                else:
+                    callback(path, interface, member, parameters.unpack())
+
+        self.bus.con.signal_subscribe(sender, None, None, None, None, Gio.DBusSignalFlags.NO_MATCH_RULE, on_signal)
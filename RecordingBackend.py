@@ -0,0 +1,301 @@
+"""
+Recording of the D-Bus traffic of a backend, one JSON object per line, gzip-compressed if the file name ends
+in ".gz". The first line describes the recording; every other line is an event, with "t" the seconds since
+the recording started:
+
+    {"t": 0.12, "call": [path, interface, method, signature, args], "d": 0.003, "reply": value}
+    {"t": 0.12, "call": [path, interface, method, signature, args], "d": 25.0, "error": [name, message]}
+    {"t": 3.40, "signal": [path_namespace, path, interface, member, args]}
+    {"t": 3.40, "direct": [path, interface, member, args]}
+    {"t": 9.87, "owner": [name, old_owner, new_owner]}
+
+Values are JSON values, except tuples, dictionaries whose keys are not all strings, bytes and variants, which
+become single-key objects: {"(": [...]}, {"{": [[key, value], ...]}, {"y": base64}, {"v": [signature, value]}.
+"""
+
+import base64
+import enum
+import gzip
+import json
+import re
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import Future
+from typing import Callable, Dict, IO, Iterator, List, Tuple
+
+from DBusSocket import DBusError, Variant
+from MMBackend import MMBackend
+from SignalRouter import SignalRouter
+
+FORMAT = 1
+FAILED = 'org.freedesktop.DBus.Error.Failed'
+NO_REPLY = 'org.freedesktop.DBus.Error.NoReply'
+_TAGS = frozenset(('(', '{', 'y', 'v'))
+_GDBUS_ERROR = re.compile(r'GDBus\.Error:([\w.-]+): (.*)', re.DOTALL)
+_FLUSH_INTERVAL = 1.0
+
+
+def encode(value):
+    """
+    JSON-compatible form of a D-Bus value, see the module description.
+    """
+    if value is None or isinstance(value, (bool, str, float)):
+        return value
+    if isinstance(value, enum.Enum):
+        return encode(value.value)
+    if isinstance(value, int):
+        return value
+    if isinstance(value, list):
+        return [encode(v) for v in value]
+    if isinstance(value, tuple):
+        return {'(': [encode(v) for v in value]}
+    if isinstance(value, dict):
+        if all(isinstance(k, str) for k in value) and not (len(value) == 1 and next(iter(value)) in _TAGS):
+            return {k: encode(v) for k, v in value.items()}
+        return {'{': [[encode(k), encode(v)] for k, v in value.items()]}
+    if isinstance(value, (bytes, bytearray)):
+        return {'y': base64.b64encode(value).decode()}
+    if isinstance(value, Variant):
+        return {'v': [value.signature, encode(value.value)]}
+    if hasattr(value, 'get_type_string'):
+        # GLib.Variant, e.g. in arguments given to the pydbus backend
+        return encode(value.unpack())
+    raise TypeError(f'Cannot record {type(value).__name__} value {value!r}')
+
+
+def decode(value):
+    """
+    D-Bus value of the JSON-compatible form made by encode().
+    """
+    if isinstance(value, list):
+        return [decode(v) for v in value]
+    if not isinstance(value, dict):
+        return value
+    if len(value) == 1:
+        tag, inner = next(iter(value.items()))
+        if tag == '(':
+            return tuple(decode(v) for v in inner)
+        if tag == '{':
+            return {_hashable(decode(k)): decode(v) for k, v in inner}
+        if tag == 'y':
+            return base64.b64decode(inner)
+        if tag == 'v':
+            return Variant(inner[0], decode(inner[1]))
+    return {k: decode(v) for k, v in value.items()}
+
+
+def _hashable(key):
+    return tuple(key) if isinstance(key, list) else key
+
+
+def open_recording(file: str, mode: str) -> IO[str]:
+    if file.endswith('.gz'):
+        return gzip.open(file, mode + 't', encoding='utf-8')
+    return open(file, mode, encoding='utf-8')
+
+
+def read_recording(file: str) -> Tuple[Dict[str, object], List[Dict[str, object]]]:
+    """
+    Header and events of a recording. A recording cut off by a crash is read up to its last complete event.
+
+    :return: The header and the events, in the order they were written.
+    """
+    header = None
+    events = []
+    with open_recording(file, 'r') as f:
+        lines: Iterator[str] = iter(f)
+        try:
+            header = json.loads(next(lines, 'null'))
+            for line in lines:
+                events.append(json.loads(line))
+        except (EOFError, gzip.BadGzipFile, ValueError):
+            # the last line of a recording cut off by a crash may be incomplete
+            pass
+    if not isinstance(header, dict) or header.get('format') != FORMAT:
+        raise ValueError(f'{file} is not a recording of format {FORMAT}')
+    return header, events
+
+
+class RecordingBackend(MMBackend):
+    """
+    Backend passing everything on to another backend, writing each method call with its reply or error,
+    and each signal, to a recording file for ReplayBackend:
+
+        manager = ModemManager(backend=RecordingBackend(SocketBackend(), 'incident.jsonl.gz'))
+        ...
+        manager.close()
+
+    Everything the wrappers send through the manager is recorded: method calls, property reads, and the
+    signals delivered to subscribe(), connect_signal() and watch_name_owner(). Members called or connected
+    straight on the proxies of the pydbus backend bypass the backend and are not recorded. The file is flushed
+    about once a second, so a recording of a process that crashed is readable up to shortly before the crash;
+    close() completes it.
+    """
+
+    def __init__(self, backend: MMBackend, file: str):
+        """
+        :param backend: Backend to record the traffic of.
+        :param file: Recording to write, gzip-compressed if the name ends in ".gz".
+        """
+        self.backend = backend
+        self.file = file
+        self._lock = threading.Lock()
+        self._file = open_recording(file, 'w')
+        self._start = time.monotonic()
+        self._flushed = self._start
+        self._subscriptions: Dict[Tuple[str, str], List[Callable]] = {}
+        self._owner_callbacks: Dict[str, List[Callable[[str, str], None]]] = {}
+        self._direct = SignalRouter()
+        self._direct_keys = set()
+        self._write({'format': FORMAT, 'started': time.time(), 'backend': type(backend).__name__})
+
+    def _write(self, event: Dict[str, object]):
+        line = json.dumps(event, separators=(',', ':'))
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(line + '\n')
+            now = time.monotonic()
+            if now - self._flushed > _FLUSH_INTERVAL:
+                self._file.flush()
+                self._flushed = now
+
+    def _now(self) -> float:
+        return round(time.monotonic() - self._start, 6)
+
+    def _record_call(self, start: float, path: str, interface: str, method: str, signature: str, args: tuple,
+                     result=None, error: BaseException = None):
+        event = {'t': round(start - self._start, 6), 'call': [path, interface, method, signature, encode(list(args))],
+                 'd': round(time.monotonic() - start, 6)}
+        if error is None:
+            event['reply'] = encode(result)
+        else:
+            event['error'] = self._error_name(error)
+        self._write(event)
+
+    def _error_name(self, error: BaseException) -> List[str]:
+        if self.backend.timed_out(error):
+            return [NO_REPLY, str(error)]
+        if isinstance(error, DBusError):
+            return [error.name, error.message]
+        match = _GDBUS_ERROR.search(str(error))
+        if match is not None:
+            return [match.group(1), match.group(2)]
+        return [FAILED, f'{type(error).__name__}: {error}']
+
+    """
+    Backend interface
+    """
+
+    @property
+    def dispatching(self) -> bool:
+        return self.backend.dispatching
+
+    def proxy_class(self, node: ET.Element) -> Callable[[str], object]:
+        return self.backend.proxy_class(node)
+
+    def introspect(self, path: str):
+        return self.backend.introspect(path)
+
+    def method_signature(self, proxy, interface: str, method: str) -> str:
+        return self.backend.method_signature(proxy, interface, method)
+
+    def call_async(self, path: str, interface: str, method: str, signature: str, args: tuple,
+                   timeout: float = None) -> Future:
+        start = time.monotonic()
+        future = self.backend.call_async(path, interface, method, signature, args, timeout)
+
+        def record(done: Future):
+            if done.cancelled():
+                return
+            error = done.exception()
+            self._record_call(start, path, interface, method, signature, args,
+                              None if error is not None else done.result(), error)
+
+        future.add_done_callback(record)
+        return future
+
+    def call(self, path: str, interface: str, method: str, signature: str, args: tuple, timeout: float = None):
+        start = time.monotonic()
+        try:
+            result = self.backend.call(path, interface, method, signature, args, timeout)
+        except Exception as e:
+            self._record_call(start, path, interface, method, signature, args, error=e)
+            raise
+        self._record_call(start, path, interface, method, signature, args, result)
+        return result
+
+    def gather(self, futures: List[Future], timeout: float = None) -> List:
+        return self.backend.gather(futures, timeout)
+
+    def subscribe(self, sender: str, path_namespace: str, callback: Callable[[str, str, str, tuple], None]):
+        # one subscription per namespace below, so each signal is recorded once
+        key = (sender, path_namespace)
+        with self._lock:
+            callbacks = self._subscriptions.get(key)
+            new = callbacks is None
+            if new:
+                callbacks = self._subscriptions[key] = []
+            callbacks.append(callback)
+        if not new:
+            return
+
+        def on_signal(path: str, interface: str, member: str, args: tuple):
+            self._write({'t': self._now(), 'signal': [path_namespace, path, interface, member, encode(list(args))]})
+            for subscriber in list(callbacks):
+                subscriber(path, interface, member, args)
+
+        self.backend.subscribe(sender, path_namespace, on_signal)
+
+    def connect_signal(self, path: str, interface: str, member: str, callback: Callable):
+        """
+        Connect a handler to one signal of one object, through the recorded backend's connect_signal().
+
+        :return: Handle with a disconnect() method.
+        """
+        key = (path, interface, member)
+        with self._lock:
+            new = key not in self._direct_keys
+            self._direct_keys.add(key)
+        if new:
+            def on_signal(*args):
+                self._write({'t': self._now(), 'direct': [path, interface, member, encode(list(args))]})
+                self._direct.dispatch(path, interface, member, args)
+
+            self.backend.connect_signal(path, interface, member, on_signal)
+        return self._direct.connect(path, interface, member, lambda *args: callback(*args))
+
+    def watch_name_owner(self, name: str, callback: Callable[[str, str], None]):
+        with self._lock:
+            callbacks = self._owner_callbacks.get(name)
+            new = callbacks is None
+            if new:
+                callbacks = self._owner_callbacks[name] = []
+            callbacks.append(callback)
+        if not new:
+            return
+
+        def on_owner_changed(old_owner: str, new_owner: str):
+            self._write({'t': self._now(), 'owner': [name, old_owner, new_owner]})
+            for watcher in list(callbacks):
+                watcher(old_owner, new_owner)
+
+        self.backend.watch_name_owner(name, on_owner_changed)
+
+    def timed_out(self, error: BaseException) -> bool:
+        return self.backend.timed_out(error)
+
+    def wakeup(self):
+        self.backend.wakeup()
+
+    def start(self):
+        self.backend.start()
+
+    def close(self):
+        """
+        Close the recorded backend and complete the recording.
+        """
+        self.backend.close()
+        with self._lock:
+            self._file.close()
@@ -0,0 +1,245 @@
+import collections
+import json
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import Future
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+import MMIntrospection
+from DBusSocket import DBusError
+from MMBackend import MMBackend, SignalQueue, TimerQueue
+from RecordingBackend import NO_REPLY, decode, encode, read_recording
+from SignalRouter import SignalRouter
+from SocketBackend import PROPERTIES_INTERFACE, SocketProxy, SocketProxyClass
+
+MANAGER_INTERFACE = 'org.freedesktop.ModemManager1'
+OBJECT_MANAGER_INTERFACE = 'org.freedesktop.DBus.ObjectManager'
+NOT_RECORDED = 'org.freedesktop.DBus.Error.UnknownMethod'
+
+Reply = Tuple[float, object, Optional[List[str]]]
+
+
+class ReplayBackend(MMBackend):
+    """
+    Backend serving a recording made with RecordingBackend, to replay an incident offline without modems
+    or a bus, e.g. to profile the wrappers and the application's handlers under it:
+
+        backend = ReplayBackend('incident.jsonl.gz', speed=10)
+        manager = ModemManager(backend=backend)
+        manager.registry.on_added(on_modem)
+        backend.play()
+        backend.wait()
+
+    Method calls are answered with the recorded replies: a call is matched by its object path, interface,
+    method and arguments, and repeated calls get the recorded replies in the order they were recorded, the last
+    one from then on. Calls with arguments that were never recorded get the replies of the same method on the
+    same object, and calls never made in the recording fail with UnknownMethod.
+
+    play() delivers the recorded signals and bus name owner changes in their original order and timing,
+    divided by speed; a speed of 0 delivers them as fast as the handlers take them, and max_gap shortens
+    quiet periods. Replies arrive after their recorded latency, divided by speed, from a timer thread; calls
+    still waiting when the backend is closed fail with ConnectionError.
+    Signal handlers run on a dispatch thread.
+    """
+
+    def __init__(self, file: str, speed: float = 1.0, max_gap: float = None):
+        """
+        :param file: Recording made with RecordingBackend.
+        :param speed: Factor by which the replay runs faster than the recording, or 0 to not wait at all.
+        :param max_gap: Longest pause in seconds of the recording between two signals, longer ones are cut short.
+        """
+        self.header, events = read_recording(file)
+        self.speed = speed
+        self.max_gap = max_gap
+        self._replies: Dict[Tuple[str, str, str, str], Deque[Reply]] = collections.defaultdict(collections.deque)
+        self._method_replies: Dict[Tuple[str, str, str], Deque[Reply]] = collections.defaultdict(collections.deque)
+        self._interfaces: Dict[str, set] = collections.defaultdict(set)
+        self._version: Optional[str] = None
+        self._timeline: List[Dict[str, object]] = []
+        for event in events:
+            if 'call' in event:
+                self._load_call(event)
+            else:
+                self._timeline.append(event)
+                if 'signal' in event:
+                    self._learn_signal(*event['signal'][1:])
+        self._timeline.sort(key=lambda e: e['t'])
+        self._lock = threading.Lock()
+        self._subscriptions: List[Tuple[str, Callable]] = []
+        self._owner_callbacks: Dict[str, List[Callable[[str, str], None]]] = collections.defaultdict(list)
+        self._proxy_classes: Dict[frozenset, SocketProxyClass] = {}
+        self._direct = SignalRouter()
+        self._signals = SignalQueue('ReplaySignalDispatch')
+        self._timers = TimerQueue('ReplayReplies')
+        self._player: Optional[threading.Thread] = None
+        self._finished = threading.Event()
+        self._stop = threading.Event()
+        self._closed = False
+
+    def _load_call(self, event: Dict[str, object]):
+        path, interface, method, _, args = event['call']
+        reply: Reply = (event['d'], event.get('reply'), event.get('error'))
+        self._replies[(path, interface, method, json.dumps(args, sort_keys=True))].append(reply)
+        self._method_replies[(path, interface, method)].append(reply)
+        if reply[2] is not None:
+            return
+        if interface == OBJECT_MANAGER_INTERFACE and method == 'GetManagedObjects':
+            for child, interfaces in decode(reply[1]).items():
+                self._interfaces[child].update(interfaces)
+        elif interface == PROPERTIES_INTERFACE and method == 'Get' and args == [MANAGER_INTERFACE, 'Version']:
+            self._version = MMIntrospection.select_version(str(decode(reply[1])))
+
+    def _learn_signal(self, path: str, interface: str, member: str, args: list):
+        # objects added later in the recording are introspected from the interfaces they were added with
+        if interface == OBJECT_MANAGER_INTERFACE and member == 'InterfacesAdded':
+            self._interfaces[args[0]].update(decode(args[1]))
+
+    """
+    Playback
+    """
+
+    def play(self):
+        """
+        Start delivering the recorded signals, on a player thread.
+        """
+        if self._player is not None:
+            return
+        self._player = threading.Thread(target=self._play, name='ReplayPlayer', daemon=True)
+        self._player.start()
+
+    def wait(self, timeout: float = None) -> bool:
+        """
+        Wait until every recorded signal was delivered and handled.
+
+        :return: Whether the replay finished within the timeout.
+        """
+        return self._finished.wait(timeout)
+
+    @property
+    def duration(self) -> float:
+        """
+        Seconds from the start of the recording to its last signal.
+        """
+        return self._timeline[-1]['t'] if self._timeline else 0.0
+
+    def _delay(self, seconds: float) -> float:
+        return seconds / self.speed if self.speed else 0.0
+
+    def _play(self):
+        position = 0.0
+        deadline = time.monotonic()
+        for event in self._timeline:
+            gap = event['t'] - position
+            position = event['t']
+            if self.max_gap is not None:
+                gap = min(gap, self.max_gap)
+            deadline += self._delay(gap)
+            delay = deadline - time.monotonic()
+            if delay > 0 and self._stop.wait(delay):
+                return
+            if self._stop.is_set():
+                return
+            self._deliver(event)
+        self._signals.put(self._finished.set)
+
+    def _deliver(self, event: Dict[str, object]):
+        if 'signal' in event:
+            namespace, path, interface, member, args = event['signal']
+            args = tuple(decode(args))
+            with self._lock:
+                callbacks = [callback for subscribed, callback in self._subscriptions if subscribed == namespace]
+            for callback in callbacks:
+                self._signals.put(callback, path, interface, member, args)
+        elif 'direct' in event:
+            path, interface, member, args = event['direct']
+            self._signals.put(self._direct.dispatch, path, interface, member, tuple(decode(args)))
+        elif 'owner' in event:
+            name, old_owner, new_owner = event['owner']
+            with self._lock:
+                callbacks = list(self._owner_callbacks.get(name, ()))
+            for callback in callbacks:
+                self._signals.put(callback, old_owner, new_owner)
+
+    """
+    Backend interface
+    """
+
+    @property
+    def dispatching(self) -> bool:
+        return not self._closed
+
+    def proxy_class(self, node: ET.Element) -> SocketProxyClass:
+        return SocketProxyClass(self, node)
+
+    def introspect(self, path: str) -> SocketProxy:
+        interfaces = frozenset(self._interfaces.get(path, ()))
+        with self._lock:
+            proxy_class = self._proxy_classes.get(interfaces)
+            if proxy_class is None:
+                node = MMIntrospection.build_node(self._version or MMIntrospection.latest_version(),
+                                                  sorted(interfaces)) if interfaces else None
+                if node is None:
+                    raise DBusError('org.freedesktop.DBus.Error.UnknownObject', f'{path} is not in the recording')
+                proxy_class = self._proxy_classes[interfaces] = SocketProxyClass(self, node)
+        return proxy_class(path)
+
+    def method_signature(self, proxy: SocketProxy, interface: str, method: str) -> str:
+        return proxy._class.interfaces[interface].methods[method]
+
+    def call_async(self, path: str, interface: str, method: str, signature: str, args: tuple,
+                   timeout: float = None) -> Future:
+        future = Future()
+        future.set_running_or_notify_cancel()
+        reply = self._reply(path, interface, method, args)
+        if reply is None:
+            future.set_exception(DBusError(NOT_RECORDED, f'{interface}.{method} on {path} is not in the recording'))
+            return future
+        duration, result, error = reply
+        delay = self._delay(duration)
+        if timeout is not None and delay > timeout:
+            self._timers.resolve(timeout, future,
+                                 error=DBusError(NO_REPLY, f'{interface}.{method} on {path} got no reply'))
+        elif error is not None:
+            self._timers.resolve(delay, future, error=DBusError(*error))
+        else:
+            self._timers.resolve(delay, future, decode(result))
+        return future
+
+    def _reply(self, path: str, interface: str, method: str, args: tuple) -> Optional[Reply]:
+        key = (path, interface, method, json.dumps(encode(list(args)), sort_keys=True))
+        with self._lock:
+            replies = self._replies.get(key) or self._method_replies.get((path, interface, method))
+            if not replies:
+                return None
+            return replies.popleft() if len(replies) > 1 else replies[0]
+
+    def watch_name_owner(self, name: str, callback: Callable[[str, str], None]):
+        with self._lock:
+            self._owner_callbacks[name].append(callback)
+
+    def timed_out(self, error: BaseException) -> bool:
+        return isinstance(error, DBusError) and error.name == NO_REPLY
+
+    def subscribe(self, sender: str, path_namespace: str, callback: Callable[[str, str, str, tuple], None]):
+        with self._lock:
+            self._subscriptions.append((path_namespace, callback))
+
+    def connect_signal(self, path: str, interface: str, member: str, callback: Callable):
+        """
+        Connect a handler to one signal of one object, for proxy.StateChanged.connect().
+
+        :return: Handle with a disconnect() method.
+        """
+        return self._direct.connect(path, interface, member, lambda *args: callback(*args))
+
+    def close(self):
+        """
+        Stop the replay. Calls still waiting for their recorded latency fail with ConnectionError.
+        """
+        self._stop.set()
+        if self._player is not None and self._player is not threading.current_thread():
+            self._player.join()
+        self._closed = True
+        self._timers.close(ConnectionError('ReplayBackend closed'))
+        self._signals.close()
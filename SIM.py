@@ -1,58 +1,103 @@
-from typing import List, Tuple
+from typing import List, Tuple, Dict, TYPE_CHECKING
 
+from MMErrors import CancelToken
 from MMInterface import MMInterface
-from ModemManager import ModemManager
+from MMEnums import MMModemAccessTechnology
+from MMSnapshot import MMSnapshot, enum_of, list_of, tuple_of
+
+
+if TYPE_CHECKING:
+    from ModemManager import ModemManager
+
+
+class SIMSnapshot(MMSnapshot):
+    """
+    All properties of a SIM object, read at once and decoded to MMEnums types.
+    """
+    __slots__ = (
+        'Active',
+        'SimIdentifier',
+        'Imsi',
+        'Eid',
+        'OperatorIdentifier',
+        'OperatorName',
+        'EmergencyNumbers',
+        'PreferredNetworks',
+    )
+    DECODERS = {
+        'PreferredNetworks': list_of(tuple_of(str, enum_of(MMModemAccessTechnology))),
+    }
 
 
 class SIM(MMInterface):
     """
     The SIM interface handles communication with SIM, USIM, and RUIM (CDMA SIM) cards.
     """
+    INTERFACE = 'org.freedesktop.ModemManager1.Sim'
+    __slots__ = ()
+
+    def __init__(self, manager: 'ModemManager', instance, properties: Dict[str, Dict[str, object]] = None):
+        super().__init__(manager, instance, properties)
 
-    def __init__(self, manager: ModemManager, instance):
-        super().__init__(manager)
-        self._instance = instance
+    def snapshot(self, timeout: float = None, cancel: CancelToken = None) -> SIMSnapshot:
+        """
+        Read every property of this SIM with a single Properties.GetAll call.
+
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
+        :return: Immutable SIMSnapshot, with values decoded to MMEnums types.
+        """
+        return SIMSnapshot(self.path, self._get_all(timeout, cancel))
 
-    def SendPin(self, pin: str):
+    def SendPin(self, pin: str, timeout: float = None, cancel: CancelToken = None):
         """
         Send the PIN to unlock the SIM card.
 
         Since: 1.0
         :param pin: A string containing the PIN code.
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         """
-        self._instance.SendPin(pin)
+        self._call('SendPin', pin, timeout=timeout, cancel=cancel)
 
-    def SendPuk(self, puk: str, pin: str):
+    def SendPuk(self, puk: str, pin: str, timeout: float = None, cancel: CancelToken = None):
         """
         Send the PUK and a new PIN to unlock the SIM card.
 
         Since: 1.0
         :param puk: A string containing the PUK code.
         :param pin: A string containing the PIN code.
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         """
-        self._instance.SendPuk(puk, pin)
+        self._call('SendPuk', puk, pin, timeout=timeout, cancel=cancel)
 
-    def EnablePin(self, pin: str, enable: bool):
+    def EnablePin(self, pin: str, enable: bool, timeout: float = None, cancel: CancelToken = None):
         """
         Enable or disable the PIN checking.
 
         Since: 1.0
         :param pin: A string containing the PIN code.
         :param enable: True to enable PIN checking, False otherwise.
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         """
-        self._instance.EnablePin(pin, enable)
+        self._call('EnablePin', pin, enable, timeout=timeout, cancel=cancel)
 
-    def ChangePin(self, old_pin: str, new_pin: str):
+    def ChangePin(self, old_pin: str, new_pin: str, timeout: float = None, cancel: CancelToken = None):
         """
         Change the PIN code.
 
         Since: 1.0
         :param old_pin: A string containing the current PIN code.
         :param new_pin: A string containing the new PIN code.
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         """
-        self._instance.ChangePin(old_pin, new_pin)
+        self._call('ChangePin', old_pin, new_pin, timeout=timeout, cancel=cancel)
 
-    def SetPreferredNetworks(self, preferred_networks: List[Tuple[str, int]]):
+    def SetPreferredNetworks(self, preferred_networks: List[Tuple[str, int]],
+                             timeout: float = None, cancel: CancelToken = None):
         """
         Stores the provided preferred network list to the SIM card.
         Each entry contains an operator id string ("MCCMNC") consisting of 5 or 6 digits,
@@ -64,8 +109,10 @@ class SIM(MMInterface):
 
         Since: 1.18
         :param preferred_networks:
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         """
-        self._instance.SetPreferredNetworks(preferred_networks)
+        self._call('SetPreferredNetworks', preferred_networks, timeout=timeout, cancel=cancel)
 
     @property
     def Active(self) -> bool:
@@ -81,7 +128,7 @@ class SIM(MMInterface):
         Since: 1.16
         :return: bool
         """
-        return self._instance.Active
+        return self._get_property('Active')
 
     @property
     def SimIdentifier(self) -> str:
@@ -93,7 +140,7 @@ class SIM(MMInterface):
         Since: 1.0
         :return: string
         """
-        return self._instance.SimIdentifier
+        return self._get_property('SimIdentifier')
 
     @property
     def Imsi(self) -> str:
@@ -103,7 +150,7 @@ class SIM(MMInterface):
         Since: 1.0
         :return: string
         """
-        return self._instance.Imsi
+        return self._get_property('Imsi')
 
     @property
     def Eid(self) -> str:
@@ -113,11 +160,11 @@ class SIM(MMInterface):
         Since: 1.16
         :return: string
         """
-        return self._instance.Eid
+        return self._get_property('Eid')
 
     @property
     def OperatorIdentifier(self) -> str:
-        return self._instance.OperatorIdentifier
+        return self._get_property('OperatorIdentifier')
 
     @property
     def OperatorName(self) -> str:
@@ -127,7 +174,7 @@ class SIM(MMInterface):
         Since: 1.0
         :return: string
         """
-        return self._instance.OperatorName
+        return self._get_property('OperatorName')
 
     @property
     def EmergencyNumbers(self) -> List[str]:
@@ -139,7 +186,7 @@ class SIM(MMInterface):
         Since: 1.12
         :return: List[str]
         """
-        return self._instance.EmergencyNumbers
+        return self._get_property('EmergencyNumbers')
 
     @property
     def PreferredNetworks(self) -> List[Tuple[str, int]]:
@@ -151,4 +198,4 @@ class SIM(MMInterface):
         Since: 1.18
         :return:
         """
-        return self._instance.PreferredNetworks
+        return self._get_property('PreferredNetworks')
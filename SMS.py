@@ -1,29 +1,81 @@
-from typing import Tuple
+from typing import Tuple, Dict, TYPE_CHECKING
 
+from MMErrors import CancelToken
 from MMInterface import MMInterface
-from ModemManager import ModemManager
+from MMSnapshot import MMSnapshot, enum_of, tuple_of
 from MMEnums import MMSmsState, MMSmsPduType, MMSmsCdmaTeleserviceId, MMSmsCdmaServiceCategory, MMSmsDeliveryState, \
     MMSmsStorage, MMSmsValidityType
 
 
+if TYPE_CHECKING:
+    from ModemManager import ModemManager
+
+
+class SMSSnapshot(MMSnapshot):
+    """
+    All properties of a SMS object, read at once and decoded to MMEnums types.
+    """
+    __slots__ = (
+        'State',
+        'PduType',
+        'Number',
+        'Text',
+        'Data',
+        'SMSC',
+        'Validity',
+        'Class',
+        'TeleserviceId',
+        'ServiceCategory',
+        'DeliveryReportRequest',
+        'MessageReference',
+        'Timestamp',
+        'DischargeTimestamp',
+        'DeliveryState',
+        'Storage',
+    )
+    DECODERS = {
+        'State': enum_of(MMSmsState),
+        'PduType': enum_of(MMSmsPduType),
+        'Data': bytes,
+        'Validity': tuple_of(enum_of(MMSmsValidityType), int),
+        'TeleserviceId': enum_of(MMSmsCdmaTeleserviceId),
+        'ServiceCategory': enum_of(MMSmsCdmaServiceCategory),
+        'DeliveryState': enum_of(MMSmsDeliveryState),
+        'Storage': enum_of(MMSmsStorage),
+    }
+
+
 class SMS(MMInterface):
     """
     The SMS interface Defines operations and properties of a single SMS message.
     """
+    INTERFACE = 'org.freedesktop.ModemManager1.Sms'
+    __slots__ = ()
+
+    def __init__(self, manager: 'ModemManager', instance, properties: Dict[str, Dict[str, object]] = None):
+        super().__init__(manager, instance, properties)
 
-    def __init__(self, manager: ModemManager, instance):
-        super().__init__(manager)
-        self._instance = instance
+    def snapshot(self, timeout: float = None, cancel: CancelToken = None) -> SMSSnapshot:
+        """
+        Read every property of this SMS with a single Properties.GetAll call.
+
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
+        :return: Immutable SMSSnapshot, with values decoded to MMEnums types.
+        """
+        return SMSSnapshot(self.path, self._get_all(timeout, cancel))
 
-    def Send(self):
+    def Send(self, timeout: float = None, cancel: CancelToken = None):
         """
         If the message has not yet been sent, queue it for delivery.
 
         Since: 1.0
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         """
-        self._instance.Send()
+        self._call('Send', timeout=timeout, cancel=cancel)
 
-    def Store(self, storage: MMSmsStorage):
+    def Store(self, storage: MMSmsStorage, timeout: float = None, cancel: CancelToken = None):
         """
         Store the message in the device if not already done.
 
@@ -31,8 +83,10 @@ class SMS(MMInterface):
         or MM_SMS_STORAGE_UNKNOWN if the default storage should be used.
 
         Since: 1.0
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default timeout.
+        :param cancel: Token abandoning the call when cancelled.
         """
-        self._instance.Store(storage.value)
+        self._call('Store', storage.value, timeout=timeout, cancel=cancel)
 
     @property
     def State(self) -> MMSmsState:
@@ -42,7 +96,7 @@ class SMS(MMInterface):
         Since: 1.0
         :return: MMSmsState
         """
-        return MMSmsState(self._instance.State)
+        return MMSmsState(self._get_property('State'))
 
     @property
     def PduType(self) -> MMSmsPduType:
@@ -52,7 +106,7 @@ class SMS(MMInterface):
         Since: 1.0
         :return: MMSmsPduType
         """
-        return MMSmsPduType(self._instance.PduType)
+        return MMSmsPduType(self._get_property('PduType'))
 
     @property
     def Number(self) -> str:
@@ -62,7 +116,7 @@ class SMS(MMInterface):
         Since: 1.0
         :return: string
         """
-        return self._instance.Number
+        return self._get_property('Number')
 
     @property
     def Text(self) -> str:
@@ -77,7 +131,7 @@ class SMS(MMInterface):
         Since: 1.0
         :return: string
         """
-        return self._instance.Text
+        return self._get_property('Text')
 
     @property
     def Data(self) -> bytes:
@@ -92,7 +146,7 @@ class SMS(MMInterface):
         Since: 1.0
         :return: bytes
         """
-        return bytes(self._instance.Data)
+        return self._get_plain_property('Data')
 
     @property
     def SMSC(self) -> str:
@@ -104,7 +158,7 @@ class SMS(MMInterface):
         Since: 1.0
         :return: string
         """
-        return self._instance.SMSC
+        return self._get_property('SMSC')
 
     @property
     def Validity(self) -> Tuple[MMSmsValidityType, int]:
@@ -121,7 +175,7 @@ class SMS(MMInterface):
         Since: 1.0
         :return: int
         """
-        key, value = self._instance.Validity
+        key, value = self._get_property('Validity')
         key = MMSmsValidityType(key)
         value = int(value)
         return key, value
@@ -139,7 +193,7 @@ class SMS(MMInterface):
         Since: 1.0
         :return: int
         """
-        return self._instance.Class
+        return self._get_property('Class')
 
     @property
     def TeleserviceId(self) -> MMSmsCdmaTeleserviceId:
@@ -151,7 +205,7 @@ class SMS(MMInterface):
         Since: 1.2
         :return: MMSmsCdmaTeleserviceId
         """
-        return MMSmsCdmaTeleserviceId(self._instance.TeleserviceId)
+        return MMSmsCdmaTeleserviceId(self._get_property('TeleserviceId'))
 
     @property
     def ServiceCategory(self) -> MMSmsCdmaServiceCategory:
@@ -163,7 +217,7 @@ class SMS(MMInterface):
         Since: 1.2
         :return: MMSmsCdmaServiceCategory
         """
-        return MMSmsCdmaServiceCategory(self._instance.ServiceCategory)
+        return MMSmsCdmaServiceCategory(self._get_property('ServiceCategory'))
 
     @property
     def DeliveryReportRequest(self) -> bool:
@@ -173,7 +227,7 @@ class SMS(MMInterface):
         Since: 1.0
         :return: bool
         """
-        return self._instance.DeliveryReportRequest
+        return self._get_property('DeliveryReportRequest')
 
     @property
     def MessageReference(self) -> int:
@@ -186,7 +240,7 @@ class SMS(MMInterface):
         Since: 1.0
         :return: int
         """
-        return self._instance.MessageReference
+        return self._get_property('MessageReference')
 
     @property
     def Timestamp(self) -> str:
@@ -197,7 +251,7 @@ class SMS(MMInterface):
         Since: 1.0
         :return: string
         """
-        return self._instance.Timestamp
+        return self._get_property('Timestamp')
 
     @property
     def DischargeTimestamp(self) -> str:
@@ -209,7 +263,7 @@ class SMS(MMInterface):
         Since: 1.0
         :return: string
         """
-        return self._instance.DischargeTimestamp
+        return self._get_property('DischargeTimestamp')
 
     @property
     def DeliveryState(self) -> MMSmsDeliveryState:
@@ -221,7 +275,7 @@ class SMS(MMInterface):
         Since: 1.0
         :return: MMSmsDeliveryState
         """
-        return MMSmsDeliveryState(self._instance.DeliveryState)
+        return MMSmsDeliveryState(self._get_property('DeliveryState'))
 
     @property
     def Storage(self) -> MMSmsStorage:
@@ -231,4 +285,4 @@ class SMS(MMInterface):
         Since: 1.0
         :return: MMSmsDeliveryState
         """
-        return MMSmsStorage(self._instance.Storage)
+        return MMSmsStorage(self._get_property('Storage'))
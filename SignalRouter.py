@@ -0,0 +1,128 @@
+import logging
+import threading
+import weakref
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SignalHandle(object):
+    """
+    Registration of one signal handler in a SignalRouter.
+    """
+    __slots__ = ('_router', '_key', '_ref')
+
+    def __init__(self, router: 'SignalRouter', key: Tuple[Optional[str], str, str], ref):
+        self._router = router
+        self._key = key
+        self._ref = ref
+
+    def disconnect(self):
+        self._router._disconnect(self)
+
+
+class SignalRouter(object):
+    """
+    In-process index routing the signals of every ModemManager object to handlers registered per object path.
+
+    The transport installs a single path_namespace match rule for /org/freedesktop/ModemManager1 and feeds every
+    signal to dispatch(), so the bus daemon holds one rule however many objects are followed, and dispatching
+    a signal costs one dictionary lookup per path.
+
+    Bound methods are held weakly, so a handler does not keep its wrapper alive.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._handlers: Dict[Optional[str], Dict[Tuple[str, str], List[SignalHandle]]] = {}
+
+    def connect(self, path: Optional[str], interface: str, member: str, callback: Callable) -> SignalHandle:
+        """
+        Register a handler.
+
+        :param path: Object path emitting the signal, or None for any path.
+        :param interface: Interface of the signal, e.g. "org.freedesktop.DBus.Properties".
+        :param member: Signal name, e.g. "PropertiesChanged".
+        :param callback: Called with the signal arguments.
+        :return: Handle to disconnect the handler with.
+        """
+        if hasattr(callback, '__self__') and hasattr(callback, '__func__'):
+            ref = weakref.WeakMethod(callback)
+        else:
+            def ref():
+                return callback
+        handle = SignalHandle(self, (path, interface, member), ref)
+        with self._lock:
+            self._handlers.setdefault(path, {}).setdefault((interface, member), []).append(handle)
+        return handle
+
+    def dispatch(self, path: str, interface: str, member: str, args: tuple):
+        """
+        Call the handlers registered for a signal.
+        """
+        handles = []
+        with self._lock:
+            for key in (path, None):
+                by_member = self._handlers.get(key)
+                if by_member:
+                    handles.extend(by_member.get((interface, member), ()))
+        for handle in handles:
+            callback = handle._ref()
+            if callback is None:
+                handle.disconnect()
+                continue
+            try:
+                callback(*args)
+            except Exception:
+                logger.exception('Error in handler of %s.%s on %s', interface, member, path)
+
+    def detach(self, path: str) -> List[SignalHandle]:
+        """
+        Unregister every handler of one object path, keeping them for attach().
+        """
+        with self._lock:
+            by_member = self._handlers.pop(path, {})
+        return [handle for handles in by_member.values() for handle in handles]
+
+    def attach(self, path: str, handles: List[SignalHandle]):
+        """
+        Register handlers returned by detach() for another object path, e.g. after an object was re-exported.
+        """
+        with self._lock:
+            for handle in handles:
+                _, interface, member = handle._key
+                handle._key = (path, interface, member)
+                self._handlers.setdefault(path, {}).setdefault((interface, member), []).append(handle)
+
+    def prune(self, path: str):
+        """
+        Drop the handlers of one object path whose bound method was collected.
+        """
+        with self._lock:
+            by_member = self._handlers.get(path)
+            if not by_member:
+                return
+            for key, handles in list(by_member.items()):
+                handles[:] = [handle for handle in handles if handle._ref() is not None]
+                if not handles:
+                    del by_member[key]
+            if not by_member:
+                del self._handlers[path]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(handles) for by_member in self._handlers.values() for handles in by_member.values())
+
+    def _disconnect(self, handle: SignalHandle):
+        path, interface, member = handle._key
+        with self._lock:
+            by_member = self._handlers.get(path)
+            if not by_member:
+                return
+            handles = by_member.get((interface, member))
+            if handles and handle in handles:
+                handles.remove(handle)
+                if not handles:
+                    del by_member[(interface, member)]
+                if not by_member:
+                    del self._handlers[path]
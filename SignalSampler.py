@@ -0,0 +1,315 @@
+import array
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, Iterable, List, NamedTuple, Optional, Set
+
+from MMErrors import MMGoneError
+from Modem import Modem
+from SignalRouter import SignalHandle
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+if TYPE_CHECKING:
+    from ModemManager import ModemManager
+
+PROPERTIES_INTERFACE = 'org.freedesktop.DBus.Properties'
+
+logger = logging.getLogger(__name__)
+
+
+class Sample(NamedTuple):
+    time: float
+    quality: int
+    recent: bool
+    technologies: int
+
+
+class SampleBuffer(object):
+    """
+    Fixed-size ring buffer of the signal samples of one modem, one typed array per column, so a sample takes
+    14 bytes instead of a tuple of Python objects:
+
+        time          'd'  Unix time of the sample
+        quality       'B'  SignalQuality percentage
+        recent        'B'  whether the quality was recently measured
+        technologies  'I'  AccessTechnologies flags, MMModemAccessTechnology
+
+    Once full, each sample overwrites the oldest one.
+    """
+    __slots__ = ('capacity', 'columns', '_next', '_count')
+    TYPECODES = {'time': 'd', 'quality': 'B', 'recent': 'B', 'technologies': 'I'}
+
+    def __init__(self, capacity: int):
+        """
+        :param capacity: Number of samples kept.
+        """
+        self.capacity = capacity
+        self.columns: Dict[str, array.array] = {name: array.array(code, bytes(array.array(code).itemsize * capacity))
+                                                for name, code in self.TYPECODES.items()}
+        self._next = 0
+        self._count = 0
+
+    def append(self, t: float, quality: int, recent: bool, technologies: int):
+        i = self._next
+        columns = self.columns
+        columns['time'][i] = t
+        columns['quality'][i] = quality
+        columns['recent'][i] = recent
+        columns['technologies'][i] = technologies
+        self._next = (i + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def latest(self) -> Optional[Sample]:
+        if not self._count:
+            return None
+        i = self._next - 1
+        columns = self.columns
+        return Sample(columns['time'][i], columns['quality'][i], bool(columns['recent'][i]), columns['technologies'][i])
+
+    def samples(self) -> List[Sample]:
+        """
+        Copy of the samples, oldest first.
+        """
+        columns = [self._ordered_list(name) for name in ('time', 'quality', 'recent', 'technologies')]
+        return [Sample(t, q, bool(r), a) for t, q, r, a in zip(*columns)]
+
+    def _ordered_list(self, column: str) -> list:
+        data = self.columns[column]
+        if self._count < self.capacity:
+            return data[:self._count].tolist()
+        return data[self._next:].tolist() + data[:self._next].tolist()
+
+    def view(self, column: str = 'quality', ordered: bool = True):
+        """
+        NumPy array of one column, sharing memory with the buffer where possible.
+
+        Unordered views, and ordered views of a buffer that has not wrapped around yet, are zero-copy: they
+        change as samples are appended. An ordered view of a full buffer is a copy, oldest sample first.
+        :param column: Column name, see the class description.
+        :param ordered: Oldest sample first, instead of storage order.
+        """
+        if numpy is None:
+            raise ImportError('SampleBuffer.view() needs numpy')
+        data = numpy.frombuffer(self.columns[column], dtype=numpy.dtype(self.TYPECODES[column]))
+        if self._count < self.capacity:
+            return data[:self._count]
+        if not ordered or self._next == 0:
+            return data
+        return numpy.concatenate((data[self._next:], data[:self._next]))
+
+    def percentile(self, q: float, column: str = 'quality') -> Optional[float]:
+        """
+        q-th percentile, 0 to 100, of a column over the buffered samples, interpolated linearly.
+        """
+        if not self._count:
+            return None
+        if numpy is not None:
+            return float(numpy.percentile(self.view(column, ordered=False), q))
+        values = sorted(self.columns[column][:self._count])
+        position = (len(values) - 1) * q / 100
+        low = int(position)
+        high = min(low + 1, len(values) - 1)
+        return values[low] + (values[high] - values[low]) * (position - low)
+
+    def moving_average(self, window: int, column: str = 'quality'):
+        """
+        Means of a column over each run of window consecutive samples, oldest first.
+
+        :return: A NumPy array if numpy is installed, a list otherwise; empty with fewer than window samples.
+        """
+        if numpy is not None:
+            data = self.view(column).astype(numpy.float64)
+            if len(data) < window:
+                return data[:0]
+            sums = numpy.cumsum(data)
+            sums[window:] = sums[window:] - sums[:-window]
+            return sums[window - 1:] / window
+        data = self._ordered_list(column)
+        result = []
+        total = sum(data[:window - 1])
+        for i in range(window - 1, len(data)):
+            total += data[i]
+            result.append(total / window)
+            total -= data[i - window + 1]
+        return result
+
+
+class SignalSampler(object):
+    """
+    Records Modem.SignalQuality and Modem.AccessTechnologies of every modem of a manager into a SampleBuffer
+    per modem, for long histories at a fraction of the memory of tuples:
+
+        sampler = SignalSampler(manager, capacity=3 * 8640)
+        sampler.start()
+        ...
+        buffer = sampler.buffers[modem.path]
+        print(buffer.percentile(5), buffer.moving_average(60)[-1])
+
+    While the backend delivers signals, a sample is recorded from each PropertiesChanged of either property,
+    holding the other property's last value, and modems are followed through the manager's registry.
+    Otherwise the modems are enumerated with GetManagedObjects() and read every interval seconds, with all
+    reads in flight at once. Modems appearing later get a buffer of their own; the buffers of modems that
+    disappear stop growing and are kept until forget() is called.
+    """
+
+    def __init__(self, manager: 'ModemManager', capacity: int = 8640, interval: float = 10.0, poll: bool = None):
+        """
+        :param manager: Manager whose modems are sampled.
+        :param capacity: Samples kept per modem, e.g. 8640 for a day of samples taken every 10 seconds.
+        :param interval: Seconds between two reads of every modem, when sampling by polling.
+        :param poll: Whether to poll instead of following signals; by default poll only if the backend
+            does not deliver signals.
+        """
+        self.manager = manager
+        self.capacity = capacity
+        self.interval = interval
+        self.poll = poll if poll is not None else not manager.backend.dispatching
+        self.buffers: Dict[str, SampleBuffer] = {}
+        self._lock = threading.Lock()
+        self._handles: Dict[str, SignalHandle] = {}
+        self._active: Set[str] = set()
+        self._stop = threading.Event()
+        self._poller: Optional[threading.Thread] = None
+        self._started = False
+
+    def start(self):
+        """
+        Start sampling the current modems and the ones appearing later.
+        """
+        if self._started:
+            return
+        self._started = True
+        if self.poll:
+            # the registry follows InterfacesAdded and InterfacesRemoved, which are not delivered without
+            # signals, so the poller enumerates the modems itself
+            self._poller = threading.Thread(target=self._run, name='SignalSampler', daemon=True)
+            self._poller.start()
+            return
+        registry = self.manager.registry
+        registry.on_added(self._add)
+        registry.on_removed(self._remove)
+        for modem in registry:
+            self._add(modem)
+
+    def stop(self):
+        """
+        Stop sampling; the buffers stay readable.
+        """
+        self._stop.set()
+        if self._poller is not None:
+            self._poller.join()
+        with self._lock:
+            handles, self._handles = self._handles, {}
+            self._active.clear()
+        for handle in handles.values():
+            handle.disconnect()
+
+    def forget(self, path: str):
+        """
+        Drop the buffer of a modem, e.g. one that was removed.
+        """
+        self._remove_path(path)
+        with self._lock:
+            self.buffers.pop(path, None)
+
+    def _remove(self, modem: Modem):
+        self._remove_path(modem.path)
+
+    def _remove_path(self, path: str):
+        with self._lock:
+            self._active.discard(path)
+            handle = self._handles.pop(path, None)
+        if handle is not None:
+            handle.disconnect()
+
+    def _track(self, path: str) -> Optional[SampleBuffer]:
+        # buffer of a modem to start sampling, None if it already is or the sampler was stopped
+        with self._lock:
+            if self._stop.is_set() or path in self._active:
+                return None
+            self._active.add(path)
+            buffer = self.buffers.get(path)
+            if buffer is None:
+                buffer = self.buffers[path] = SampleBuffer(self.capacity)
+            return buffer
+
+    def _add(self, modem: Modem):
+        path = modem.path
+        buffer = self._track(path)
+        if buffer is None:
+            return
+        handle = modem.connect_signal(
+            'PropertiesChanged', lambda interface, changed, invalidated: self._on_changed(buffer, interface, changed),
+            PROPERTIES_INTERFACE)
+        with self._lock:
+            self._handles[path] = handle
+        try:
+            quality, recent = modem.SignalQuality
+            buffer.append(time.time(), quality, recent, modem.AccessTechnologies)
+        except MMGoneError:
+            pass
+
+    @staticmethod
+    def _on_changed(buffer: SampleBuffer, interface: str, changed: Dict[str, object]):
+        if interface != Modem.INTERFACE or ('SignalQuality' not in changed and 'AccessTechnologies' not in changed):
+            return
+        last = buffer.latest()
+        quality, recent = changed.get('SignalQuality', (last.quality, last.recent) if last else (0, False))
+        technologies = changed.get('AccessTechnologies', last.technologies if last else 0)
+        buffer.append(time.time(), quality, recent, technologies)
+
+    def _enumerate(self):
+        objects = self.manager.GetManagedObjects(timeout=self.interval)
+        paths = {path for path, interfaces in objects.items() if Modem.INTERFACE in interfaces}
+        with self._lock:
+            gone = self._active - paths
+        for path in gone:
+            self._remove_path(path)
+        for path in paths:
+            self._track(path)
+
+    def _run(self):
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                self._enumerate()
+            except Exception:
+                logger.exception('Enumerating the modems to sample failed')
+            self.sample()
+            self._stop.wait(max(0.0, self.interval - (time.monotonic() - started)))
+
+    def sample(self, paths: Iterable[str] = None):
+        """
+        Read both properties of the modems, all at once, and record a sample for each modem that answered.
+
+        :param paths: Modems to read, defaults to every modem being sampled.
+        """
+        with self._lock:
+            buffers = {path: self.buffers[path] for path in (paths if paths is not None else self._active)
+                       if path in self.buffers}
+        calls = []
+        for path in buffers:
+            for name in ('SignalQuality', 'AccessTechnologies'):
+                calls.append(self.manager.call_async(path, PROPERTIES_INTERFACE, 'Get', (Modem.INTERFACE, name),
+                                                     timeout=self.interval))
+        if not calls:
+            return
+        try:
+            self.manager.gather(calls, self.interval)
+        except Exception:
+            pass
+        now = time.time()
+        for i, buffer in enumerate(buffers.values()):
+            quality, technologies = calls[2 * i], calls[2 * i + 1]
+            if not quality.done() or quality.exception() or not technologies.done() or technologies.exception():
+                continue
+            value, recent = quality.result()
+            buffer.append(now, value, recent, technologies.result())
@@ -0,0 +1,101 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+Result = TypeVar('Result')
+
+
+class SingleFlight(object):
+    """
+    Collapses concurrent identical calls: while a call for a key is in flight, other threads asking for the same
+    key wait for its result instead of making their own call.
+
+        reads = SingleFlight()
+        state = reads.do((path, interface, 'State'), lambda: read_state())
+
+    Nothing is cached: a call for a key that is not in flight always runs. Waiting callers get the same
+    result, or the same exception, as the call they waited for.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Result]) -> Result:
+        """
+        Run fn, or wait for the call of the same key already in flight.
+
+        :param key: Identity of the call, e.g. (object path, interface, property name).
+        :param fn: Function making the call.
+        :return: Return value of fn.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            if future is None:
+                future = self._calls[key] = Future()
+                leader = True
+            else:
+                leader = False
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key)
+            future.set_exception(e)
+            raise
+        self._finish(key)
+        future.set_result(result)
+        return result
+
+    def _finish(self, key: Hashable):
+        # later callers make a new call instead of getting the result of this one
+        with self._lock:
+            del self._calls[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+
+class AsyncSingleFlight(object):
+    """
+    SingleFlight for coroutines on one event loop: tasks asking for a key in flight await the running call.
+
+    A waiting task that is cancelled does not cancel the shared call; the call is only cancelled together
+    with the task that started it.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Result]]) -> Result:
+        """
+        Await fn(), or the call of the same key already in flight.
+
+        :param key: Identity of the call, e.g. (object path, interface, property name).
+        :param fn: Coroutine function making the call.
+        :return: Result of fn().
+        """
+        future = self._calls.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+        future = self._calls[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await fn()
+        except BaseException as e:
+            del self._calls[key]
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # retrieved here, so a call nobody waited for does not log "exception was never retrieved"
+                future.exception()
+            raise
+        del self._calls[key]
+        future.set_result(result)
+        return result
+
+    def __len__(self) -> int:
+        return len(self._calls)
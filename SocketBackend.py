@@ -0,0 +1,285 @@
+import threading
+import xml.etree.ElementTree as ET
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Tuple
+
+from DBusSocket import DBusConnection, DBusError, Message, Variant, unpack_body
+from MMBackend import MMBackend, SignalQueue
+from SignalRouter import SignalRouter
+
+DBUS_NAME = 'org.freedesktop.DBus'
+DBUS_PATH = '/org/freedesktop/DBus'
+PROPERTIES_INTERFACE = 'org.freedesktop.DBus.Properties'
+INTROSPECTABLE_INTERFACE = 'org.freedesktop.DBus.Introspectable'
+DEFAULT_TIMEOUT = 25.0
+
+
+class _Interface(object):
+    __slots__ = ('name', 'methods', 'properties', 'signals')
+
+    def __init__(self, element: ET.Element):
+        self.name = element.attrib['name']
+        self.methods = {member.attrib['name']: ''.join(arg.attrib['type'] for arg in member.iter('arg')
+                                                       if arg.attrib.get('direction', 'in') == 'in')
+                        for member in element.iter('method')}
+        self.properties = {member.attrib['name']: member.attrib['type'] for member in element.iter('property')}
+        self.signals = {member.attrib['name'] for member in element.iter('signal')}
+
+
+class SocketProxyClass(object):
+    """
+    Member tables of one <node> introspection, shared by the proxies of every object with that node.
+    """
+
+    def __init__(self, backend: 'SocketBackend', node: ET.Element):
+        self.backend = backend
+        self.interfaces: Dict[str, _Interface] = {}
+        for element in node.iter('interface'):
+            interface = _Interface(element)
+            self.interfaces[interface.name] = interface
+
+    def __call__(self, path: str) -> 'SocketProxy':
+        return SocketProxy(self, path)
+
+    def lookup(self, name: str, interface: str = None) -> Tuple[str, _Interface]:
+        """
+        Find a member by name, in one interface or in the first interface defining it.
+
+        :return: Kind of the member ("method", "property" or "signal") and its interface.
+        """
+        candidates = [self.interfaces[interface]] if interface in self.interfaces else self.interfaces.values()
+        for candidate in candidates:
+            if name in candidate.methods:
+                return 'method', candidate
+            if name in candidate.properties:
+                return 'property', candidate
+            if name in candidate.signals:
+                return 'signal', candidate
+        raise AttributeError(name)
+
+
+class SocketMethod(object):
+    """
+    Bound D-Bus method of a SocketProxy: proxy.Enable(True, timeout=30).
+    """
+    __slots__ = ('_backend', '_path', '_interface', '_name', '_signature')
+
+    def __init__(self, backend: 'SocketBackend', path: str, interface: str, name: str, signature: str):
+        self._backend = backend
+        self._path = path
+        self._interface = interface
+        self._name = name
+        self._signature = signature
+
+    def __call__(self, *args, timeout: float = None):
+        return self._backend.call(self._path, self._interface, self._name, self._signature, args, timeout)
+
+
+class SocketSignal(object):
+    """
+    D-Bus signal of a SocketProxy: proxy.StateChanged.connect(callback).
+    """
+    __slots__ = ('_backend', '_path', '_interface', '_name')
+
+    def __init__(self, backend: 'SocketBackend', path: str, interface: str, name: str):
+        self._backend = backend
+        self._path = path
+        self._interface = interface
+        self._name = name
+
+    def connect(self, callback: Callable):
+        """
+        :return: Handle with a disconnect() method.
+        """
+        return self._backend.connect_signal(self._path, self._interface, self._name, callback)
+
+
+class SocketProxy(object):
+    """
+    Proxy of one D-Bus object on a SocketBackend, with the attribute interface of a pydbus proxy.
+    """
+    __slots__ = ('_class', '_path', '_interface')
+
+    def __init__(self, proxy_class: SocketProxyClass, path: str, interface: str = None):
+        object.__setattr__(self, '_class', proxy_class)
+        object.__setattr__(self, '_path', path)
+        object.__setattr__(self, '_interface', interface)
+
+    def __getitem__(self, interface: str) -> 'SocketProxy':
+        if interface not in self._class.interfaces:
+            raise KeyError(interface)
+        return SocketProxy(self._class, self._path, interface)
+
+    def __getattr__(self, name: str):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        kind, interface = self._class.lookup(name, self._interface)
+        backend = self._class.backend
+        if kind == 'method':
+            return SocketMethod(backend, self._path, interface.name, name, interface.methods[name])
+        if kind == 'property':
+            return backend.call(self._path, PROPERTIES_INTERFACE, 'Get', 'ss', (interface.name, name))
+        return SocketSignal(backend, self._path, interface.name, name)
+
+    def __setattr__(self, name: str, value):
+        kind, interface = self._class.lookup(name, self._interface)
+        if kind != 'property':
+            raise AttributeError(name)
+        self._class.backend.call(self._path, PROPERTIES_INTERFACE, 'Set', 'ssv',
+                                 (interface.name, name, Variant(interface.properties[name], value)))
+
+    def __repr__(self):
+        return f'<SocketProxy {self._path}>'
+
+
+class SocketBackend(MMBackend):
+    """
+    Backend on a pure-Python D-Bus client speaking the wire protocol over a unix socket.
+
+    It imports neither gi nor pydbus and needs no main loop: replies and signals are read by a daemon thread,
+    and signal handlers are called on a dispatch thread, so they may make calls themselves.
+    Arguments of signature "v" (e.g. values of a{sv} dictionaries) are given as DBusSocket.Variant
+    unless they are str, bool, float or bytes.
+    """
+
+    def __init__(self, address: str = None, connection: DBusConnection = None):
+        """
+        :param address: D-Bus address of the bus, defaults to the system bus.
+        :param connection: Already connected DBusConnection to use instead of opening one.
+        """
+        self.connection = connection if connection else DBusConnection(address).connect()
+        self._lock = threading.Lock()
+        self._proxy_classes: Dict[str, SocketProxyClass] = {}
+        self._subscriptions: List[Tuple[str, str, Callable]] = []
+        self._owners: Dict[str, Optional[str]] = {}
+        self._owner_callbacks: Dict[str, List[Callable[[str, str], None]]] = {}
+        self._direct = SignalRouter()
+        self._direct_rules = set()
+        self._signals = SignalQueue()
+        self.connection.add_signal_handler(self._on_message)
+
+    def close(self):
+        self.connection.close()
+        self._signals.close()
+
+    @property
+    def dispatching(self) -> bool:
+        return not self.connection.closed
+
+    def proxy_class(self, node: ET.Element) -> SocketProxyClass:
+        return SocketProxyClass(self, node)
+
+    def introspect(self, path: str) -> SocketProxy:
+        xml = self.call(path, INTROSPECTABLE_INTERFACE, 'Introspect', '', ())
+        with self._lock:
+            proxy_class = self._proxy_classes.get(xml)
+            if proxy_class is None:
+                proxy_class = self._proxy_classes[xml] = SocketProxyClass(self, ET.fromstring(xml))
+        return proxy_class(path)
+
+    def method_signature(self, proxy: SocketProxy, interface: str, method: str) -> str:
+        return proxy._class.interfaces[interface].methods[method]
+
+    def call_async(self, path: str, interface: str, method: str, signature: str, args: tuple,
+                   timeout: float = None) -> Future:
+        """
+        Send a method call without waiting for its reply.
+
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default of 25 seconds. Timeouts
+            are entries on the connection's single timer heap, so pipelined calls cost no thread each.
+        """
+        future = Future()
+        future.set_running_or_notify_cancel()
+
+        def on_reply(reply: Future):
+            if reply.exception() is not None:
+                future.set_exception(reply.exception())
+            else:
+                future.set_result(unpack_body(reply.result()))
+
+        self.connection.call_async(self.BUS_NAME, path, interface, method, signature, args,
+                                   timeout if timeout is not None else DEFAULT_TIMEOUT).add_done_callback(on_reply)
+        return future
+
+    def call(self, path: str, interface: str, method: str, signature: str, args: tuple, timeout: float = None):
+        """
+        Call a method and wait for the reply.
+
+        :param timeout: Seconds to wait for the reply, defaults to the D-Bus default of 25 seconds.
+        """
+        return self.call_async(path, interface, method, signature, args, timeout).result()
+
+    def watch_name_owner(self, name: str, callback: Callable[[str, str], None]):
+        with self._lock:
+            self._owner_callbacks.setdefault(name, []).append(callback)
+        self._follow_owner(name)
+
+    def timed_out(self, error: BaseException) -> bool:
+        return isinstance(error, DBusError) and error.name in ('org.freedesktop.DBus.Error.NoReply',
+                                                               'org.freedesktop.DBus.Error.Timeout',
+                                                               'org.freedesktop.DBus.Error.TimedOut')
+
+    def subscribe(self, sender: str, path_namespace: str, callback: Callable[[str, str, str, tuple], None]):
+        self.connection.add_match(f"type='signal',sender='{sender}',path_namespace='{path_namespace}'")
+        self._follow_owner(sender)
+        with self._lock:
+            self._subscriptions.append((sender, path_namespace.rstrip('/') + '/', callback))
+
+    def connect_signal(self, path: str, interface: str, member: str, callback: Callable):
+        """
+        Connect a handler to one signal of one object, as pydbus proxies do with signal.connect().
+
+        :return: Handle with a disconnect() method.
+        """
+        rule = (f"type='signal',sender='{self.BUS_NAME}',path='{path}',interface='{interface}',"
+                f"member='{member}'")
+        with self._lock:
+            new = rule not in self._direct_rules
+            self._direct_rules.add(rule)
+        if new:
+            self.connection.add_match(rule)
+            self._follow_owner(self.BUS_NAME)
+        # the router holds bound methods weakly; proxies keep their handlers alive like pydbus does
+        return self._direct.connect(path, interface, member, lambda *args: callback(*args))
+
+    def _follow_owner(self, name: str):
+        # Signals carry the unique name of their sender; keep the owner of a well-known name current.
+        if name.startswith(':') or name == DBUS_NAME:
+            return
+        with self._lock:
+            if name in self._owners:
+                return
+            self._owners[name] = None
+        self.connection.add_match(f"type='signal',sender='{DBUS_NAME}',member='NameOwnerChanged',arg0='{name}'")
+        try:
+            owner = self.connection.call(DBUS_NAME, DBUS_PATH, DBUS_NAME, 'GetNameOwner', 's', (name,))
+        except DBusError:
+            owner = None
+        with self._lock:
+            self._owners[name] = owner
+
+    def _sent_by(self, message: Message, name: str) -> bool:
+        if message.sender == name:
+            return True
+        owner = self._owners.get(name)
+        return owner is not None and message.sender == owner
+
+    def _on_message(self, message: Message):
+        if message.sender == DBUS_NAME and message.member == 'NameOwnerChanged':
+            name, old_owner, new_owner = message.body
+            if name in self._owners:
+                self._owners[name] = new_owner or None
+            for callback in self._owner_callbacks.get(name, ()):
+                self._signals.put(callback, old_owner, new_owner)
+        # handlers run on the dispatch thread, the reader thread has to stay free to read their replies
+        self._signals.put(self._deliver, message)
+
+    def _deliver(self, message: Message):
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        args = tuple(message.body)
+        for sender, namespace, callback in subscriptions:
+            if self._sent_by(message, sender) and (message.path + '/').startswith(namespace):
+                callback(message.path, message.interface, message.member, args)
+        if self._sent_by(message, self.BUS_NAME):
+            self._direct.dispatch(message.path, message.interface, message.member, args)
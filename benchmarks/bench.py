@@ -0,0 +1,336 @@
+"""
+Benchmarks of the wrappers against a private dbus-daemon running benchmarks/mock_service.py in place of
+ModemManager, at several numbers of modems. Results are written as JSON, and can be compared with an
+earlier run to catch regressions of the wrapper overhead:
+
+    python benchmarks/bench.py --output before.json
+    python benchmarks/bench.py --output after.json --compare before.json
+
+Benchmarks, each run at every number of modems:
+    enumerate.cold    new ModemManager on a new connection, until modems returns every modem
+    enumerate         ModemManager.registry.load(): GetManagedObjects and reseeding every wrapper
+    read.raw          Properties.Get of Modem.SignalQuality straight through the backend, as baseline
+    read.single       Modem.SignalQuality of an uncached wrapper, one Get per read
+    read.cached       Modem.SignalQuality answered from the property cache
+    read.bulk         Modem.snapshot(), one GetAll per read
+    sms.send          SMS.Send of an SMS created on every modem
+    signals           PropertiesChanged signals of all modems delivered to wrapper handlers, per signal
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from DBusSocket import DBusConnection  # noqa: E402
+from Modem import Modem  # noqa: E402
+from ModemManager import ModemManager  # noqa: E402
+from SocketBackend import PROPERTIES_INTERFACE, SocketBackend  # noqa: E402
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+MOCK_SERVICE = os.path.join(HERE, 'mock_service.py')
+BUS_NAME = 'org.freedesktop.ModemManager1'
+MANAGER_PATH = '/org/freedesktop/ModemManager1'
+MESSAGING_INTERFACE = 'org.freedesktop.ModemManager1.Modem.Messaging'
+CONTROL_INTERFACE = 'org.freedesktop.ModemManager1.Mock'
+
+BUS_CONFIG = '''<!DOCTYPE busconfig PUBLIC "-//freedesktop//DTD D-BUS Bus Configuration 1.0//EN"
+ "http://www.freedesktop.org/standards/dbus/1.0/busconfig.dtd">
+<busconfig>
+  <type>session</type>
+  <listen>unix:path={socket}</listen>
+  <auth>EXTERNAL</auth>
+  <policy context="default">
+    <allow send_destination="*" eavesdrop="true"/>
+    <allow eavesdrop="true"/>
+    <allow own="*"/>
+  </policy>
+</busconfig>
+'''
+
+
+class PrivateBus(object):
+    """
+    dbus-daemon of its own in a temporary directory, stopped on leaving the with block.
+    """
+
+    def __init__(self):
+        self.directory = tempfile.mkdtemp(prefix='mm-bench-')
+        self.address: Optional[str] = None
+        self._process: Optional[subprocess.Popen] = None
+
+    def __enter__(self) -> 'PrivateBus':
+        config = os.path.join(self.directory, 'bus.conf')
+        with open(config, 'w') as f:
+            f.write(BUS_CONFIG.format(socket=os.path.join(self.directory, 'bus')))
+        self._process = subprocess.Popen(['dbus-daemon', f'--config-file={config}', '--nofork', '--print-address'],
+                                         stdout=subprocess.PIPE, text=True)
+        self.address = self._process.stdout.readline().strip()
+        if not self.address:
+            raise RuntimeError('dbus-daemon did not start')
+        return self
+
+    def __exit__(self, *exc):
+        self._process.terminate()
+        self._process.wait()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+class MockDaemon(object):
+    """
+    benchmarks/mock_service.py serving a number of modems on a bus, stopped on leaving the with block.
+    """
+
+    def __init__(self, address: str, modems: int, latency: float = 0.0):
+        self.address = address
+        self.modems = modems
+        self.latency = latency
+        self._process: Optional[subprocess.Popen] = None
+
+    def __enter__(self) -> 'MockDaemon':
+        self._process = subprocess.Popen([sys.executable, MOCK_SERVICE, '--address', self.address,
+                                          '--modems', str(self.modems), '--latency', str(self.latency)])
+        connection = DBusConnection(self.address).connect()
+        try:
+            deadline = time.monotonic() + 60
+            while not connection.call('org.freedesktop.DBus', '/org/freedesktop/DBus', 'org.freedesktop.DBus',
+                                      'NameHasOwner', 's', (BUS_NAME,)):
+                if self._process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError('Mock service did not start')
+                time.sleep(0.05)
+        finally:
+            connection.close()
+        return self
+
+    def __exit__(self, *exc):
+        self._process.terminate()
+        self._process.wait()
+
+
+def connect(backend: str, address: str) -> ModemManager:
+    if backend == 'socket':
+        return ModemManager(backend=SocketBackend(address))
+    import pydbus
+    return ModemManager(system_bus=pydbus.connect(address), loop_thread=True)
+
+
+def percentile(durations: List[float], q: float) -> Optional[float]:
+    if not durations:
+        return None
+    return durations[min(len(durations) - 1, int(q * len(durations)))]
+
+
+def result(benchmark: str, objects: int, durations: List[float] = None, operations: int = None,
+           seconds: float = None, **extra) -> Dict[str, object]:
+    """
+    Result record of one benchmark at one number of objects, from the durations of its operations,
+    or from an operation count and the total time where single operations cannot be timed.
+    """
+    if durations is not None:
+        durations = sorted(durations)
+        operations = len(durations)
+        seconds = sum(durations)
+    record = {
+        'benchmark': benchmark,
+        'objects': objects,
+        'operations': operations,
+        'seconds': seconds,
+        'mean': seconds / operations if operations else None,
+        'per_second': operations / seconds if seconds else None,
+        'min': durations[0] if durations else None,
+        'p50': percentile(durations, 0.5) if durations else None,
+        'p95': percentile(durations, 0.95) if durations else None,
+        'p99': percentile(durations, 0.99) if durations else None,
+        'max': durations[-1] if durations else None,
+    }
+    record.update(extra)
+    return record
+
+
+def timed(fn: Callable, items: Iterable, rounds: int) -> List[float]:
+    """
+    Run fn on every item, rounds times after one untimed round, and return the durations.
+    """
+    items = list(items)
+    for item in items:
+        fn(item)
+    durations = []
+    clock = time.perf_counter
+    for _ in range(rounds):
+        for item in items:
+            start = clock()
+            fn(item)
+            durations.append(clock() - start)
+    return durations
+
+
+def run_scale(options: argparse.Namespace, address: str, objects: int) -> List[Dict[str, object]]:
+    results = []
+    rounds = max(1, -(-options.min_ops // objects))
+
+    def log(benchmark: str):
+        record = results[-1]
+        print(f'{benchmark:16} {objects:6} objects  {record["mean"] * 1e6:10.1f} us/op  '
+              f'{record["per_second"]:10.0f} op/s', file=sys.stderr)
+
+    durations = []
+    for _ in range(options.enumerations):
+        start = time.perf_counter()
+        manager = connect(options.backend, address)
+        count = len(manager.modems)
+        durations.append(time.perf_counter() - start)
+        manager.close()
+        if count != objects:
+            raise RuntimeError(f'Enumerated {count} of {objects} modems')
+    results.append(result('enumerate.cold', objects, durations))
+    log('enumerate.cold')
+
+    manager = connect(options.backend, address)
+    reader = connect(options.backend, address)
+    try:
+        modems = manager.modems
+        results.append(result('enumerate', objects, timed(lambda _: manager.registry.load(), range(1),
+                                                          options.enumerations)))
+        log('enumerate')
+
+        paths = [modem.path for modem in modems]
+        backend = reader.backend
+        results.append(result('read.raw', objects, timed(
+            lambda path: backend.call(path, PROPERTIES_INTERFACE, 'Get', 'ss', (Modem.INTERFACE, 'SignalQuality')),
+            paths, rounds)))
+        log('read.raw')
+
+        uncached = [reader.get_wrapper(Modem, path) for path in paths]
+        results.append(result('read.single', objects, timed(lambda modem: modem.SignalQuality, uncached, rounds)))
+        log('read.single')
+
+        results.append(result('read.cached', objects, timed(lambda modem: modem.SignalQuality, modems,
+                                                            rounds * 100)))
+        log('read.cached')
+
+        results.append(result('read.bulk', objects, timed(lambda modem: modem.snapshot(), uncached, rounds)))
+        log('read.bulk')
+
+        messages = [reader.get_sms(backend.call(path, MESSAGING_INTERFACE, 'Create', 'a{sv}',
+                                                ({'number': '+15550100', 'text': 'benchmark'},)))
+                    for path in paths]
+        results.append(result('sms.send', objects, timed(lambda sms: sms.Send(), messages, rounds)))
+        log('sms.send')
+
+        results.append(signal_throughput(manager, modems, options.signals, objects))
+        log('signals')
+    finally:
+        reader.close()
+        manager.close()
+    return results
+
+
+def signal_throughput(manager: ModemManager, modems: List[Modem], count: int, objects: int) -> Dict[str, object]:
+    """
+    Have the mock send count PropertiesChanged signals of its modems in one burst, and time their delivery
+    to a handler on every wrapper, from the reply to the request to the last signal.
+    """
+    lock = threading.Lock()
+    done = threading.Event()
+    received = [0]
+
+    def on_change(interface, changed, invalidated):
+        with lock:
+            received[0] += 1
+            if received[0] == count:
+                done.set()
+
+    handles = [modem.connect_signal('PropertiesChanged', on_change, PROPERTIES_INTERFACE) for modem in modems]
+    try:
+        manager.backend.call(MANAGER_PATH, CONTROL_INTERFACE, 'EmitSignals', 'u', (count,))
+        start = time.perf_counter()
+        done.wait(60)
+        seconds = time.perf_counter() - start
+    finally:
+        for handle in handles:
+            handle.disconnect()
+    return result('signals', objects, operations=received[0], seconds=seconds, lost=count - received[0])
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=HERE, capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(report: Dict[str, object], baseline: Dict[str, object], tolerance: float) -> List[str]:
+    """
+    Regressions of the mean time per operation against a baseline report, beyond the tolerated share.
+    """
+    before = {(record['benchmark'], record['objects']): record for record in baseline['results']}
+    regressions = []
+    for record in report['results']:
+        old = before.get((record['benchmark'], record['objects']))
+        if old is None or not old['mean'] or not record['mean']:
+            continue
+        ratio = record['mean'] / old['mean']
+        if ratio > 1 + tolerance:
+            regressions.append(f'{record["benchmark"]} at {record["objects"]} objects: '
+                               f'{old["mean"] * 1e6:.1f} -> {record["mean"] * 1e6:.1f} us/op ({ratio:.2f}x)')
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the wrappers against a mock ModemManager on a private bus.')
+    parser.add_argument('--objects', default='1,100,1000', help='comma separated numbers of modems to run at')
+    parser.add_argument('--backend', choices=('socket', 'pydbus'), default='socket')
+    parser.add_argument('--min-ops', type=int, default=1000, help='minimum number of timed operations per benchmark')
+    parser.add_argument('--enumerations', type=int, default=5, help='timed enumerations per number of modems')
+    parser.add_argument('--signals', type=int, default=10000, help='signals per throughput run')
+    parser.add_argument('--latency', type=float, default=0.0, help='reply latency of the mock, in seconds')
+    parser.add_argument('--output', help='file to write the JSON report to, defaults to stdout')
+    parser.add_argument('--compare', help='earlier JSON report to check for regressions')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='share by which the mean time per operation may grow before it counts as a regression')
+    options = parser.parse_args()
+
+    report = {
+        'created': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'backend': options.backend,
+        'latency': options.latency,
+        'results': [],
+    }
+    with PrivateBus() as bus:
+        for objects in (int(n) for n in options.objects.split(',')):
+            with MockDaemon(bus.address, objects, options.latency):
+                report['results'].extend(run_scale(options, bus.address, objects))
+
+    text = json.dumps(report, indent=2)
+    if options.output:
+        with open(options.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+    if options.compare:
+        with open(options.compare) as f:
+            regressions = compare(report, json.load(f), options.tolerance)
+        for line in regressions:
+            print(f'REGRESSION {line}', file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
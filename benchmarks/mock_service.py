@@ -0,0 +1,156 @@
+"""
+Stand-in for the ModemManager daemon on a private bus: serves the objects of a FakeBackend under the name
+org.freedesktop.ModemManager1, for benchmarks/bench.py.
+
+    python benchmarks/mock_service.py --address unix:path=/tmp/bus --modems 100
+"""
+
+import argparse
+import os
+import signal
+import sys
+import threading
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import Dict, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import MMIntrospection  # noqa: E402
+from DBusSocket import SIGNAL, DBusConnection, DBusError, Message, Variant, split_signature  # noqa: E402
+from FakeBackend import FAILED, MANAGER_PATH, MODEM_INTERFACE, OBJECT_MANAGER_INTERFACE, FakeBackend  # noqa: E402
+from SocketBackend import PROPERTIES_INTERFACE  # noqa: E402
+
+BUS_NAME = 'org.freedesktop.ModemManager1'
+CONTROL_INTERFACE = 'org.freedesktop.ModemManager1.Mock'
+"""
+Interface on the manager path driving the mock from a benchmark; not part of ModemManager.
+"""
+
+
+@lru_cache(maxsize=None)
+def _out_signature(version: str, interface: str, method: str) -> Optional[str]:
+    element = MMIntrospection.interface_element(version, interface)
+    if element is None:
+        return None
+    for member in element.iter('method'):
+        if member.attrib['name'] == method:
+            return ''.join(arg.attrib['type'] for arg in member.iter('arg') if arg.attrib.get('direction') == 'out')
+    return None
+
+
+@lru_cache(maxsize=None)
+def _signal_signature(version: str, interface: str, member: str) -> str:
+    element = MMIntrospection.interface_element(version, interface)
+    for signal_element in element.iter('signal') if element is not None else ():
+        if signal_element.attrib['name'] == member:
+            return ''.join(arg.attrib['type'] for arg in signal_element.iter('arg'))
+    return ''
+
+
+class MockService(object):
+    """
+    Answers method calls on the bus from a FakeBackend and broadcasts the signals it emits.
+
+    Values of signature "v" are sent with the signature of the bundled property they belong to,
+    so clients decode them exactly as they would replies of the daemon. Objects are not introspectable;
+    clients use the bundled interface descriptions, as the wrappers do by default.
+    """
+
+    def __init__(self, connection: DBusConnection, fake: FakeBackend):
+        self.connection = connection
+        self.fake = fake
+        self.version = fake.version
+        connection.method_handler = self._on_call
+        fake.subscribe(BUS_NAME, MANAGER_PATH, self._on_signal)
+
+    def start(self):
+        if self.connection.request_name(BUS_NAME) != 1:
+            raise RuntimeError(f'{BUS_NAME} is already owned on {self.connection.address}')
+
+    def _variants(self, interface: str, properties: Dict[str, object]) -> Dict[str, Variant]:
+        return {name: Variant(MMIntrospection.property_signature(self.version, interface, name), value)
+                for name, value in properties.items()}
+
+    def _objects(self, interfaces: Dict[str, Dict[str, object]]) -> Dict[str, Dict[str, Variant]]:
+        return {interface: self._variants(interface, properties) for interface, properties in interfaces.items()}
+
+    def _on_call(self, call: Message):
+        if call.interface == CONTROL_INTERFACE:
+            self._control(call)
+            return
+        self.fake.call_async(call.path, call.interface, call.member, call.signature,
+                             tuple(call.body)).add_done_callback(lambda reply: self._reply(call, reply))
+
+    def _reply(self, call: Message, reply: Future):
+        error = reply.exception()
+        if error is not None:
+            if isinstance(error, DBusError):
+                self.connection.reply_error(call, error.name, error.message)
+            else:
+                self.connection.reply_error(call, FAILED, str(error))
+            return
+        result = reply.result()
+        if call.interface == PROPERTIES_INTERFACE and call.member == 'Get':
+            result = Variant(MMIntrospection.property_signature(self.version, *call.body[:2]), result)
+        elif call.interface == PROPERTIES_INTERFACE and call.member == 'GetAll':
+            result = self._variants(call.body[0], result)
+        elif call.interface == OBJECT_MANAGER_INTERFACE and call.member == 'GetManagedObjects':
+            result = {path: self._objects(interfaces) for path, interfaces in result.items()}
+        signature = _out_signature(self.version, call.interface, call.member) or ''
+        if not signature:
+            body = ()
+        elif len(split_signature(signature)) > 1:
+            body = result
+        else:
+            body = (result,)
+        self.connection.reply(call, signature, body)
+
+    def _on_signal(self, path: str, interface: str, member: str, args: tuple):
+        if interface == PROPERTIES_INTERFACE and member == 'PropertiesChanged':
+            args = (args[0], self._variants(args[0], args[1]), args[2])
+        elif interface == OBJECT_MANAGER_INTERFACE and member == 'InterfacesAdded':
+            args = (args[0], self._objects(args[1]))
+        self.connection.emit(path, interface, member, _signal_signature(self.version, interface, member), args)
+
+    def _control(self, call: Message):
+        if call.member == 'EmitSignals':
+            # encoded up front and written in one piece, so the burst is limited by the client and not by the mock
+            count = call.body[0]
+            paths = self.fake.modem_paths
+            messages = [Message(SIGNAL, paths[i % len(paths)], PROPERTIES_INTERFACE, 'PropertiesChanged',
+                                signature='sa{sv}as',
+                                body=[MODEM_INTERFACE, {'SignalQuality': Variant('(ub)', (i % 101, True))}, []])
+                        for i in range(count)]
+            self.connection.reply(call)
+            self.connection.send_all(messages)
+        elif call.member == 'SetLatency':
+            self.fake.latency = call.body[0]
+            self.connection.reply(call)
+        else:
+            self.connection.reply_error(call, 'org.freedesktop.DBus.Error.UnknownMethod',
+                                        f'No such method {CONTROL_INTERFACE}.{call.member}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mock ModemManager daemon serving simulated modems on a bus.')
+    parser.add_argument('--address', required=True, help='D-Bus address of the bus to serve on')
+    parser.add_argument('--modems', type=int, default=1, help='number of simulated modems')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds until each reply')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the simulation')
+    args = parser.parse_args()
+
+    fake = FakeBackend(modems=args.modems, latency=args.latency, seed=args.seed)
+    service = MockService(DBusConnection(args.address).connect(), fake)
+    service.start()
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    while not stop.is_set() and not service.connection.closed:
+        stop.wait(0.5)
+    service.connection.close()
+    fake.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+import os
+import shutil
+import sys
+import time
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from FakeBackend import FakeBackend  # noqa: E402
+from ModemManager import ModemManager  # noqa: E402
+
+
+@pytest.fixture(params=[True, False], ids=['signals', 'no-signals'])
+def signals(request) -> bool:
+    """
+    Whether the backend delivers signals; tests run both ways unless they parametrize it themselves.
+    """
+    return request.param
+
+
+@pytest.fixture
+def backend(signals) -> FakeBackend:
+    return FakeBackend(modems=1, signals=signals)
+
+
+@pytest.fixture
+def manager(backend):
+    manager = ModemManager(backend=backend)
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def eventually():
+    """
+    Wait for a condition that becomes true on another thread, e.g. once a signal was dispatched.
+    """
+
+    def wait(condition, timeout: float = 1.0) -> bool:
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    return wait
+
+
+@pytest.fixture
+def calls(backend) -> list:
+    """
+    (interface, method) of every call the backend receives from now on.
+    """
+    calls = []
+    call_async = backend.call_async
+
+    def counted(path, interface, method, signature, args, timeout=None):
+        calls.append((interface, method))
+        return call_async(path, interface, method, signature, args, timeout)
+
+    backend.call_async = counted
+    return calls
+
+
+@pytest.fixture(scope='module')
+def daemon() -> str:
+    """
+    Address of a private dbus-daemon on which benchmarks/mock_service.py serves three modems.
+    """
+    if shutil.which('dbus-daemon') is None:
+        pytest.skip('dbus-daemon is not installed')
+    sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+    from bench import MockDaemon, PrivateBus
+    with PrivateBus() as bus, MockDaemon(bus.address, 3):
+        yield bus.address
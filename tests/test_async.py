@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip('dbus_next')
+
+from dbus_next.aio import MessageBus  # noqa: E402
+
+from AsyncModemManager import AsyncModemManager  # noqa: E402
+from MMEnums import MMModemPowerState, MMModemState  # noqa: E402
+from MMErrors import MMWaitTimeoutError  # noqa: E402
+from Modem import ModemSnapshot  # noqa: E402
+
+
+def run(address: str, test):
+    async def main():
+        bus = await MessageBus(bus_address=address).connect()
+        try:
+            manager = await AsyncModemManager.connect(bus)
+            return await test(manager, await manager.modems)
+        finally:
+            bus.disconnect()
+
+    return asyncio.run(main())
+
+
+def test_properties_and_snapshot(daemon):
+    async def test(manager, modems):
+        assert len(modems) == 3
+        assert await modems[0].Model == 'FakeModem 1'
+        assert tuple(await modems[0].SignalQuality) == (70, True)
+        snapshot = await modems[0].snapshot()
+        assert isinstance(snapshot, ModemSnapshot)
+        assert snapshot.PowerState is MMModemPowerState.MM_MODEM_POWER_STATE_ON
+
+    run(daemon, test)
+
+
+def test_wait_for_state(daemon):
+    async def test(manager, modems):
+        modem = modems[1]
+        assert await modem.wait_for_state(MMModemState.MM_MODEM_STATE_REGISTERED, timeout=1) \
+            is MMModemState.MM_MODEM_STATE_REGISTERED
+        await modem.Enable(False)
+        with pytest.raises(MMWaitTimeoutError) as error:
+            await modem.wait_for_state(MMModemState.MM_MODEM_STATE_REGISTERED, timeout=0.2)
+        assert error.value.value == MMModemState.MM_MODEM_STATE_DISABLED.value
+        waiting = asyncio.ensure_future(modem.wait_for_state(MMModemState.MM_MODEM_STATE_REGISTERED, timeout=3))
+        await asyncio.sleep(0.1)
+        await modem.Enable(True)
+        assert await waiting is MMModemState.MM_MODEM_STATE_REGISTERED
+        assert len(manager.signals) == 0
+
+    run(daemon, test)
+
+
+def test_wait_for_power_state(daemon):
+    async def test(manager, modems):
+        modem = modems[2]
+        waiting = asyncio.ensure_future(modem.wait_for_power_state(MMModemPowerState.MM_MODEM_POWER_STATE_LOW,
+                                                                   timeout=3))
+        await asyncio.sleep(0.1)
+        await modem.SetPowerState(MMModemPowerState.MM_MODEM_POWER_STATE_LOW)
+        assert await waiting is MMModemPowerState.MM_MODEM_POWER_STATE_LOW
+
+    run(daemon, test)
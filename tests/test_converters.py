@@ -0,0 +1,60 @@
+import pytest
+
+from FakeBackend import MANAGER_PATH, SMS_INTERFACE
+from MMEnums import MMBearerIpMethod
+from MMInterface import plain_converter, property_converter
+
+
+@pytest.mark.parametrize('signature, value, expected', [
+    ('a{sv}', {'apn': 'internet'}, {'apn': 'internet'}),
+    ('ay', [104, 105], b'hi'),
+    ('au', (1, 2), [1, 2]),
+    ('(ub)', [70, True], (70, True)),
+    ('a(uu)', [[1, 2], (3, 4)], [(1, 2), (3, 4)]),
+    ('a{sa{sv}}', {'a': {'b': 1}}, {'a': {'b': 1}}),
+    ('s', 'text', 'text'),
+])
+def test_plain_converter(signature, value, expected):
+    converted = plain_converter(signature)(value)
+    assert converted == expected and type(converted) is type(expected)
+
+
+def test_plain_converter_copies():
+    value = {'a': {'b': 1}}
+    converted = plain_converter('a{sa{sv}}')(value)
+    converted['a']['b'] = 2
+    assert value == {'a': {'b': 1}}
+
+
+def test_converters_compiled_once():
+    assert plain_converter('a{sa{sv}}') is plain_converter('a{sa{sv}}')
+    assert property_converter('org.freedesktop.ModemManager1.Bearer', 'Ip4Config') is dict
+
+
+def test_bearer_properties(manager):
+    modem = manager.modems[0]
+    bearer = manager.get_bearer(modem.CreateBearer({'apn': 'internet'}))
+    bearer.Connect()
+    assert bearer.Properties == {'apn': 'internet'}
+    config = bearer.Ip4Config
+    assert config == {'method': MMBearerIpMethod.MM_BEARER_IP_METHOD_DHCP.value}
+    config.clear()
+    assert bearer.Ip4Config
+    assert isinstance(bearer.Stats, dict) and isinstance(modem.UnlockRetries, dict)
+
+
+def test_sms_data_is_bytes(backend, manager):
+    path = backend.add_object(f'{MANAGER_PATH}/SMS/100', {SMS_INTERFACE: {'Data': [1, 2, 3]}})
+    assert manager.get_sms(path).Data == b'\x01\x02\x03'
+
+
+def test_async_converter():
+    pytest.importorskip('dbus_next')
+    from dbus_next import Variant
+    from AsyncMMInterface import converter
+
+    assert converter('a{uu}') is None
+    assert converter('a{sv}')({'apn': Variant('s', 'internet')}) == {'apn': 'internet'}
+    assert converter('(ub)')([70, True]) == (70, True)
+    assert converter('ay')(b'\x01') == b'\x01'
+    assert converter('a{sv}') is converter('a{sv}')
@@ -0,0 +1,108 @@
+import threading
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from DBusSocket import DBusError
+from FakeBackend import FakeBackend, MODEM_INTERFACE
+from MMBackend import TimerQueue
+from MMErrors import MMTimeoutError
+from ModemManager import ModemManager
+
+
+def test_timer_queue_runs_in_order_and_cancels():
+    timers = TimerQueue('TestTimers')
+    calls = []
+    done = threading.Event()
+    timers.schedule(0.05, calls.append, 'second')
+    timers.schedule(0.02, calls.append, 'first')
+    timers.cancel(timers.schedule(0.03, calls.append, 'cancelled'))
+    timers.schedule(0.06, done.set)
+    assert done.wait(1)
+    assert calls == ['first', 'second']
+    timers.close()
+
+
+def test_timer_queue_runs_due_callbacks_at_once():
+    timers = TimerQueue('TestTimers')
+    calls = []
+    assert timers.schedule(0, calls.append, 'now') is None
+    assert calls == ['now']
+    timers.close()
+
+
+def test_timer_queue_close_fails_pending_futures():
+    timers = TimerQueue('TestTimers')
+    resolved, pending = Future(), Future()
+    timers.resolve(0, resolved, 'now')
+    timers.resolve(60, pending, 'later')
+    timers.close()
+    assert resolved.result(0) == 'now'
+    with pytest.raises(ConnectionError):
+        pending.result(0)
+
+
+def test_close_fails_pending_calls():
+    backend = FakeBackend(modems=1)
+    manager = ModemManager(backend=backend)
+    backend.latency = 60
+    future = manager.call_async(backend.modem_paths[0], MODEM_INTERFACE, 'Enable', (True,))
+    manager.close()
+    with pytest.raises(ConnectionError):
+        future.result(1)
+
+
+def test_latency_and_timeout():
+    backend = FakeBackend(modems=1)
+    manager = ModemManager(backend=backend)
+    try:
+        modem = manager.modems[0]
+        backend.latency = 0.1
+        started = time.monotonic()
+        modem.Enable(True)
+        assert time.monotonic() - started >= 0.1
+        with pytest.raises(MMTimeoutError):
+            modem.Enable(True, timeout=0.02)
+    finally:
+        manager.close()
+
+
+def test_failure_rate():
+    backend = FakeBackend(modems=1, seed=1)
+    manager = ModemManager(backend=backend)
+    try:
+        modem = manager.modems[0]
+        backend.failure_rate = 1.0
+        with pytest.raises(DBusError):
+            modem.Enable(True)
+    finally:
+        manager.close()
+
+
+def test_added_and_removed_modems_are_announced(eventually):
+    backend = FakeBackend(modems=1)
+    manager = ModemManager(backend=backend)
+    try:
+        assert len(manager.modems) == 1
+        path = backend.add_modem({'Model': 'Other'})
+        assert eventually(lambda: len(manager.modems) == 2)
+        assert manager.registry[path].Model == 'Other'
+        backend.remove_modem(path)
+        assert eventually(lambda: len(manager.modems) == 1)
+    finally:
+        manager.close()
+
+
+def test_without_signals_nothing_is_dispatched():
+    backend = FakeBackend(modems=1, signals=False)
+    manager = ModemManager(backend=backend)
+    try:
+        assert not backend.dispatching
+        seen = []
+        manager.signals.connect(None, MODEM_INTERFACE, 'StateChanged', lambda *args: seen.append(args))
+        manager.modems[0].Enable(False)
+        time.sleep(0.05)
+        assert seen == []
+    finally:
+        manager.close()
@@ -0,0 +1,40 @@
+import pytest
+
+from MMInterface import Forward, MMInterface
+from Modem import Modem
+from ModemManager import ModemManager
+from SIM import SIM
+
+
+def test_descriptors_made_at_class_creation():
+    assert isinstance(vars(Modem)['StateChanged'], Forward)
+    # members of the interfaces below Modem, e.g. Modem.Messaging
+    assert isinstance(vars(Modem)['Messages'], Forward)
+    assert isinstance(vars(SIM)['SimIdentifier'], property)
+    assert isinstance(vars(ModemManager)['InterfacesAdded'], Forward)
+    assert 'Messages' not in vars(ModemManager)
+
+
+def test_forwarded_member_reads_proxy(manager):
+    modem = manager.modems[0]
+    assert list(modem.Messages) == []
+    assert modem.StateChanged is not None
+
+
+def test_unknown_member_does_not_touch_the_class(manager):
+    modem = manager.modems[0]
+    members = dict(vars(Modem))
+    with pytest.raises(AttributeError):
+        modem.NotAMember
+    modem.__class__.__getattr__(modem, 'Messages')
+    assert dict(vars(Modem)) == members
+
+
+def test_subclass_gets_own_descriptors():
+    class Custom(MMInterface):
+        INTERFACE = SIM.INTERFACE
+        FORWARDED = ('Extra',)
+
+    assert isinstance(vars(Custom)['SimIdentifier'], Forward)
+    assert isinstance(vars(Custom)['Extra'], Forward)
+    assert isinstance(vars(SIM)['SimIdentifier'], property)
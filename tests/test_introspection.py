@@ -0,0 +1,47 @@
+import MMIntrospection
+from FakeBackend import FakeBackend, MODEM_INTERFACE
+from ModemManager import ModemManager
+
+
+def test_select_version():
+    latest = MMIntrospection.latest_version()
+    assert MMIntrospection.select_version(latest + '.4') == latest
+    assert MMIntrospection.select_version('0.1.0') is None
+
+
+def test_signatures():
+    latest = MMIntrospection.latest_version()
+    assert MMIntrospection.method_signature(latest, MODEM_INTERFACE, 'Command') == 'su'
+    assert MMIntrospection.property_signature(latest, MODEM_INTERFACE, 'SignalQuality') == '(ub)'
+    assert MMIntrospection.method_signature(latest, MODEM_INTERFACE, 'NoSuchMethod') is None
+
+
+def test_build_node():
+    latest = MMIntrospection.latest_version()
+    node = MMIntrospection.build_node(latest, [MODEM_INTERFACE])
+    names = [element.attrib['name'] for element in node]
+    assert names[0] == MODEM_INTERFACE and 'org.freedesktop.DBus.Properties' in names
+    assert MMIntrospection.build_node(latest, ['org.example.Unknown']) is None
+
+
+def introspected(static_introspection: bool) -> list:
+    backend = FakeBackend(modems=1)
+    paths = []
+    introspect = backend.introspect
+
+    def counted(path):
+        paths.append(path)
+        return introspect(path)
+
+    backend.introspect = counted
+    manager = ModemManager(backend=backend, static_introspection=static_introspection)
+    try:
+        manager.get_object(backend.modem_paths[0], [MODEM_INTERFACE])
+    finally:
+        manager.close()
+    return paths
+
+
+def test_proxies_built_without_introspect():
+    assert introspected(True) == []
+    assert '/org/freedesktop/ModemManager1/Modem/0' in introspected(False)
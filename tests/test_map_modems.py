@@ -0,0 +1,60 @@
+import threading
+import time
+
+import pytest
+
+from FakeBackend import FakeBackend
+from ModemManager import ModemManager
+
+
+@pytest.fixture
+def fleet():
+    manager = ModemManager(backend=FakeBackend(modems=8))
+    yield manager
+    manager.close()
+
+
+def test_results_in_order_with_errors(fleet):
+    modems = fleet.modems
+
+    def fn(modem):
+        if modem is modems[3]:
+            raise ValueError('broken')
+        return modem.path
+
+    results = fleet.map_modems(fn, max_workers=3)
+    assert [result.modem for result in results] == modems
+    assert [result.result for result in results if result.error is None] == \
+        [modem.path for modem in modems if modem is not modems[3]]
+    assert isinstance(results[3].error, ValueError)
+
+
+def test_workers_bounded(fleet):
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def fn(modem):
+        with lock:
+            running.append(modem)
+            peak.append(len(running))
+        time.sleep(0.02)
+        with lock:
+            running.remove(modem)
+
+    fleet.map_modems(fn, max_workers=2)
+    assert max(peak) == 2
+
+
+def test_timeout_leaves_daemon_workers(fleet):
+    release = threading.Event()
+    try:
+        started = time.monotonic()
+        results = fleet.map_modems(lambda modem: release.wait(5), max_workers=2, timeout=0.1)
+        assert time.monotonic() - started < 1
+        assert all(isinstance(result.error, TimeoutError) for result in results)
+        assert 'not started' in str(results[-1].error)
+        workers = [t for t in threading.enumerate() if t.name.startswith('map_modems')]
+        assert workers and all(t.daemon for t in workers)
+    finally:
+        release.set()
@@ -0,0 +1,98 @@
+import gc
+import json
+
+import pytest
+
+from DBusSocket import DBusError
+from MMMetrics import CallStats, MetricsRegistry
+
+
+def test_quantile():
+    stats = CallStats()
+    assert stats.quantile(0.5) is None
+    for seconds in [0.001] * 98 + [0.5, 2.0]:
+        stats.add(seconds, False)
+    assert stats.quantile(0.5) <= 0.001
+    assert 0.5 <= stats.quantile(0.99) <= 2.0
+    assert stats.quantile(1.0) == 2.0
+
+
+def test_record_per_name_and_path():
+    metrics = MetricsRegistry()
+    metrics.record('Modem.Enable', '/a', 0.01)
+    metrics.record('Modem.Enable', '/b', 0.02, error=True)
+    metrics.record('Modem.Reset', '/a', 0.03)
+    total = metrics.get('Modem.Enable')
+    assert (total.count, total.errors) == (2, 1)
+    assert metrics.get('Modem.Enable', '/b').count == 1
+    assert metrics.get('Modem.Command').count == 0
+    assert set(metrics.snapshot()) == {'Modem.Enable', 'Modem.Reset'}
+    assert set(metrics.snapshot(per_path=True)['Modem.Enable']) == {'/a', '/b'}
+
+
+def test_forget_folds_into_totals():
+    metrics = MetricsRegistry()
+    metrics.record('Modem.Enable', '/a', 0.01)
+    metrics.record('Modem.Enable', '/b', 0.02)
+    metrics.forget('/a')
+    metrics.forget('/b')
+    metrics.forget('/c')
+    assert metrics.get('Modem.Enable').count == 2
+    assert metrics.get('Modem.Enable', '/a').count == 0
+    assert set(metrics.snapshot(per_path=True)['Modem.Enable']) == {None}
+
+
+def test_dump(tmp_path):
+    metrics = MetricsRegistry()
+    metrics.record('SMS.Send', '/sms', 0.1)
+    file = tmp_path / 'metrics.json'
+    text = metrics.dump(str(file))
+    assert json.loads(file.read_text()) == json.loads(text)
+    assert json.loads(text)['SMS.Send']['count'] == 1
+
+
+def test_disabled():
+    metrics = MetricsRegistry(enabled=False)
+    metrics.record('Modem.Enable', '/a', 0.01)
+    with metrics.measure('Modem.Reset', '/a'):
+        pass
+    assert metrics.snapshot() == {}
+
+
+def test_measure_counts_errors():
+    metrics = MetricsRegistry()
+    with pytest.raises(ValueError):
+        with metrics.measure('Modem.Reset', '/a'):
+            raise ValueError()
+    assert metrics.get('Modem.Reset').errors == 1
+
+
+def test_wrapper_calls_counted(backend, manager):
+    modem = manager.modems[0]
+    manager.metrics.reset()
+    modem.Enable(True)
+    modem.Enable(False)
+    backend.failure_rate = 1.0
+    with pytest.raises(DBusError):
+        modem.Enable(True)
+    stats = manager.metrics.get('Modem.Enable', modem.path)
+    assert (stats.count, stats.errors) == (3, 1)
+
+
+def test_release_drops_path_stats(manager):
+    path = manager.modems[0].Sim
+    sim = manager.get_sim(path)
+    sim.SendPin('1234')
+    del sim
+    gc.collect()
+    manager.release(path)
+    assert path not in manager.metrics.snapshot(per_path=True)['SIM.SendPin']
+    assert manager.metrics.get('SIM.SendPin').count == 1
+
+
+def test_collected_wrapper_drops_path_stats(manager):
+    path = manager.modems[0].Sim
+    manager.get_sim(path).SendPin('1234')
+    gc.collect()
+    manager.get_sim(manager.modems[0].Sim)
+    assert path not in manager.metrics.snapshot(per_path=True)['SIM.SendPin']
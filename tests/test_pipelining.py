@@ -0,0 +1,35 @@
+import time
+
+import pytest
+
+from FakeBackend import MANAGER_PATH, MODEM_INTERFACE
+from ModemManager import ModemManager
+from SocketBackend import PROPERTIES_INTERFACE, SocketBackend
+
+CONTROL_INTERFACE = 'org.freedesktop.ModemManager1.Mock'
+
+
+@pytest.fixture
+def bus_manager(daemon):
+    manager = ModemManager(backend=SocketBackend(daemon))
+    yield manager
+    manager.backend.call(MANAGER_PATH, CONTROL_INTERFACE, 'SetLatency', 'd', (0.0,))
+    manager.close()
+
+
+def test_calls_in_flight_share_the_latency(bus_manager):
+    paths = [modem.path for modem in bus_manager.modems]
+    bus_manager.backend.call(MANAGER_PATH, CONTROL_INTERFACE, 'SetLatency', 'd', (0.2,))
+    started = time.monotonic()
+    futures = [bus_manager.call_async(path, PROPERTIES_INTERFACE, 'Get', (MODEM_INTERFACE, 'Device'))
+               for _ in range(10) for path in paths]
+    results = bus_manager.gather(futures, timeout=5)
+    assert time.monotonic() - started < 1.5
+    assert results == [f'/sys/devices/fake/{path.rsplit("/", 1)[-1]}' for _ in range(10) for path in paths]
+
+
+def test_wrapper_call_async(bus_manager):
+    modem = bus_manager.modems[0]
+    futures = [modem.call_async('Enable', True) for _ in range(5)]
+    assert bus_manager.gather(futures, timeout=5) == [None] * 5
+    assert bus_manager.metrics.get('Modem.Enable').count == 5
@@ -0,0 +1,37 @@
+import gc
+
+from FakeBackend import MESSAGING_INTERFACE, MODEM_INTERFACE
+
+
+def test_proxy_reused_per_path(manager):
+    path = manager.modems[0].path
+    proxy = manager.get_object(path)
+    assert manager.get_object(path) is proxy
+    assert manager.get_object(path, [MODEM_INTERFACE]) is proxy
+
+
+def test_proxy_rebuilt_for_new_interfaces(backend, manager):
+    path = backend.add_modem()
+    proxy = manager.get_object(path, [MODEM_INTERFACE])
+    wider = manager.get_object(path, [MODEM_INTERFACE, MESSAGING_INTERFACE])
+    assert wider is not proxy
+    assert manager.get_object(path, [MODEM_INTERFACE]) is wider
+
+
+def test_proxy_class_shared_per_interface_set(backend, manager):
+    first, second = backend.add_modem(), backend.add_modem()
+    interfaces = [MODEM_INTERFACE, MESSAGING_INTERFACE]
+    assert type(manager.get_object(first, interfaces)) is type(manager.get_object(second, interfaces))
+
+
+def test_release_drops_proxy_and_handlers(manager):
+    path = manager.modems[0].Sim
+    proxy = manager.get_object(path)
+    sim = manager.get_sim(path)
+    sim.connect_signal('PropertiesChanged', sim._on_properties_changed, sim.PROPERTIES_INTERFACE)
+    handlers = len(manager.signals)
+    del sim
+    gc.collect()
+    manager.release(path)
+    assert len(manager.signals) < handlers
+    assert manager.get_object(path) is not proxy
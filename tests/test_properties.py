@@ -0,0 +1,62 @@
+import pytest
+
+from FakeBackend import FakeBackend, MODEM_INTERFACE, OBJECT_MANAGER_INTERFACE
+from MMEnums import MMModemState
+from ModemManager import ModemManager
+
+
+@pytest.mark.parametrize('signals', [True], ids=['signals'])
+def test_seeded_cache_serves_reads(manager, calls):
+    modem = manager.modems[0]
+    calls.clear()
+    assert modem.Model == 'FakeModem 1'
+    assert modem.State == MMModemState.MM_MODEM_STATE_REGISTERED.value
+    assert calls == []
+
+
+@pytest.mark.parametrize('signals', [True], ids=['signals'])
+def test_signals_update_cache(backend, manager, eventually):
+    modem = manager.modems[0]
+    modem.Enable(False)
+    assert eventually(lambda: modem.State == MMModemState.MM_MODEM_STATE_DISABLED.value)
+    backend.set_property(modem.path, MODEM_INTERFACE, 'SignalQuality', (12, True))
+    assert eventually(lambda: tuple(modem.SignalQuality) == (12, True))
+
+
+@pytest.mark.parametrize('signals', [False], ids=['no-signals'])
+def test_no_signals_reads_current_value(backend, manager):
+    modem = manager.modems[0]
+    assert modem.State == MMModemState.MM_MODEM_STATE_REGISTERED.value
+    modem.Enable(False)
+    assert modem.State == MMModemState.MM_MODEM_STATE_DISABLED.value
+    backend.set_property(modem.path, MODEM_INTERFACE, 'SignalQuality', (12, True))
+    assert tuple(modem.SignalQuality) == (12, True)
+
+
+def test_cache_served_only_while_dispatching():
+    backend = FakeBackend(modems=1)
+    manager = ModemManager(backend=backend)
+    try:
+        modem = manager.modems[0]
+        # without PropertiesChanged the cache keeps the old value while signals are delivered
+        backend.set_property(modem.path, MODEM_INTERFACE, 'SignalQuality', (12, True), emit=False)
+        assert tuple(modem.SignalQuality) == (70, True)
+        backend.signals = False
+        assert tuple(modem.SignalQuality) == (12, True)
+    finally:
+        manager.close()
+
+
+@pytest.mark.parametrize('signals', [True], ids=['signals'])
+def test_enumeration_is_one_call(backend, calls):
+    for _ in range(9):
+        backend.add_modem()
+    manager = ModemManager(backend=backend)
+    try:
+        calls.clear()
+        modems = manager.modems
+        assert len(modems) == 10
+        assert {modem.Model for modem in modems} == {'FakeModem 1'}
+        assert calls == [(OBJECT_MANAGER_INTERFACE, 'GetManagedObjects')]
+    finally:
+        manager.close()
@@ -0,0 +1,85 @@
+import threading
+import time
+
+import pytest
+
+from FakeBackend import MODEM_INTERFACE
+
+pytestmark = pytest.mark.parametrize('signals', [True], ids=['signals'])
+
+
+def set_quality(backend, path: str, quality: int):
+    backend.set_property(path, MODEM_INTERFACE, 'SignalQuality', (quality, True))
+
+
+def test_changes_delivered_as_they_arrive(backend, manager):
+    modem = manager.modems[0]
+    with modem.subscribe(['SignalQuality']) as stream:
+        set_quality(backend, modem.path, 10)
+        backend.set_property(modem.path, MODEM_INTERFACE, 'Model', 'Other')
+        change = stream.get(timeout=1)
+        assert (change.path, change.property, tuple(change.old), tuple(change.new)) == \
+            (modem.path, 'SignalQuality', (70, True), (10, True))
+        assert stream.get(timeout=0.1) is None
+    assert list(stream) == []
+
+
+def test_coalesce_merges_changes(backend, manager):
+    modem = manager.modems[0]
+    changes = []
+    stream = modem.subscribe(['SignalQuality'], callback=changes.append, coalesce=0.2)
+    for quality in (10, 20, 30):
+        set_quality(backend, modem.path, quality)
+    time.sleep(0.1)
+    assert changes == []
+    time.sleep(0.3)
+    assert [(tuple(c.old), tuple(c.new)) for c in changes] == [((70, True), (30, True))]
+    stream.close()
+
+
+def test_debounce_waits_for_quiet(backend, manager, eventually):
+    modem = manager.modems[0]
+    changes = []
+    stream = modem.subscribe(['SignalQuality'], callback=changes.append, debounce=0.15)
+    for quality in range(5):
+        set_quality(backend, modem.path, quality)
+        time.sleep(0.05)
+    assert changes == []
+    assert eventually(lambda: changes)
+    assert len(changes) == 1 and tuple(changes[0].new) == (4, True)
+    stream.close()
+
+
+def test_change_back_is_dropped(backend, manager):
+    modem = manager.modems[0]
+    changes = []
+    stream = modem.subscribe(['SignalQuality'], callback=changes.append, coalesce=0.1)
+    set_quality(backend, modem.path, 10)
+    set_quality(backend, modem.path, 70)
+    time.sleep(0.3)
+    assert changes == []
+    stream.close()
+
+
+def test_close_delivers_held_changes(backend, manager):
+    modem = manager.modems[0]
+    stream = modem.subscribe(['SignalQuality'], debounce=10)
+    # streams get each change in the order they subscribed
+    probe = modem.subscribe(['SignalQuality'])
+    set_quality(backend, modem.path, 10)
+    assert probe.get(timeout=1) is not None
+    stream.close()
+    probe.close()
+    assert [tuple(change.new) for change in stream] == [(10, True)]
+
+
+def test_streams_share_the_manager_timer(backend, manager):
+    modems = [manager.get_wrapper(type(manager.modems[0]), backend.add_modem()) for _ in range(20)]
+    threads = threading.active_count()
+    streams = [modem.subscribe(['SignalQuality'], coalesce=0.05) for modem in modems]
+    for modem in modems:
+        set_quality(backend, modem.path, 1)
+    assert streams[-1].get(timeout=1) is not None
+    assert threading.active_count() <= threads + 1
+    for stream in streams:
+        stream.close()
@@ -0,0 +1,77 @@
+import time
+
+import pytest
+
+from DBusSocket import DBusError
+from FakeBackend import FakeBackend, MODEM_INTERFACE
+from ModemManager import ModemManager
+from RecordingBackend import FORMAT, RecordingBackend, read_recording
+from ReplayBackend import ReplayBackend
+
+
+@pytest.fixture
+def recording(tmp_path, eventually):
+    file = str(tmp_path / 'incident.jsonl.gz')
+    backend = FakeBackend(modems=1, latency=0.05)
+    manager = ModemManager(backend=RecordingBackend(backend, file))
+    try:
+        modem = manager.modems[0]
+        modem.Enable(True)
+        backend.set_property(modem.path, MODEM_INTERFACE, 'SignalQuality', (42, True))
+        assert eventually(lambda: tuple(modem.SignalQuality) == (42, True))
+    finally:
+        manager.close()
+    return file
+
+
+def test_recording_file(recording):
+    header, events = read_recording(recording)
+    assert header['format'] == FORMAT and header['backend'] == 'FakeBackend'
+    calls = [event['call'][2] for event in events if 'call' in event]
+    assert 'GetManagedObjects' in calls and 'Enable' in calls
+    assert any(event['signal'][3] == 'PropertiesChanged' for event in events if 'signal' in event)
+
+
+def test_replayed_replies(recording):
+    manager = ModemManager(backend=ReplayBackend(recording, speed=0))
+    try:
+        modem = manager.modems[0]
+        assert modem.Model == 'FakeModem 1'
+        modem.Enable(True)
+        with pytest.raises(DBusError) as error:
+            modem.Reset()
+        assert error.value.name == 'org.freedesktop.DBus.Error.UnknownMethod'
+    finally:
+        manager.close()
+
+
+def test_replies_keep_recorded_latency(recording):
+    manager = ModemManager(backend=ReplayBackend(recording))
+    try:
+        modem = manager.modems[0]
+        started = time.monotonic()
+        modem.Enable(True)
+        assert time.monotonic() - started >= 0.04
+    finally:
+        manager.close()
+
+
+def test_play_delivers_signals(recording):
+    backend = ReplayBackend(recording, speed=0)
+    manager = ModemManager(backend=backend)
+    try:
+        modem = manager.modems[0]
+        assert tuple(modem.SignalQuality) == (70, True)
+        backend.play()
+        assert backend.wait(5)
+        assert tuple(modem.SignalQuality) == (42, True)
+    finally:
+        manager.close()
+
+
+def test_close_fails_pending_calls(recording):
+    manager = ModemManager(backend=ReplayBackend(recording))
+    future = manager.call_async(manager.modems[0].path, MODEM_INTERFACE, 'Enable', (True,))
+    manager.close()
+    with pytest.raises(ConnectionError):
+        future.result(1)
@@ -0,0 +1,61 @@
+import pytest
+
+from FakeBackend import MODEM_INTERFACE
+from MMEnums import MMModemState
+from MMErrors import MMGoneError
+
+pytestmark = pytest.mark.parametrize('signals', [True], ids=['signals'])
+
+
+@pytest.fixture
+def modems(backend, manager, eventually):
+    backend.add_modem()
+    backend.add_modem()
+    assert eventually(lambda: len(manager.modems) == 3)
+    return manager.modems
+
+
+def restart(backend, manager, eventually):
+    # handlers of the owner change run in the order they were added, so this one runs after the manager's
+    owners = []
+    backend.watch_name_owner(manager.BUS_NAME, lambda old, new: owners.append(new))
+    backend.restart()
+    assert eventually(lambda: owners and owners[-1])
+
+
+def test_wrappers_follow_their_modem(backend, manager, modems, eventually):
+    identifiers = [modem.DeviceIdentifier for modem in modems]
+    old_paths = [modem.path for modem in modems]
+    restart(backend, manager, eventually)
+    assert [modem.Model for modem in modems] == ['FakeModem 1'] * 3
+    assert [modem.path for modem in modems] == backend.modem_paths
+    assert not set(old_paths) & set(backend.modem_paths)
+    assert [modem.DeviceIdentifier for modem in modems] == identifiers
+    assert manager.get_wrapper(type(modems[0]), modems[0].path) is modems[0]
+
+
+def test_handlers_survive_restart(backend, manager, modems, eventually):
+    states = []
+    modems[0].connect_signal('StateChanged', lambda old, new, reason: states.append(new))
+    restart(backend, manager, eventually)
+    modems[0].Enable(False)
+    assert eventually(lambda: states == [MMModemState.MM_MODEM_STATE_DISABLED.value])
+
+
+def test_recovery_is_one_enumeration(backend, manager, modems, calls, eventually):
+    restart(backend, manager, eventually)
+    calls.clear()
+    for modem in modems:
+        modem.Enable(True)
+    assert calls.count(('org.freedesktop.DBus.ObjectManager', 'GetManagedObjects')) == 1
+    assert manager.metrics.get('ModemManager.recover').count == 1
+
+
+def test_modem_not_coming_back_is_gone(backend, manager, modems, eventually):
+    restart(backend, manager, eventually)
+    # the last modem stays unplugged after the restart
+    backend.remove_modem(backend.modem_paths[-1])
+    modems[0].Enable(True)
+    with pytest.raises(MMGoneError):
+        modems[-1].Enable(True)
+    assert backend.get_property(modems[0].path, MODEM_INTERFACE, 'Model') == 'FakeModem 1'
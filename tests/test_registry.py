@@ -0,0 +1,46 @@
+import pytest
+
+from Modem import Modem
+
+
+@pytest.mark.parametrize('signals', [True], ids=['signals'])
+def test_registry_follows_hot_plug(backend, manager, eventually):
+    registry = manager.registry
+    added, removed = [], []
+    registry.on_added(added.append)
+    registry.on_removed(removed.append)
+    assert len(registry) == 1
+    path = backend.add_modem()
+    assert eventually(lambda: path in registry)
+    assert isinstance(registry[path], Modem) and added == [registry[path]]
+    modem = registry.get(path)
+    backend.remove_modem(path)
+    assert eventually(lambda: path not in registry)
+    assert removed == [modem]
+    assert registry.get(path) is None
+
+
+@pytest.mark.parametrize('signals', [True], ids=['signals'])
+def test_modems_come_from_registry(manager, calls):
+    manager.registry
+    calls.clear()
+    assert manager.modems == list(manager.registry)
+    assert calls == []
+
+
+@pytest.mark.parametrize('signals', [False], ids=['no-signals'])
+def test_modems_enumerated_without_signals(backend, manager):
+    first = manager.modems
+    path = backend.add_modem()
+    assert [modem.path for modem in manager.modems] == [first[0].path, path]
+
+
+def test_load_drops_vanished_modems(backend, manager):
+    registry = manager.registry
+    path = backend.modem_paths[0]
+    removed = []
+    registry.on_removed(removed.append)
+    registry.load({})
+    assert path not in registry and [modem.path for modem in removed] == [path]
+    registry.load()
+    assert path in registry
@@ -0,0 +1,95 @@
+import time
+
+import pytest
+
+import SignalSampler as sampler_module
+from FakeBackend import FakeBackend, MODEM_INTERFACE
+from ModemManager import ModemManager
+from SignalSampler import SampleBuffer, SignalSampler
+
+
+@pytest.fixture
+def without_numpy(monkeypatch):
+    monkeypatch.setattr(sampler_module, 'numpy', None)
+
+
+def filled(capacity: int, qualities) -> SampleBuffer:
+    buffer = SampleBuffer(capacity)
+    for i, quality in enumerate(qualities):
+        buffer.append(float(i), quality, True, 0)
+    return buffer
+
+
+def test_buffer_wraps_around():
+    buffer = filled(3, [10, 20, 30, 40])
+    assert len(buffer) == 3
+    assert [s.quality for s in buffer.samples()] == [20, 30, 40]
+    assert buffer.latest().quality == 40
+
+
+@pytest.mark.parametrize('numpy', [True, False], ids=['numpy', 'python'])
+def test_buffer_statistics(numpy, request):
+    if numpy:
+        pytest.importorskip('numpy')
+    else:
+        request.getfixturevalue('without_numpy')
+    buffer = filled(4, [10, 20, 30, 40, 50])
+    assert buffer.percentile(0) == 20
+    assert buffer.percentile(50) == 35
+    assert list(buffer.moving_average(2)) == [25, 35, 45]
+    assert list(buffer.moving_average(5)) == []
+    assert SampleBuffer(4).percentile(50) is None
+
+
+def test_view_shares_memory():
+    pytest.importorskip('numpy')
+    buffer = filled(4, [10, 20])
+    view = buffer.view(ordered=False)
+    buffer.append(2.0, 30, True, 0)
+    buffer.append(3.0, 40, True, 0)
+    assert list(buffer.view(ordered=False)) == [10, 20, 30, 40]
+    buffer.columns['quality'][0] = 99
+    assert view[0] == 99
+
+
+def test_view_needs_numpy(without_numpy):
+    with pytest.raises(ImportError):
+        filled(2, [1]).view()
+
+
+def test_signals_record_changes(eventually):
+    backend = FakeBackend(modems=1)
+    manager = ModemManager(backend=backend)
+    sampler = SignalSampler(manager, capacity=10)
+    try:
+        assert not sampler.poll
+        sampler.start()
+        path = backend.modem_paths[0]
+        backend.set_property(path, MODEM_INTERFACE, 'SignalQuality', (42, True))
+        assert eventually(lambda: len(sampler.buffers[path]) == 2)
+        assert sampler.buffers[path].latest().quality == 42
+    finally:
+        sampler.stop()
+        manager.close()
+
+
+def test_poll_follows_added_and_removed_modems(eventually):
+    backend = FakeBackend(modems=2, signals=False)
+    manager = ModemManager(backend=backend)
+    sampler = SignalSampler(manager, capacity=100, interval=0.05)
+    try:
+        assert sampler.poll
+        sampler.start()
+        first, second = backend.modem_paths
+        assert eventually(lambda: len(sampler.buffers.get(second, ())) > 0)
+        added = backend.add_modem()
+        backend.remove_modem(first)
+        # the poll that first samples the added modem already dropped the removed one
+        assert eventually(lambda: len(sampler.buffers.get(added, ())) > 0)
+        removed = len(sampler.buffers[first])
+        time.sleep(0.15)
+        assert len(sampler.buffers[first]) == removed
+        assert len(sampler.buffers[second]) > 1
+    finally:
+        sampler.stop()
+        manager.close()
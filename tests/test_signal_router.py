@@ -0,0 +1,77 @@
+import gc
+
+from SignalRouter import SignalRouter
+
+PROPERTIES = 'org.freedesktop.DBus.Properties'
+
+
+class Handler(object):
+    def __init__(self):
+        self.calls = []
+
+    def on_signal(self, *args):
+        self.calls.append(args)
+
+
+def test_dispatch_by_path_and_member():
+    router = SignalRouter()
+    calls = []
+    router.connect('/a', PROPERTIES, 'PropertiesChanged', lambda *args: calls.append(('a', args)))
+    router.connect('/b', PROPERTIES, 'PropertiesChanged', lambda *args: calls.append(('b', args)))
+    router.connect(None, PROPERTIES, 'PropertiesChanged', lambda *args: calls.append(('any', args)))
+    router.dispatch('/a', PROPERTIES, 'PropertiesChanged', (1,))
+    router.dispatch('/a', PROPERTIES, 'Other', (2,))
+    assert calls == [('a', (1,)), ('any', (1,))]
+
+
+def test_disconnect():
+    router = SignalRouter()
+    calls = []
+    handle = router.connect('/a', 'i', 'm', calls.append)
+    handle.disconnect()
+    handle.disconnect()
+    router.dispatch('/a', 'i', 'm', (1,))
+    assert calls == [] and len(router) == 0
+
+
+def test_failing_handler_does_not_stop_others():
+    router = SignalRouter()
+    calls = []
+    router.connect('/a', 'i', 'm', lambda value: 1 / 0)
+    router.connect('/a', 'i', 'm', calls.append)
+    router.dispatch('/a', 'i', 'm', (1,))
+    assert calls == [1]
+
+
+def test_bound_methods_held_weakly():
+    router = SignalRouter()
+    handler = Handler()
+    router.connect('/a', 'i', 'm', handler.on_signal)
+    router.dispatch('/a', 'i', 'm', (1,))
+    assert handler.calls == [(1,)]
+    del handler
+    gc.collect()
+    assert len(router) == 1
+    router.prune('/a')
+    assert len(router) == 0
+
+
+def test_detach_and_attach():
+    router = SignalRouter()
+    calls = []
+    router.connect('/old', 'i', 'm', calls.append)
+    handles = router.detach('/old')
+    router.dispatch('/old', 'i', 'm', (1,))
+    router.attach('/new', handles)
+    router.dispatch('/new', 'i', 'm', (2,))
+    assert calls == [2]
+    handles[0].disconnect()
+    assert len(router) == 0
+
+
+def test_manager_uses_one_subscription(backend, manager):
+    for path in [backend.add_modem() for _ in range(5)]:
+        manager.get_wrapper(type(manager.modems[0]), path).subscribe()
+    # one namespace-wide subscription, and no per-object handler on the backend
+    assert len(backend._subscriptions) == 1
+    assert len(backend._direct) == 0
@@ -0,0 +1,103 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from SingleFlight import AsyncSingleFlight, SingleFlight
+
+
+def run_together(count: int, fn):
+    results = [None] * count
+    barrier = threading.Barrier(count)
+
+    def run(i):
+        barrier.wait()
+        try:
+            results[i] = fn()
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_calls_share_one():
+    flight = SingleFlight()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.1)
+        return 'value'
+
+    assert run_together(8, lambda: flight.do('key', slow)) == ['value'] * 8
+    assert len(calls) == 1 and len(flight) == 0
+
+
+def test_exception_shared():
+    flight = SingleFlight()
+
+    def failing():
+        time.sleep(0.1)
+        raise ValueError('failed')
+
+    results = run_together(4, lambda: flight.do('key', failing))
+    assert all(isinstance(result, ValueError) for result in results)
+    assert len({id(result) for result in results}) == 1
+
+
+def test_nothing_cached():
+    flight = SingleFlight()
+    values = iter(range(10))
+    assert flight.do('key', lambda: next(values)) == 0
+    assert flight.do('key', lambda: next(values)) == 1
+
+
+@pytest.mark.parametrize('signals', [False], ids=['no-signals'])
+def test_concurrent_property_reads(backend, manager, calls):
+    modem = manager.modems[0]
+    backend.latency = 0.1
+    calls.clear()
+    assert run_together(8, lambda: modem.Model) == ['FakeModem 1'] * 8
+    assert calls == [('org.freedesktop.DBus.Properties', 'Get')]
+
+
+def test_async_calls_share_one():
+    async def main():
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def slow():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return 'value'
+
+        results = await asyncio.gather(*(flight.do('key', slow) for _ in range(5)))
+        assert results == ['value'] * 5 and len(calls) == 1 and len(flight) == 0
+
+    asyncio.run(main())
+
+
+def test_async_cancelled_waiter_keeps_the_call():
+    async def main():
+        flight = AsyncSingleFlight()
+
+        async def slow():
+            await asyncio.sleep(0.05)
+            return 'value'
+
+        leader = asyncio.ensure_future(flight.do('key', slow))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(flight.do('key', slow))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        assert await leader == 'value'
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    asyncio.run(main())
@@ -0,0 +1,54 @@
+import pytest
+
+from Bearer import BearerSnapshot
+from FakeBackend import MODEM_INTERFACE
+from MMEnums import MMModemLock, MMModemPortType, MMModemState
+from Modem import ModemSnapshot
+
+
+def test_snapshot_decodes_enums(backend, manager):
+    modem = manager.modems[0]
+    backend.set_property(modem.path, MODEM_INTERFACE, 'UnlockRetries', {MMModemLock.MM_MODEM_LOCK_SIM_PIN.value: 3})
+    snapshot = modem.snapshot()
+    assert snapshot.path == modem.path
+    assert snapshot.State is MMModemState.MM_MODEM_STATE_REGISTERED
+    assert all(isinstance(kind, MMModemPortType) for _, kind in snapshot.Ports)
+    assert dict(snapshot.UnlockRetries) == {MMModemLock.MM_MODEM_LOCK_SIM_PIN: 3}
+    assert snapshot.Model == 'FakeModem 1'
+    assert snapshot.OwnNumbers == tuple(modem.OwnNumbers)
+
+
+def test_snapshot_is_one_call(manager, calls):
+    modem = manager.modems[0]
+    calls.clear()
+    modem.snapshot()
+    assert calls == [('org.freedesktop.DBus.Properties', 'GetAll')]
+
+
+def test_unknown_and_missing_values():
+    snapshot = ModemSnapshot('/m', {'State': 1000})
+    assert snapshot.State == 1000
+    assert snapshot.Model is None
+
+
+def test_snapshot_is_immutable():
+    snapshot = ModemSnapshot('/m', {'Drivers': ['a'], 'UnlockRetries': {2: 3}})
+    with pytest.raises(AttributeError):
+        snapshot.Model = 'x'
+    with pytest.raises(AttributeError):
+        del snapshot.Model
+    with pytest.raises(TypeError):
+        snapshot.UnlockRetries[2] = 4
+    assert snapshot.Drivers == ('a',)
+
+
+def test_equality_and_hash():
+    properties = {'State': 8, 'Drivers': ['a'], 'UnlockRetries': {2: 3}}
+    first, second = ModemSnapshot('/m', properties), ModemSnapshot('/m', dict(properties))
+    assert first == second and hash(first) == hash(second)
+    assert len({first, second}) == 1
+    assert first != ModemSnapshot('/m', {**properties, 'State': 3})
+    assert first != ModemSnapshot('/other', properties)
+    assert first != BearerSnapshot('/m', {})
+    bearer = BearerSnapshot('/b', {'Ip4Config': {'method': 1, 'dns': ['a']}})
+    assert {bearer: 1}[BearerSnapshot('/b', {'Ip4Config': {'method': 1, 'dns': ['a']}})] == 1
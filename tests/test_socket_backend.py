@@ -0,0 +1,75 @@
+import threading
+
+import pytest
+
+from DBusSocket import DBusConnection
+from FakeBackend import MANAGER_PATH, MODEM_INTERFACE
+from MMEnums import MMModemState
+from MMErrors import MMTimeoutError
+from ModemManager import ModemManager
+from SocketBackend import PROPERTIES_INTERFACE, SocketBackend
+
+CONTROL_INTERFACE = 'org.freedesktop.ModemManager1.Mock'
+
+
+def set_latency(address: str, seconds: float):
+    connection = DBusConnection(address).connect()
+    try:
+        connection.call(ModemManager.BUS_NAME, MANAGER_PATH, CONTROL_INTERFACE, 'SetLatency', 'd', (seconds,))
+    finally:
+        connection.close()
+
+
+@pytest.fixture
+def bus_manager(daemon):
+    manager = ModemManager(backend=SocketBackend(daemon))
+    yield manager
+    set_latency(daemon, 0.0)
+    manager.close()
+
+
+def test_wrappers_without_gi(bus_manager):
+    assert bus_manager.backend.dispatching
+    modems = bus_manager.modems
+    assert len(modems) == 3
+    assert modems[0].Model == 'FakeModem 1'
+    assert tuple(modems[0].SignalQuality) == (70, True)
+
+
+def test_signals_delivered_from_reader_thread(bus_manager):
+    modem = bus_manager.modems[0]
+    states = []
+    handle = modem.connect_signal('StateChanged', lambda old, new, reason: states.append(new))
+    try:
+        modem.Enable(False)
+        modem.wait_for_state(MMModemState.MM_MODEM_STATE_DISABLED, timeout=2)
+        modem.Enable(True)
+        modem.wait_for_state(MMModemState.MM_MODEM_STATE_REGISTERED, timeout=2)
+    finally:
+        handle.disconnect()
+    assert MMModemState.MM_MODEM_STATE_DISABLED.value in states
+
+
+def test_timeouts_cost_no_thread(daemon, bus_manager):
+    path = bus_manager.modems[0].path
+    set_latency(daemon, 0.5)
+    threads = threading.active_count()
+    futures = [bus_manager.call_async(path, PROPERTIES_INTERFACE, 'Get', (MODEM_INTERFACE, 'Model'), timeout=0.1)
+               for _ in range(50)]
+    assert threading.active_count() <= threads + 1
+    for future in futures:
+        with pytest.raises(MMTimeoutError):
+            future.result(2)
+
+
+def test_close_fails_pending_calls(daemon):
+    manager = ModemManager(backend=SocketBackend(daemon))
+    path = manager.modems[0].path
+    set_latency(daemon, 5.0)
+    future = manager.call_async(path, PROPERTIES_INTERFACE, 'Get', (MODEM_INTERFACE, 'Model'))
+    try:
+        manager.close()
+        with pytest.raises(ConnectionError):
+            future.result(2)
+    finally:
+        set_latency(daemon, 0.0)
@@ -0,0 +1,72 @@
+import threading
+import time
+
+import pytest
+
+from FakeBackend import MODEM_INTERFACE
+from MMErrors import CancelToken, MMCancelledError, MMTimeoutError
+
+
+def test_timeout_raises(backend, manager):
+    modem = manager.modems[0]
+    backend.latency = 0.5
+    started = time.monotonic()
+    with pytest.raises(MMTimeoutError) as raised:
+        modem.Reset(timeout=0.05)
+    assert time.monotonic() - started < 0.4
+    assert (raised.value.path, raised.value.method, raised.value.timeout) == (modem.path, 'Reset', 0.05)
+    assert isinstance(raised.value, TimeoutError)
+
+
+def test_timeout_of_async_call(backend, manager):
+    modem = manager.modems[0]
+    backend.latency = 0.5
+    future = manager.call_async(modem.path, MODEM_INTERFACE, 'Reset', timeout=0.05)
+    with pytest.raises(MMTimeoutError):
+        future.result(1)
+
+
+def test_cancel_abandons_waiting_call(backend, manager):
+    modem = manager.modems[0]
+    backend.latency = 5
+    token = CancelToken()
+    threading.Timer(0.05, token.cancel).start()
+    started = time.monotonic()
+    with pytest.raises(MMCancelledError):
+        modem.Reset(cancel=token)
+    assert time.monotonic() - started < 1
+
+
+def test_cancelled_token_sends_nothing(manager, calls):
+    modem = manager.modems[0]
+    token = CancelToken()
+    token.cancel()
+    calls.clear()
+    with pytest.raises(MMCancelledError):
+        modem.Reset(cancel=token)
+    with pytest.raises(MMCancelledError):
+        manager.call_async(modem.path, MODEM_INTERFACE, 'Reset', cancel=token)
+    assert calls == []
+
+
+def test_cancel_fails_async_call(backend, manager):
+    modem = manager.modems[0]
+    backend.latency = 5
+    token = CancelToken()
+    future = modem.call_async('Reset', cancel=token)
+    token.cancel()
+    with pytest.raises(MMCancelledError):
+        future.result(1)
+
+
+def test_token_callbacks():
+    token = CancelToken()
+    calls = []
+    remove = token.add_callback(lambda: calls.append('removed'))
+    token.add_callback(lambda: calls.append('kept'))
+    remove()
+    token.cancel()
+    token.cancel()
+    assert calls == ['kept'] and token.cancelled
+    token.add_callback(lambda: calls.append('late'))
+    assert calls == ['kept', 'late']
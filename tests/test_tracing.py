@@ -0,0 +1,110 @@
+import asyncio
+import json
+
+import pytest
+
+from DBusSocket import DBusError
+from MMTracing import CallbackExporter, JsonLinesExporter, RingExporter, Tracer, summarize
+
+
+@pytest.fixture
+def modem(manager):
+    return manager.modems[0]
+
+
+@pytest.fixture
+def sim(manager, modem):
+    return manager.get_sim(modem.Sim)
+
+
+@pytest.fixture
+def ring(manager, modem, sim):
+    ring = RingExporter()
+    manager.tracer = Tracer(ring)
+    yield ring
+    manager.tracer = None
+
+
+def test_span_per_call(modem, ring):
+    modem.Enable(True)
+    [span] = ring.spans()
+    assert (span.name, span.path, span.args) == ('Modem.Enable', modem.path, 'True')
+    assert span.duration is not None and span.error is None and span.parent_id is None
+
+
+def test_calls_in_span_are_children(manager, modem, ring):
+    with manager.tracer.span('enable-and-snapshot', modem.path) as parent:
+        modem.Enable(True)
+        modem.snapshot()
+    spans = ring.spans()
+    assert [span.name for span in spans] == ['Modem.Enable', 'Modem.snapshot', 'enable-and-snapshot']
+    assert all(span.parent_id == parent.span_id and span.trace_id == parent.trace_id for span in spans[:2])
+
+
+def test_snapshot_metric_per_wrapper_type(manager, modem, sim):
+    modem.snapshot()
+    sim.snapshot()
+    assert manager.metrics.get('Modem.snapshot').count == 1
+    assert manager.metrics.get('SIM.snapshot').count == 1
+    assert manager.metrics.get('Properties.GetAll').count == 0
+
+
+def test_record_args_off(manager, sim):
+    ring = RingExporter()
+    manager.tracer = Tracer(ring, record_args=False)
+    sim.SendPin('1234')
+    [span] = ring.spans()
+    assert span.args is None
+
+
+def test_error_recorded(backend, modem, ring):
+    backend.failure_rate = 1.0
+    with pytest.raises(DBusError):
+        modem.Enable(True)
+    [span] = ring.spans()
+    assert span.error.startswith('DBusError')
+
+
+def test_failing_exporter_does_not_break_calls(manager, modem):
+    def fail(span):
+        raise RuntimeError()
+
+    ring = RingExporter()
+    manager.tracer = Tracer(CallbackExporter(fail), ring)
+    modem.Enable(True)
+    assert len(ring.spans()) == 1
+
+
+def test_json_lines_exporter(tmp_path, manager, modem):
+    file = tmp_path / 'spans.jsonl'
+    manager.tracer = Tracer(JsonLinesExporter(str(file)))
+    modem.Enable(True)
+    modem.Enable(False)
+    manager.tracer.close()
+    lines = [json.loads(line) for line in file.read_text().splitlines()]
+    assert [(line['name'], line['args']) for line in lines] == [('Modem.Enable', 'True'), ('Modem.Enable', 'False')]
+
+
+def test_summarize_cuts_long_arguments():
+    assert summarize(['x' * 500], limit=20) == repr('x' * 500)[:17] + '...'
+
+
+def test_async_snapshot_metric(daemon):
+    pytest.importorskip('dbus_next')
+    from dbus_next.aio import MessageBus
+    from AsyncModemManager import AsyncModemManager
+
+    async def main():
+        bus = await MessageBus(bus_address=daemon).connect()
+        try:
+            manager = await AsyncModemManager.connect(bus)
+            modem = (await manager.modems)[0]
+            ring = RingExporter()
+            manager.tracer = Tracer(ring)
+            await modem.snapshot()
+            assert manager.metrics.get('AsyncModem.snapshot').count == 1
+            assert [span.name for span in ring.spans()] == ['AsyncModem.snapshot']
+        finally:
+            bus.disconnect()
+
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+import threading
+import time
+
+import pytest
+
+from FakeBackend import MODEM_INTERFACE
+from MMEnums import MMModemLock, MMModemPowerState, MMModemState
+from MMErrors import CancelToken, MMCancelledError, MMWaitTimeoutError
+
+
+def test_returns_enum_when_already_reached(manager):
+    modem = manager.modems[0]
+    assert modem.wait_for_state(MMModemState.MM_MODEM_STATE_REGISTERED, timeout=1) \
+        is MMModemState.MM_MODEM_STATE_REGISTERED
+    assert modem.wait_for_power_state(MMModemPowerState.MM_MODEM_POWER_STATE_ON, timeout=1) \
+        is MMModemPowerState.MM_MODEM_POWER_STATE_ON
+    assert modem.wait_for_unlock_required(timeout=1) is MMModemLock.MM_MODEM_LOCK_NONE
+
+
+def test_times_out_after_state_left(manager):
+    modem = manager.modems[0]
+    modem.Enable(False)
+    with pytest.raises(MMWaitTimeoutError) as error:
+        modem.wait_for_state(MMModemState.MM_MODEM_STATE_REGISTERED, timeout=0.2)
+    assert error.value.value == MMModemState.MM_MODEM_STATE_DISABLED.value
+
+
+@pytest.mark.parametrize('signals', [True], ids=['signals'])
+def test_timeout_reports_last_value_seen(backend, manager):
+    modem = manager.modems[0]
+    backend.set_property(modem.path, MODEM_INTERFACE, 'UnlockRequired', MMModemLock.MM_MODEM_LOCK_SIM_PIN.value)
+    threading.Timer(0.05, backend.set_property,
+                    (modem.path, MODEM_INTERFACE, 'UnlockRequired', MMModemLock.MM_MODEM_LOCK_SIM_PUK.value)).start()
+    with pytest.raises(MMWaitTimeoutError) as error:
+        modem.wait_for_unlock_required(timeout=0.3)
+    assert error.value.value == MMModemLock.MM_MODEM_LOCK_SIM_PUK.value
+
+
+@pytest.mark.parametrize('signals', [False], ids=['no-signals'])
+def test_reads_after_connecting(backend, manager, calls):
+    # a read already in flight may predate the handler, so the wait does not join it
+    modem = manager.modems[0]
+    backend.latency = 0.1
+    calls.clear()
+    reader = threading.Thread(target=lambda: modem.State)
+    reader.start()
+    time.sleep(0.02)
+    modem.wait_for_state(MMModemState.MM_MODEM_STATE_REGISTERED, timeout=1)
+    reader.join()
+    assert calls.count(('org.freedesktop.DBus.Properties', 'Get')) == 2
+
+
+@pytest.mark.parametrize('signals', [True], ids=['signals'])
+def test_completes_when_state_reached(backend, manager):
+    modem = manager.modems[0]
+    modem.Enable(False)
+    threading.Timer(0.1, modem.Enable, (True,)).start()
+    assert modem.wait_for_state(MMModemState.MM_MODEM_STATE_REGISTERED, timeout=2) \
+        is MMModemState.MM_MODEM_STATE_REGISTERED
+
+
+@pytest.mark.parametrize('signals', [True], ids=['signals'])
+def test_follows_properties_changed(backend, manager):
+    modem = manager.modems[0]
+    backend.set_property(modem.path, MODEM_INTERFACE, 'UnlockRequired', MMModemLock.MM_MODEM_LOCK_SIM_PIN.value)
+    threading.Timer(0.1, backend.set_property,
+                    (modem.path, MODEM_INTERFACE, 'UnlockRequired', MMModemLock.MM_MODEM_LOCK_NONE.value)).start()
+    assert modem.wait_for_unlock_required(timeout=2) is MMModemLock.MM_MODEM_LOCK_NONE
+
+
+def test_cancel(manager):
+    modem = manager.modems[0]
+    modem.Enable(False)
+    token = CancelToken()
+    threading.Timer(0.1, token.cancel).start()
+    with pytest.raises(MMCancelledError):
+        modem.wait_for_state(MMModemState.MM_MODEM_STATE_REGISTERED, timeout=5, cancel=token)
+
+
+def test_no_handlers_left(manager):
+    modem = manager.modems[0]
+    modem.wait_for_state(MMModemState.MM_MODEM_STATE_REGISTERED, timeout=1)
+    handlers = len(manager.signals)
+    modem.wait_for_state(MMModemState.MM_MODEM_STATE_REGISTERED, timeout=1)
+    with pytest.raises(MMWaitTimeoutError):
+        modem.wait_for_power_state(MMModemPowerState.MM_MODEM_POWER_STATE_LOW, timeout=0.05)
+    assert len(manager.signals) == handlers
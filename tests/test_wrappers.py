@@ -0,0 +1,63 @@
+import gc
+import tracemalloc
+import weakref
+
+from FakeBackend import MANAGER_PATH, SMS_INTERFACE
+from SMS import SMS
+
+
+def add_messages(backend, count: int):
+    return [backend.add_object(f'{MANAGER_PATH}/SMS/{i}', {SMS_INTERFACE: {'Text': f'message {i}'}})
+            for i in range(count)]
+
+
+def live_wrappers(cls) -> int:
+    return sum(1 for obj in gc.get_objects() if type(obj) is cls)
+
+
+def test_same_wrapper_per_path(manager):
+    modem = manager.modems[0]
+    assert manager.modems[0] is modem
+    assert manager.get_sim(modem.Sim) is manager.get_sim(modem.Sim)
+
+
+def test_unreferenced_wrapper_collected(backend, manager):
+    [path] = add_messages(backend, 1)
+    sms = manager.get_sms(path)
+    sms.connect_signal('PropertiesChanged', sms._on_properties_changed, sms.PROPERTIES_INTERFACE)
+    proxy = manager.get_object(path)
+    handlers = len(manager.signals)
+    ref = weakref.ref(sms)
+    del sms
+    gc.collect()
+    assert ref() is None
+    replacement = manager.get_sms(path)
+    assert len(manager.signals) < handlers
+    assert replacement._instance is not proxy
+
+
+def test_memory_flat_while_objects_come_and_go(backend, manager):
+    paths = add_messages(backend, 50)
+
+    def churn():
+        for path in paths:
+            sms = manager.get_sms(path)
+            sms.connect_signal('PropertiesChanged', sms._on_properties_changed, sms.PROPERTIES_INTERFACE)
+            assert sms.Text.startswith('message')
+        gc.collect()
+
+    churn()
+    handlers = len(manager.signals)
+    tracemalloc.start()
+    try:
+        churn()
+        before = tracemalloc.get_traced_memory()[0]
+        for _ in range(10):
+            churn()
+        growth = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    manager.get_sms(paths[0])
+    assert live_wrappers(SMS) <= 1
+    assert len(manager.signals) <= handlers
+    assert growth < 64 * 1024
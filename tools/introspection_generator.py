@@ -0,0 +1,52 @@
+import os
+import runpy
+import sys
+import xml.etree.ElementTree as ET
+
+KEEP = ('interface', 'method', 'signal', 'property', 'arg')
+
+if __name__ == '__main__':
+    # usage: introspection_generator.py <ModemManager version> [path to ModemManager/introspection]
+    version = sys.argv[1]
+    directory = sys.argv[2] if len(sys.argv) > 2 else './introspection'
+
+    interfaces = dict()
+    for name in sorted(os.listdir(directory)):
+        if not name.startswith('org.freedesktop.ModemManager1') or not name.endswith('.xml'):
+            continue
+        for interface in ET.parse(os.path.join(directory, name)).getroot().iter('interface'):
+            lines = [f'<interface name="{interface.attrib["name"]}">']
+            for member in interface:
+                if member.tag not in KEEP:
+                    continue
+                attrib = ' '.join(f'{k}="{v}"' for k, v in member.attrib.items() if k in ('name', 'type', 'access'))
+                args = [arg for arg in member if arg.tag == 'arg']
+                if not args:
+                    lines.append(f'  <{member.tag} {attrib}/>')
+                    continue
+                lines.append(f'  <{member.tag} {attrib}>')
+                for arg in args:
+                    arg_attrib = ' '.join(f'{k}="{v}"' for k, v in arg.attrib.items()
+                                          if k in ('name', 'type', 'direction'))
+                    lines.append(f'    <arg {arg_attrib}/>')
+                lines.append(f'  </{member.tag}>')
+            lines.append('</interface>')
+            interfaces[interface.attrib['name']] = '\n'.join(lines)
+
+    # keep the sets of other ModemManager versions already bundled
+    versions = dict()
+    if os.path.exists('MMIntrospectionData.py'):
+        versions.update(runpy.run_path('MMIntrospectionData.py')['INTROSPECTION'])
+    versions[version] = interfaces
+
+    result = 'INTROSPECTION = {\n'
+    for key in sorted(versions, key=lambda v: tuple(int(x) for x in v.split('.'))):
+        result += f"    '{key}': {{\n"
+        for name, xml in versions[key].items():
+            result += f"        '{name}': '''\n{xml}\n''',\n"
+        result += '    },\n'
+    result += '}\n'
+
+    f2 = open('MMIntrospectionData.py', 'w')
+    f2.write(result)
+    f2.close()